@@ -31,8 +31,8 @@ def main() -> None:
     GPIO.setmode(GPIO.BCM)
     GPIO.setwarnings(False)
 
-    # Configuration socket MPD
-    os.environ["MPD_HOST"] = "/run/mpd/socket"
+    # Configuration socket MPD (outils mpc lancés à la main)
+    os.environ["MPD_HOST"] = CONFIG["audio"]["mpd_socket"]
 
     # Déclaration explicite des variables avec type Optional
     i2c: Optional[I2C] = None
@@ -58,14 +58,29 @@ def main() -> None:
         rotary = RotaryEncoder(CONFIG["rotary"])
 
         # Composants logiciels
-        audio_manager = AudioManager(CONFIG["audio"]["music_dir"], [])
+        audio_manager = AudioManager(
+            CONFIG["audio"]["music_dir"],
+            [],
+            mpd_socket=CONFIG["audio"]["mpd_socket"],
+            library_db=CONFIG["audio"]["library_db"],
+            probe_interval=CONFIG["audio"]["probe_interval"],
+            probe_timeout=CONFIG["audio"]["probe_timeout"],
+            preroll_dir=CONFIG["alarm"]["preroll_dir"],
+            preroll_buffer_seconds=CONFIG["alarm"]["preroll_buffer_seconds"],
+            ramp_curve=CONFIG["alarm"]["ramp_curve"],
+            ramp_duration=CONFIG["alarm"]["ramp_duration"],
+            queue_window=CONFIG["audio"]["queue_window"],
+            stall_seconds=CONFIG["audio"]["stall_seconds"],
+            stall_reconnect_timeout=CONFIG["audio"]["stall_reconnect_timeout"],
+        )
         time_manager = Time(rtc)
-        alarm_manager = Alarms(rtc, buzzer, audio_manager)
+        alarm_manager = Alarms(rtc, buzzer, audio_manager, CONFIG["alarm"])
         menu_manager = MenuManager(display, time_manager, alarm_manager, audio_manager)
 
         # Liaisons croisées
         display.manager = menu_manager
-        audio_manager.webradio_stations = menu_manager.webradio_stations
+        audio_manager.set_webradio_stations(menu_manager.webradio_stations)
+        audio_manager.watchdog.on_recovered = menu_manager.on_stream_recovered
 
         # Coordinateur principal
         coordinator = Coordinator(
@@ -94,26 +109,29 @@ def main() -> None:
         logger.info("Nettoyage des ressources...")
         cleanup_start = time.time()
 
-        try:
-            # Audio en premier (critique si MPD actif)
-            if audio_manager is not None:
-                audio_manager.cleanup()
-
-            # Composants hardware (ordre non critique)
-            if display is not None:
-                display.clear()
-
-            if alarm_manager is not None:
-                alarm_manager.stop()
-
-            if buzzer is not None:
-                buzzer.cleanup()
-
-            if rotary is not None:
-                rotary.cleanup()
-
-        except Exception as e:
-            logger.warning(f"Erreur pendant cleanup: {e}")
+        # Étapes indépendantes : un échec n'empêche pas les suivantes
+        cleanup_steps = []
+        if alarm_manager is not None:
+            # Alarme avant l'audio : son arrêt soumet encore au worker audio
+            cleanup_steps.append(("alarme", alarm_manager.stop))
+        if audio_manager is not None:
+            cleanup_steps.append(("audio", audio_manager.cleanup))
+        if display is not None:
+            # Écran après l'alarme (dont l'arrêt publie un rendu) : effacement
+            # puis arrêt du thread de rendu une fois la trame envoyée
+            cleanup_steps.append(("écran", display.clear))
+            cleanup_steps.append(("rendu", display.stop))
+        # Composants hardware (ordre non critique)
+        if buzzer is not None:
+            cleanup_steps.append(("buzzer", buzzer.cleanup))
+        if rotary is not None:
+            cleanup_steps.append(("rotary", rotary.cleanup))
+
+        for name, step in cleanup_steps:
+            try:
+                step()
+            except Exception as e:
+                logger.warning(f"Erreur pendant cleanup ({name}): {e}")
 
         # Cleanup I2C/GPIO toujours exécuté
         try:
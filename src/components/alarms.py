@@ -4,6 +4,7 @@ import logging
 from typing import Dict, Optional, TYPE_CHECKING
 from src.components.rtc import RTC
 from src.components.buzzer import Buzzer
+from src.components.startup_latency import StartupLatency
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +15,19 @@ if TYPE_CHECKING:
 class Alarms:
     """Gère les événements d'alarme du réveil avec logique one-shot."""
 
-    def __init__(self, rtc: RTC, buzzer: Buzzer, audio_manager):
+    def __init__(self, rtc: RTC, buzzer: Buzzer, audio_manager, config: dict):
         self.rtc = rtc
         self.buzzer = buzzer
         self.audio_manager = audio_manager
+        self.prearm_seconds: float = config["prearm_seconds"]
+        self.hedge_deadline: float = config["hedge_deadline"]
+        self.audible_deadline: float = config["audible_deadline"]
+        self.preroll_seconds: float = config["preroll_seconds"]
+        self.ramp_start_volume: float = config["ramp_start_volume"]
+        # Latences trigger → son mesurées : avance au déclenchement
+        self.latency = StartupLatency(
+            config["latency_file"], max_lead=config["max_lead_seconds"]
+        )
         self.menu_manager: Optional[MenuManager] = None
 
         self.alarm_states = {
@@ -43,7 +53,7 @@ class Alarms:
             2: None,
         }  # Cache timestamps déclenchement alarmes
 
-        # One-shot tracking par minute exacte
+        # One-shot tracking par heure visée ("HH:MM" de l'alarme)
         self.triggered_times: dict[int, Optional[str]] = {1: None, 2: None}
         self.alarm_screen_start: dict[int, Optional[float]] = {1: None, 2: None}
 
@@ -59,9 +69,12 @@ class Alarms:
         self.last_stop_time: float = 0
         self.stop_cooldown: int = 60
 
-        # Volume alarme progressif (60% → 80% → 100% sur 1min)
-        self.volume_ramp_start: dict[int, Optional[float]] = {1: None, 2: None}
-        self.volume_ramp_active: dict[int, bool] = {1: False, 2: False}
+        # Pré-armement audio (un seul à la fois : MPD n'a qu'une file)
+        self.prearm_alarm: Optional[int] = None
+        self.prearm_time: Optional[str] = None  # "HH:MM" visé
+        # Pré-roll (enregistrement du flux webradio avant l'alarme)
+        self.preroll_alarm: Optional[int] = None
+        self.preroll_key: Optional[tuple] = None  # ("HH:MM", station_index)
         self._load_alarms()
 
     def _load_alarms(self) -> None:
@@ -111,82 +124,66 @@ class Alarms:
             if self.menu_manager:
                 self.menu_manager._render()
 
-    def check_alarms(self, current_time: str) -> None:
+    def check_alarms(self, current_time: str, seconds: int = 0) -> None:
         """
-        Vérifie si alarme due et déclenche (one-shot garanti par minute).
+        Vérifie si alarme due et déclenche (one-shot garanti par alarme).
+        Déclenchement anticipé de la latence de démarrage estimée du mode,
+        pour que le son tombe sur la minute configurée.
+
+        Args:
+            current_time: Heure "HH:MM"
+            seconds: Secondes RTC (résolution du déclenchement anticipé)
         """
         self._check_buzzer_timeout()
 
-        # 🎚️ RAMP VOLUME (inchangé mais expliqué)
-        if self.is_alarm_active and self.active_alarm:
-            alarm_num = self.active_alarm
-            start_time = self.alarm_start_time.get(alarm_num)
-
-            if (
-                self.volume_ramp_active[alarm_num]
-                and self.active_alarm_mode in ["sd", "webradio"]
-                and start_time is not None
-            ):
-                elapsed = time.time() - start_time
-
-                if elapsed >= 60.0:  # Étape 3: 100%
-                    self.audio_manager.set_volume(1.0)
-                    self.volume_ramp_active[alarm_num] = False
-                    logger.info(f"[RAMP] A{alarm_num} → 100% (60s)")
-                elif elapsed >= 30.0:  # Étape 2: 80%
-                    if not hasattr(self, "_last_ramp_volume"):
-                        self._last_ramp_volume = {}
-                    if self._last_ramp_volume.get(alarm_num) != 0.8:
-                        self.audio_manager.set_volume(0.8)
-                        self._last_ramp_volume[alarm_num] = 0.8
-                        logger.info(f"[RAMP] A{alarm_num} → 80% (30s)")
-
         # ⚠️ CORRECTION 1 : Ne check rien si alarme déjà active
         # (Une seule alarme à la fois, priorité = première déclenchée)
         if self.is_alarm_active:
             return
 
         current_hour, current_minute = map(int, current_time.split(":"))
+        now = current_hour * 3600 + current_minute * 60 + seconds
         current_dow = self.rtc.read_dow()
 
         # ✅ CORRECTION 2 : Liste alarmes déclenchées AVANT traitement
         alarms_to_trigger = []
+        due_alarms = set()
 
         for alarm_num, state in self.alarm_states.items():
             if not state["enabled"]:
                 continue
 
-            # Match heure/minute
-            if state["hour"] == current_hour and state["minute"] == current_minute:
-                # ONE-SHOT : Évite re-déclenchement dans même minute
-                if current_time == self.triggered_times.get(alarm_num):
-                    continue
-
-                # Check fréquence
-                freq = state["frequency"]
-                trigger = False
+            # Fenêtre due : [cible - avance, fin de la minute cible]
+            until = self._seconds_until(state, now)
+            if until > self._lead(state) and until <= 86400 - 60:
+                continue
+            due_alarms.add(alarm_num)
 
-                if freq == "T":
-                    trigger = True
-                elif freq == "S" and 2 <= current_dow <= 6:
-                    trigger = True
-                elif freq == "WE" and current_dow in [1, 7]:
-                    trigger = True
+            # ONE-SHOT : Évite re-déclenchement dans la fenêtre
+            if self._target_time(state) == self.triggered_times.get(alarm_num):
+                continue
 
-                if trigger:
-                    alarms_to_trigger.append(alarm_num)
+            # Check fréquence (jour de la cible : anticipation sur minuit)
+            target = self._target_seconds(state)
+            fire_dow = current_dow % 7 + 1 if target + 60 <= now else current_dow
+            if self._frequency_matches(state["frequency"], fire_dow):
+                alarms_to_trigger.append(alarm_num)
 
         # ✅ CORRECTION 3 : Déclenche la PREMIÈRE alarme uniquement (priorité)
         if alarms_to_trigger:
             alarm_num = alarms_to_trigger[0]  # Priorité A1 si simultané
             state = self.alarm_states[alarm_num]
 
-            print(f"[ALARM] Déclenchement A{alarm_num} à {current_time}")
+            lead = self._lead(state)
+            print(
+                f"[ALARM] Déclenchement A{alarm_num} à {current_time}:{seconds:02d} "
+                f"(cible {self._target_time(state)}, avance {lead:.1f}s)"
+            )
             if len(alarms_to_trigger) > 1:
                 print(f"[ALARM] ⚠️ A{alarms_to_trigger[1]} ignorée (alarme active)")
 
             # Marque comme déclenchée (one-shot)
-            self.triggered_times[alarm_num] = current_time
+            self.triggered_times[alarm_num] = self._target_time(state)
             self.active_alarm = alarm_num
             self.is_alarm_active = True
             self.alarm_start_time[alarm_num] = time.time()
@@ -196,156 +193,337 @@ class Alarms:
                 self.alarm_screen_start[alarm_num] = time.time()
 
             self.active_alarm_mode = state.get("mode", "buzzer")
-            if self.active_alarm_mode in ["sd", "webradio"]:
-                if not self.audio_manager.ensure_mpd_available():
-                    logger.warning(
-                        f"[ALARM] MPD down au trigger A{alarm_num} → Fallback buzzer"
-                    )
-                    self.active_alarm_mode = "buzzer"
-                    self.start_buzzer()
-                    return
-            success = False
 
-            # Volume 60% avant play (SD/Webradio uniquement)
-            if state.get("mode") in ["sd", "webradio"]:
-                self.audio_manager.set_volume(0.6)
-                logger.info(f"[ALARM] A{alarm_num} volume init → 60%")
+            # Consomme le pré-armement s'il concerne cette alarme
+            prearmed = self.prearm_alarm == alarm_num
+            self.prearm_alarm = None
+            self.prearm_time = None
+            # Pré-roll consommé au démarrage (enregistrement arrêté sur le worker)
+            self.preroll_alarm = None
+            self.preroll_key = None
 
             # ===== DÉCLENCHEMENT SELON MODE =====
-            if self.active_alarm_mode == "webradio":
-                index = state.get("station_index", 0)
-                success = self.audio_manager.play_webradio_station(index)
-
-                if success:
-                    time.sleep(2.0)
-                    if self.menu_manager:
-                        self.menu_manager.music_source = "webradio"
-                        self.menu_manager.current_station_name = (
-                            self.menu_manager.webradio_stations[index]["name"]
-                        )
-                        self.menu_manager.music_start_time = time.time()
-                        self.music_playing = True
-                else:
-                    # Fallback SD
-                    print("[ALARM] Webradio échec -> Fallback SD")
-                    time.sleep(2.0)
-                    self.active_alarm_mode = "sd"
-                    success = self.audio_manager.play_random_music()
-
-                    if success and self.menu_manager:
-                        self.menu_manager.music_source = "sd"
-                        self.music_playing = True
-
-            elif self.active_alarm_mode == "sd":
-                success = self.audio_manager.play_random_music()
-                if success and self.menu_manager:
-                    self.menu_manager.music_source = "sd"
-                    self.menu_manager.music_start_time = time.time()
-                    self.music_playing = True
-
-            # Fallback buzzer si tout échoue
-            if not success:
+            if self.active_alarm_mode in ["sd", "webradio"]:
+                # Démarrage audio sur le worker : la boucle principale continue
+                # (horloge, rotary, rendu) pendant le buffer réseau / fallbacks
+                self.audio_manager.submit(
+                    self._activate_alarm_playback,
+                    alarm_num,
+                    dict(state),
+                    time.monotonic(),
+                    prearmed,
+                    on_done=lambda mode, num=alarm_num: self._on_alarm_playback(
+                        num, mode
+                    ),
+                )
+            else:
+                # Buzzer GPIO immédiat : aucune latence à mesurer (avance nulle)
                 print("[ALARM] Fallback buzzer")
-                self.active_alarm_mode = "buzzer"
                 self.start_buzzer()
 
-            # Init ramp volume si musique lancée
-            if success and self.active_alarm_mode in ["sd", "webradio"]:
-                self.volume_ramp_active[alarm_num] = True
-
             # Render final
             if self.menu_manager:
                 self.menu_manager._render()
+        else:
+            # Pas de déclenchement : pré-roll / pré-armement si alarme proche
+            self._check_preroll(now, current_dow)
+            self._check_prearm(now, current_dow)
 
         # ✅ CORRECTION 4 : Reset triggered_times APRÈS traitement
         # (Évite race condition entre reset et check A2)
         for alarm_num in [1, 2]:
             if (
                 self.triggered_times[alarm_num] is not None
-                and self.triggered_times[alarm_num] != current_time
+                and alarm_num not in due_alarms
             ):
                 self.triggered_times[alarm_num] = None
 
-    def _activate_alarm_playback(self, alarm_num: int, state: dict) -> bool:
+    @staticmethod
+    def _target_seconds(state: dict) -> int:
+        """Heure de l'alarme en secondes depuis minuit."""
+        return state["hour"] * 3600 + state["minute"] * 60
+
+    def _seconds_until(self, state: dict, now: int) -> int:
+        """Secondes avant la prochaine occurrence (0 = pile à l'heure)."""
+        return (self._target_seconds(state) - now) % 86400
+
+    @staticmethod
+    def _target_time(state: dict) -> str:
+        return f"{state['hour']:02d}:{state['minute']:02d}"
+
+    def _lead(self, state: dict) -> float:
+        """Avance au déclenchement = latence estimée du mode configuré."""
+        return self.latency.estimate(state.get("mode") or "buzzer")
+
+    @staticmethod
+    def _frequency_matches(frequency: str, dow: int) -> bool:
+        """Fréquence T (tous les jours), S (semaine) ou WE (week-end)."""
+        if frequency == "T":
+            return True
+        if frequency == "S":
+            return 2 <= dow <= 6
+        if frequency == "WE":
+            return dow in [1, 7]
+        return False
+
+    def _upcoming_alarms(self, now: int, dow: int, window: float, modes: list) -> list:
+        """
+        Alarmes actives des `modes` dont le déclenchement anticipé tombe
+        dans les `window` prochaines secondes : [(secondes restantes, num)].
+        """
+        candidates = []
+        for alarm_num, state in self.alarm_states.items():
+            if not state["enabled"] or state.get("mode") not in modes:
+                continue
+            # Secondes avant le déclenchement anticipé
+            until = self._seconds_until(state, now) - self._lead(state)
+            if until <= 0 or until > window:
+                continue
+            target = self._target_seconds(state)
+            fire_dow = dow if target > now else dow % 7 + 1  # Alarme le lendemain
+            if self._frequency_matches(state["frequency"], fire_dow):
+                candidates.append((until, alarm_num))
+        return candidates
+
+    def _check_preroll(self, now: int, dow: int) -> None:
+        """
+        Enregistre en RAM la station de la prochaine alarme webradio
+        `preroll_seconds` avant son déclenchement (rejouée en local au
+        démarrage), et arrête un enregistrement devenu caduc.
+        """
+        if self.preroll_seconds <= 0:
+            return
+        candidates = self._upcoming_alarms(
+            now, dow, self.preroll_seconds, ["webradio"]
+        )
+        if self.preroll_alarm is not None:
+            state = self.alarm_states[self.preroll_alarm]
+            still_valid = (
+                self._target_time(state),
+                state.get("station_index") or 0,
+            ) == self.preroll_key and any(
+                num == self.preroll_alarm for _, num in candidates
+            )
+            if still_valid:
+                return
+            # Alarme déclenchée, désactivée ou modifiée : tampon conservé
+            # pour le démarrage en cours, enregistrement arrêté
+            self.preroll_alarm = None
+            self.preroll_key = None
+            self.audio_manager.stop_preroll()
+
+        if not candidates:
+            return
+        _, alarm_num = min(candidates)
+        state = self.alarm_states[alarm_num]
+        index = self.audio_manager.prober.next_alive(state.get("station_index") or 0)
+        self.preroll_alarm = alarm_num
+        self.preroll_key = (self._target_time(state), state.get("station_index") or 0)
+        if index is None:
+            return  # Toutes les stations HS : l'alarme partira sur SD
+        logger.info(f"[ALARM] Pré-roll A{alarm_num} ({self.preroll_key[0]})")
+        self.audio_manager.start_preroll(index)
+
+    def _check_prearm(self, now: int, dow: int) -> None:
+        """
+        Lance le pré-armement audio `prearm_seconds` avant le déclenchement
+        (anticipé) de la prochaine alarme musicale, et annule un
+        pré-armement devenu caduc (alarme désactivée, modifiée ou passée).
+        """
+        candidates = self._upcoming_alarms(
+            now, dow, self.prearm_seconds, ["sd", "webradio"]
+        )
+
+        # Pré-armement caduc → libère MPD
+        if self.prearm_alarm is not None:
+            state = self.alarm_states[self.prearm_alarm]
+            still_valid = self._target_time(state) == self.prearm_time and any(
+                num == self.prearm_alarm for _, num in candidates
+            )
+            if still_valid:
+                return
+            logger.info(f"[ALARM] Pré-armement A{self.prearm_alarm} caduc → annulé")
+            self.prearm_alarm = None
+            self.prearm_time = None
+            self.audio_manager.submit(self.audio_manager.cancel_prearm)
+
+        # Ne jamais interrompre une lecture en cours
+        if not candidates or self.audio_manager.music_playing:
+            return
+
+        _, alarm_num = min(candidates)
+        state = self.alarm_states[alarm_num]
+        self.prearm_alarm = alarm_num
+        self.prearm_time = self._target_time(state)
+        logger.info(f"[ALARM] Pré-armement A{alarm_num} ({self.prearm_time})")
+        mode, station_index = state["mode"], state.get("station_index") or 0
+        if mode == "webradio":
+            # Station connue HS (sonde) → suivante vivante, ou SD directe
+            resolved = self.audio_manager.resolve_alarm_station(station_index)
+            mode = "webradio" if resolved is not None else "sd"
+            station_index = resolved or 0
+        self.audio_manager.submit(
+            self.audio_manager.prearm,
+            mode,
+            station_index,
+            self.ramp_start_volume,
+            on_done=lambda ok, num=alarm_num: logger.log(
+                logging.INFO if ok else logging.WARNING,
+                f"[ALARM] Pré-armement A{num} {'prêt' if ok else 'échoué'}",
+            ),
+        )
+
+    def _activate_alarm_playback(
+        self,
+        alarm_num: int,
+        state: dict,
+        trigger_time: float,
+        prearmed: bool,
+    ) -> Optional[str]:
         """
-        Active la lecture d'alarme selon le mode configuré.
-        Gère fallbacks automatiques: webradio → SD → buzzer.
+        Lance la lecture d'alarme selon le mode configuré (thread worker audio).
+        Le son doit être confirmé (elapsed qui avance, débit non nul, sortie
+        active) avant `audible_deadline` après le déclenchement :
+        webradio muette sous `hedge_deadline` → SD (pré-chargée ou à froid),
+        toujours rien à l'échéance → buzzer.
 
         Args:
             alarm_num: Numéro alarme (1 ou 2)
-            state: Dict d'état de l'alarme
+            state: Copie du dict d'état de l'alarme
+            trigger_time: time.monotonic() du déclenchement (mesure latence)
+            prearmed: True si le pré-armement concernait cette alarme
 
         Returns:
-            True si succès (musique ou buzzer actif)
+            Mode effectivement joué ("webradio"/"sd"), None → buzzer
         """
         mode = state.get("mode", "buzzer")
 
-        # Vérif MPD si mode musical
-        if mode in ["sd", "webradio"]:
-            if not self.audio_manager.ensure_mpd_available():
+        # === PRÉ-ARMÉ : file + buffer + volume déjà prêts, un seul "play" ===
+        # (pré-armement webradio déjà replié sur SD accepté tel quel)
+        prearmed_mode = self.audio_manager.prearmed_mode
+        if (
+            prearmed
+            and prearmed_mode in [mode, "sd"]
+            and self.audio_manager.start_prearmed()
+        ):
+            played, path = prearmed_mode, "pré-armé"
+        else:
+            played, path = self._start_alarm_playback(alarm_num, state), "à froid"
+        # Tampon pré-roll déjà copié dans la file (snapshot) : plus de seconde
+        # connexion au flux ni d'écriture en RAM pendant l'alarme
+        self.audio_manager.stop_preroll()
+        if played is None:
+            return None
+
+        # === CONFIRMATION DU SON : escalade bornée par audible_deadline ===
+        deadline = trigger_time + self.audible_deadline
+        first_wait = self._remaining(deadline)
+        if played == "webradio":
+            first_wait = min(first_wait, self.hedge_deadline)
+        heard_at = self.audio_manager.wait_audible(timeout=first_wait)
+        if heard_at is None and played == "webradio":
+            # Source suivante : SD pré-chargée derrière le flux, sinon à froid
+            fallback = "pré-chargée"
+            if not self.audio_manager.hedge_to_sd():
+                fallback = "à froid"
+                if not self.audio_manager.play_random_music():
+                    fallback = None
+            if fallback is not None:
                 logger.warning(
-                    f"[ALARM] MPD down au trigger A{alarm_num} → Fallback buzzer direct"
+                    f"[ALARM] A{alarm_num} webradio muette après "
+                    f"{first_wait:.1f}s → SD {fallback}"
+                )
+                played = "sd"
+                heard_at = self.audio_manager.wait_audible(
+                    timeout=self._remaining(deadline)
                 )
-                self._activate_buzzer_mode()
-                return True  # Buzzer = succès
 
-        # === WEBRADIO ===
-        if mode == "webradio":
-            index = state.get("station_index", 0)
-            self.active_alarm_mode = "webradio"
+        if heard_at is None:
+            logger.warning(
+                f"[ALARM] A{alarm_num} {played} : aucun son confirmé "
+                f"{self.audible_deadline:.0f}s après le déclenchement → buzzer"
+            )
+            self.audio_manager.stop()
+            return None
+        latency = heard_at - trigger_time
+        logger.info(
+            f"[ALARM] A{alarm_num} latence trigger→son {latency:.2f}s "
+            f"({played}, {path})"
+        )
+        # Historique du mode configuré (repli SD inclus, buzzer exclu)
+        self.latency.record(mode, latency)
+        return played
 
-            # Volume init 60%
-            self.audio_manager.set_volume(0.6)
-            logger.info(f"[ALARM] A{alarm_num} volume init → 60%")
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        """Temps restant avant l'échéance (plancher : un contrôle de son)."""
+        return max(deadline - time.monotonic(), 0.5)
 
-            success = self.audio_manager.play_webradio_station(index)
+    def _start_alarm_playback(self, alarm_num: int, state: dict) -> Optional[str]:
+        """Démarrage complet sans pré-armement (santé, volume, file, play)."""
+        mode = state.get("mode", "buzzer")
 
-            if success:
-                time.sleep(2.0)  # Buffer réseau
-                # ✅ Sync état complet
-                if self.menu_manager:
-                    self.menu_manager.music_source = "webradio"
-                    self.menu_manager.current_station_name = (
-                        self.menu_manager.webradio_stations[index]["name"]
-                    )
-                    self.menu_manager.music_start_time = time.time()
-                self.music_playing = True
-                self.volume_ramp_active[alarm_num] = True
-                logger.info(f"[ALARM] A{alarm_num} webradio OK")
-                return True
-            else:
-                # Fallback SD
-                logger.warning(f"[ALARM] A{alarm_num} webradio échec → Fallback SD")
-                time.sleep(2.0)
-                mode = "sd"  # Continue vers SD
+        # Vérif MPD si mode musical (état superviseur, attente bornée)
+        if not self.audio_manager.ensure_mpd_available(timeout=5.0):
+            logger.warning(
+                f"[ALARM] MPD down au trigger A{alarm_num} → Fallback buzzer direct"
+            )
+            return None
+
+        # Volume initial de la rampe avant play
+        self.audio_manager.set_volume(self.ramp_start_volume)
+        logger.info(
+            f"[ALARM] A{alarm_num} volume init → {self.ramp_start_volume * 100:.0f}%"
+        )
+
+        # === WEBRADIO (file hedgée : flux + SD, son vérifié par l'appelant) ===
+        if mode == "webradio":
+            # Stations connues HS (sonde) sautées ; toutes HS → SD directe
+            index = self.audio_manager.resolve_alarm_station(
+                state.get("station_index") or 0
+            )
+            if index is not None and self.audio_manager.start_webradio_hedged(index):
+                logger.info(f"[ALARM] A{alarm_num} webradio lancée")
+                return "webradio"
+            # Fallback SD
+            logger.warning(f"[ALARM] A{alarm_num} webradio échec → Fallback SD")
 
         # === SD (direct ou fallback) ===
-        if mode == "sd":
-            self.active_alarm_mode = "sd"
-
-            # Volume init 60%
-            self.audio_manager.set_volume(0.6)
-            logger.info(f"[ALARM] A{alarm_num} volume init → 60%")
-
-            success = self.audio_manager.play_random_music()
-
-            if success:
-                # ✅ Sync état complet (MÊME EN FALLBACK)
-                if self.menu_manager:
-                    self.menu_manager.music_source = "sd"
-                    self.menu_manager.music_start_time = time.time()
-                self.music_playing = True
-                self.volume_ramp_active[alarm_num] = True
-                logger.info(f"[ALARM] A{alarm_num} SD OK")
-                return True
-            else:
-                # Fallback buzzer
-                logger.warning(f"[ALARM] A{alarm_num} SD échec → Fallback buzzer")
+        if self.audio_manager.play_random_music():
+            logger.info(f"[ALARM] A{alarm_num} SD OK")
+            return "sd"
+        logger.warning(f"[ALARM] A{alarm_num} SD échec → Fallback buzzer")
+        return None
+
+    def _on_alarm_playback(self, alarm_num: int, mode: Optional[str]) -> None:
+        """Résultat du démarrage audio (boucle principale, via worker)."""
+        if not self.is_alarm_active or self.active_alarm != alarm_num:
+            # Alarme arrêtée pendant le chargement → coupe le son lancé
+            if mode is not None:
+                self.audio_manager.submit(self.audio_manager.stop)
+            return
 
-        # === BUZZER (direct ou fallback final) ===
-        self._activate_buzzer_mode()
-        logger.info(f"[ALARM] A{alarm_num} buzzer actif")
-        return True
+        if mode is None:
+            # === BUZZER (fallback final) ===
+            print("[ALARM] Fallback buzzer")
+            self.start_buzzer()
+        else:
+            # ✅ Sync état complet (MÊME EN FALLBACK)
+            self.active_alarm_mode = mode
+            if self.menu_manager:
+                self.menu_manager.music_source = mode
+                if mode == "webradio":
+                    # Station réellement jouée (station HS remplacée par la sonde)
+                    self.menu_manager.current_station_name = (
+                        self.audio_manager.current_station_name
+                    )
+                self.menu_manager.music_start_time = time.time()
+            self.music_playing = True
+            # Rampe de volume continue (thread dédié) une fois le son lancé
+            self.audio_manager.ramp.start(self.ramp_start_volume, 1.0)
+
+        if self.menu_manager:
+            self.menu_manager._render()
 
     def _activate_buzzer_mode(self) -> None:
         """Active le mode buzzer (helper pour fallback)."""
@@ -367,11 +545,12 @@ class Alarms:
         if not self.is_alarm_active:
             return
 
-        print(f"[ALARM] Arrêt A{self.active_alarm}")
+        alarm_num = self.active_alarm
+        print(f"[ALARM] Arrêt A{alarm_num}")
 
-        # Stop audio/buzzer
+        # Stop audio (worker, avant le reset volume ci-dessous) / buzzer
         if self.active_alarm_mode in ["sd", "webradio"]:
-            self.audio_manager.stop()
+            self.audio_manager.submit(self.audio_manager.stop)
         elif self.active_alarm_mode == "buzzer":
             self.buzzer.stop()
 
@@ -390,16 +569,12 @@ class Alarms:
 
         self.music_playing = False
 
-        # Reset cache volume
-        if hasattr(self, "_last_ramp_volume") and self.active_alarm:
-            self._last_ramp_volume.pop(self.active_alarm, None)
-
-        # Reset ramp volume à 100% (session normale)
-        if self.active_alarm:
-            self.audio_manager.set_volume(1.0)
-            logger.info(
-                f"[ALARM] Reset volume MPD → 100% après arrêt A{self.active_alarm}"
-            )
+        # Rampe stoppée + volume 100% (session normale) ; alarme lue avant
+        # le reset des flags (sinon le reset volume n'était jamais fait)
+        self.audio_manager.ramp.cancel()
+        if alarm_num is not None:
+            self.audio_manager.submit(self.audio_manager.set_volume, 1.0)
+            logger.info(f"[ALARM] Reset volume MPD → 100% après arrêt A{alarm_num}")
 
         # Render non-bloquant
         try:
@@ -0,0 +1,78 @@
+import queue
+import threading
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AudioWorker:
+    """
+    Exécute les commandes audio bloquantes (buffer webradio, préparation MPD,
+    rescan...) sur un thread dédié, dans l'ordre de soumission.
+    Les callbacks `on_done` sont rejoués sur le thread qui appelle poll()
+    (boucle principale) : l'état UI n'est jamais modifié depuis le worker.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+        self._done: "queue.Queue[tuple]" = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._closed = False  # Après shutdown() : commandes ignorées
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        on_done: Optional[Callable[[Any], None]] = None,
+        **kwargs,
+    ) -> Optional[Future]:
+        """
+        Planifie fn(*args) ; on_done(résultat) appelé au prochain poll().
+        Worker arrêté (sortie du programme) : commande ignorée, None.
+        """
+        with self._lock:
+            if self._closed:
+                logger.warning(
+                    f"[AUDIO] Worker arrêté, commande ignorée: "
+                    f"{getattr(fn, '__name__', fn)}"
+                )
+                return None
+            self._pending += 1
+            future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self._done.put((f, on_done)))
+        return future
+
+    @property
+    def busy(self) -> bool:
+        """True tant qu'une commande n'a pas été traitée par poll()."""
+        return self._pending > 0
+
+    def poll(self) -> bool:
+        """Traite les résultats disponibles (non bloquant). True si au moins un."""
+        handled = False
+        while True:
+            try:
+                future, on_done = self._done.get_nowait()
+            except queue.Empty:
+                return handled
+            with self._lock:
+                self._pending -= 1
+            handled = True
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"[AUDIO] Erreur commande worker: {e}", exc_info=True)
+                result = None
+            if on_done is not None:
+                try:
+                    on_done(result)
+                except Exception as e:
+                    logger.error(f"[AUDIO] Erreur callback worker: {e}", exc_info=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False)
@@ -1,4 +1,4 @@
-import subprocess
+from src.components.mpd_client import MPDError
 
 
 class MusicControls:
@@ -6,41 +6,36 @@ class MusicControls:
 
     def __init__(self, audio_manager):
         self.audio_manager = audio_manager  # Pour stop intégré
+        self.mpd = audio_manager.mpd  # Connexion MPD partagée (pas de fork mpc)
 
     def next_track(self) -> bool:
         """Passe au morceau suivant ; retourne True si succès."""
         try:
-            result = subprocess.run(
-                ["mpc", "next"], capture_output=True, check=True, text=True
-            )
-            return result.returncode == 0
-        except subprocess.CalledProcessError:
+            self.mpd.command("next")
+            return True
+        except MPDError:
             return False
 
     def prev_track(self) -> bool:
         """Passe au morceau précédent ; retourne True si succès."""
         try:
-            result = subprocess.run(
-                ["mpc", "prev"], capture_output=True, check=True, text=True
-            )
-            return result.returncode == 0
-        except subprocess.CalledProcessError:
+            self.mpd.command("previous")
+            return True
+        except MPDError:
             return False
 
     def pause_toggle(self) -> bool:
         """Toggle lecture/pause avec état explicite."""
         try:
             # Lit l'état actuel
-            status = subprocess.check_output(["mpc", "status"]).decode()
+            state = self.mpd.status().get("state")
 
-            if "[playing]" in status:
-                cmd = ["mpc", "pause"]  # Met en pause
+            if state == "play":
+                self.mpd.command("pause", 1)  # Met en pause
             else:
-                cmd = ["mpc", "play"]  # Reprend
-
-            subprocess.run(cmd, capture_output=True, check=True)
+                self.mpd.command("play")  # Reprend
             return True
-        except subprocess.CalledProcessError:
+        except MPDError:
             return False
 
     def stop(self) -> None:
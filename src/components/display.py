@@ -1,39 +1,103 @@
-from typing import Optional, TYPE_CHECKING
-from luma.core.interface.serial import i2c as luma_i2c
-from luma.core.render import canvas
-from luma.oled.device import sh1106
-from PIL import ImageFont
-from src.components.i2c import I2C
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+from PIL import Image, ImageDraw, ImageFont
+from src.components.display_backends import MemoryDevice, PngDevice
+from src.components.frame_scheduler import FrameScheduler
+from src.components.framebuffer import FrameBuffer
+from src.components.glyph_atlas import GlyphAtlas
+import logging
+import os
+import threading
 import time
 
 if TYPE_CHECKING:
+    from src.components.i2c import I2C
     from src.components.menu.menu_manager import MenuManager
 
+logger = logging.getLogger(__name__)
+
+# État d'écran publié : (nom de l'écran, arguments, arguments nommés)
+Frame = Tuple[str, tuple, Dict[str, Any]]
+
 
 class Display:
-    """Gère l'affichage sur l'OLED SH1106."""
+    """
+    Gère l'affichage sur l'OLED SH1106.
+    Écran choisi par config["device"] : "sh1106" (luma, I2C), "memory"
+    (GDDRAM simulée) ou "png" (idem + une image par trame dans png_dir).
+    Les méthodes show_* publient un état d'écran immuable dans une boîte
+    aux lettres à une place (le plus récent remplace celui pas encore
+    affiché) ; seul le thread de rendu dessine et parle au bus I2C.
+    """
+
+    LAYOUT_CACHE_SIZE = 256  # Mises en page mémorisées (LRU)
+    PROGRESS_BAR_WIDTH = 124  # Barre du lecteur : largeur totale - marges
 
-    def __init__(self, i2c: I2C, config: dict):
+    def __init__(self, i2c: Optional["I2C"], config: dict):
         self.i2c = i2c
         self.address = config["display_address"]  # Adresse I2C de l'écran
+        self.device_type = config.get("device", "sh1106")
+        self.png_dir = config.get("png_dir", "/tmp/reveil-display")
         self.serial = None
         self.device = None
         self.font_path = config["font_path"]
         self.font_sizes = config["font_sizes"]
         self._fonts_cache = {}
+        # Glyphes pré-rastérisés (persistés : démarrage sans rendu FreeType)
+        self.glyph_cache_dir = config.get("glyph_cache_dir")
+        self._atlases_cache = {}
+        # Mises en page (texte, police) → largeurs, lignes, positions (LRU)
+        self._layouts: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # Calques des écrans heure/lecteur : nom → (entrées, origine, bitmap)
+        self._layers: Dict[str, Tuple[tuple, Tuple[int, int], Any]] = {}
         self.i2c_delay = config.get(
             "i2c_delay", 0.02
         )  # Délai par défaut pour la stabilité I2C
-        self.last_update = 0  # Dernier timestamp de mise à jour
-        self.update_interval = (
-            0.3  # Intervalle minimum entre les mises à jour (secondes)
-        )
+        self.last_update = 0.0  # time.monotonic() de la dernière trame dessinée
+        # Cadence des trames (demandes, échéances, espacement minimal)
+        self.scheduler = FrameScheduler(config)
         self.blink_interval = config["blink_interval"]  # Intervalle de clignotement
         self.is_on = True  # État initial de l'écran (allumé)
         self.manager: Optional["MenuManager"] = (
             None  # Référence au gestionnaire de menu
         )
+        # Dernière trame transmise, en pages SH1106 (8 × 128 octets) :
+        # seules les colonnes modifiées repassent sur le bus I2C
+        self._last_pages: Optional[List[bytes]] = None
+        self.bytes_sent = 0  # Octets de données envoyés à l'écran (cumul)
+        self.frames_sent = 0  # Trames ayant modifié au moins une page
+        # Rendu : "pil" (image neuve par trame) ou "numpy" (trame persistante
+        # au format pages SH1106, sans allocation ni conversion par trame)
+        self.renderer = config.get("renderer", "pil")
+        self._framebuffer: Optional[FrameBuffer] = None
+        if self.renderer == "numpy":
+            try:
+                self._framebuffer = FrameBuffer()
+            except RuntimeError as e:
+                logger.warning(f"[DISPLAY] Rendu NumPy impossible ({e}) → PIL")
+                self.renderer = "pil"
+        # Boîte aux lettres du thread de rendu (une place, dernier état gagnant)
+        self._mailbox: Optional[Frame] = None
+        self._mailbox_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._idle_event = threading.Event()  # Rien en attente de rendu
+        self._idle_event.set()
+        self._stopping = False
+        self._device_on = False  # État réel de l'écran (is_on : état demandé)
+        self._thread: Optional[threading.Thread] = None
         self._init_oled()  # Initialise l'écran OLED
+        self.start()
 
     def _init_oled(self) -> None:
         """Initialise ou réinitialise l'OLED."""
@@ -43,9 +107,20 @@ class Display:
         except (AttributeError, OSError):
             pass  # Ignore les erreurs si l'interface n'est pas initialisée
         try:
-            self.serial = luma_i2c(port=self.i2c.port, address=self.address)
-            self.device = sh1106(self.serial)
+            self._last_pages = None  # Contenu écran inconnu → trame complète
+            if self.device_type == "memory":
+                self.device = MemoryDevice()
+            elif self.device_type == "png":
+                self.device = PngDevice(self.png_dir)
+            else:
+                # luma importé seulement pour l'écran réel (sans écran : inutile)
+                from luma.core.interface.serial import i2c as luma_i2c
+                from luma.oled.device import sh1106
+
+                self.serial = luma_i2c(port=self.i2c.port, address=self.address)
+                self.device = sh1106(self.serial)
             self.device.show()  # Allume l'écran par défaut
+            self._device_on = True
         except OSError:
             self.device = None  # Marque l'écran comme non disponible
 
@@ -57,35 +132,303 @@ class Display:
                 self._fonts_cache[name] = ImageFont.truetype(self.font_path, size)
         return self._fonts_cache
 
+    @property
+    def atlases(self) -> dict:
+        """Atlas de glyphes par nom de police (un seul par taille, lazy)."""
+        if not self._atlases_cache:
+            by_size = {}
+            for name, size in self.font_sizes.items():
+                if size not in by_size:
+                    cache_path = None
+                    if self.glyph_cache_dir:
+                        font_name = os.path.splitext(os.path.basename(self.font_path))[
+                            0
+                        ]
+                        cache_path = os.path.join(
+                            self.glyph_cache_dir, f"{font_name}-{size}.json"
+                        )
+                    by_size[size] = GlyphAtlas(self.fonts[name], cache_path)
+                self._atlases_cache[name] = by_size[size]
+        return self._atlases_cache
+
+    def _layout(self, text: str, font_key: str) -> Dict[str, Any]:
+        """
+        Mise en page mémorisée de `text` dans la police `font_key` (thread
+        de rendu) : largeur d'avance, bord droit de l'encre ; lignes et
+        positions ajoutées par _text_lines. Éviction LRU.
+        """
+        key = (text, font_key)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+        atlas = self.atlases[font_key]
+        layout = {"width": atlas.textlength(text), "right": atlas.textbbox(text)[2]}
+        self._layouts[key] = layout
+        if len(self._layouts) > self.LAYOUT_CACHE_SIZE:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def _text_width(self, text: str, font_key: str) -> float:
+        return self._layout(text, font_key)["width"]
+
+    def _text_lines(
+        self, text: str, font_key: str
+    ) -> Tuple[Tuple[float, int, str], ...]:
+        """
+        Texte multiligne centré, en haut de l'écran : ((x, y, ligne), ...).
+        Infos musique sur une ligne ("Titre: ... - Artiste") coupées sur " - ".
+        """
+        layout = self._layout(text, font_key)
+        lines_layout = layout.get("lines")
+        if lines_layout is not None:
+            return lines_layout
+        lines = text.split("\n")
+        if "Titre:" in text and len(lines) == 1 and " - " in text:
+            parts = text.split(" - ", 1)
+            if parts[1].strip():
+                lines = parts
+        atlas = self.atlases[font_key]
+        # Hauteur de ligne basée sur la police (+2 pour espacement)
+        top, bottom = atlas.font.getbbox("A")[1::2]
+        line_height = bottom - top + 2
+        positions = []
+        y = 0
+        for line in lines:
+            if line.strip():  # Ignore lignes vides
+                x = (128 - atlas.textlength(line)) // 2
+                positions.append((x, y, line))
+                y += line_height
+        layout["lines"] = tuple(positions)
+        return layout["lines"]
+
+    @staticmethod
+    def _pack_pages(image: Image.Image) -> List[bytes]:
+        """
+        Image 1 bit → pages SH1106 : octet (page p, colonne x) = pixels
+        (x, 8p..8p+7), bit 0 en haut. Rotation 90° horaire : chaque ligne
+        de l'image tournée est une colonne lue de bas en haut.
+        """
+        pages = image.height // 8
+        data = image.transpose(Image.Transpose.ROTATE_270).tobytes()
+        return [data[pages - 1 - page :: pages] for page in range(pages)]
+
+    def _transfer(self, pages: List[bytes]) -> int:
+        """
+        Envoie à l'écran les seules plages de colonnes modifiées depuis la
+        dernière trame (une commande d'adresse + un bloc de données par page).
+
+        Returns:
+            Nombre d'octets de données envoyés (0 : trame identique)
+        """
+        previous = self._last_pages
+        offset = getattr(self.device, "_page_address_offset", 0x02)
+        sent = 0
+        for page, data in enumerate(pages):
+            if previous is None:
+                start, end = 0, len(data)
+            else:
+                old = previous[page]
+                if old == data:
+                    continue
+                start = 0
+                while data[start] == old[start]:
+                    start += 1
+                end = len(data)
+                while data[end - 1] == old[end - 1]:
+                    end -= 1
+            column = start + offset
+            self.device.command(0xB0 + page, column & 0x0F, 0x10 | (column >> 4))
+            self.device.data(list(data[start:end]))
+            sent += end - start
+        self._last_pages = pages
+        if sent:
+            self.bytes_sent += sent
+            self.frames_sent += 1
+            frame_done = getattr(self.device, "frame_done", None)
+            if frame_done is not None:
+                frame_done()  # Écran PNG : image de la trame
+        return sent
+
+    @contextmanager
+    def _frame(self) -> Iterator[Union[ImageDraw.ImageDraw, FrameBuffer]]:
+        """
+        Dessin d'une trame (remplace luma `canvas`) : image PIL vierge ou
+        trame NumPy persistante effacée, puis transfert différentiel et
+        délai I2C seulement si l'écran a changé.
+        """
+        if self._framebuffer is not None:
+            self._framebuffer.clear()
+            yield self._framebuffer
+            pages = self._framebuffer.pages()
+        else:
+            image = Image.new(self.device.mode, self.device.size)
+            yield ImageDraw.Draw(image)
+            pages = self._pack_pages(self.device.preprocess(image))
+        if self._transfer(pages):
+            self._post_write_sleep()
+
     def _post_write_sleep(self) -> None:
         """Applique un délai configurable après une écriture I2C pour stabiliser le bus."""
         time.sleep(self.i2c_delay)
 
+    # ------------------------------------------------------------------
+    # Thread de rendu
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._render_loop, name="display-render", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Affiche le dernier état publié puis arrête le thread de rendu."""
+        self._stopping = True
+        self._wake_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Attend que le dernier état publié soit affiché (tests, banc de mesure)."""
+        return self._idle_event.wait(timeout)
+
+    def _publish(self, screen: str, *args, **kwargs) -> None:
+        """Dépose un état d'écran (listes copiées : instantané immuable)."""
+        args = tuple(tuple(a) if isinstance(a, list) else a for a in args)
+        with self._mailbox_lock:
+            self._mailbox = (screen, args, kwargs)
+            self._idle_event.clear()
+        self._wake_event.set()
+
+    def _apply_power(self) -> None:
+        """Aligne l'écran réel sur l'état demandé (thread de rendu)."""
+        if not self.device or self._device_on == self.is_on:
+            return
+        try:
+            if self.is_on:
+                self.device.show()
+            else:
+                self.device.hide()
+            self._device_on = self.is_on
+        except OSError:
+            self._init_oled()
+
+    def _render_loop(self) -> None:
+        while True:
+            self._wake_event.wait()
+            # Espacement minimal : les états publiés entre-temps se remplacent
+            delay = self.last_update + self.scheduler.min_interval - time.monotonic()
+            if delay > 0 and not self._stopping:
+                time.sleep(delay)
+            with self._mailbox_lock:
+                self._wake_event.clear()
+                frame = None
+                if self.is_on:  # Écran éteint : l'état attend le rallumage
+                    frame, self._mailbox = self._mailbox, None
+            try:
+                self._apply_power()
+                if frame is not None:
+                    screen, args, kwargs = frame
+                    getattr(self, f"_draw_{screen}")(*args, **kwargs)
+                    self.last_update = time.monotonic()
+            except Exception as e:
+                logger.error(f"[DISPLAY] Erreur rendu: {e}", exc_info=True)
+            with self._mailbox_lock:
+                pending = self._mailbox is not None and self.is_on
+                if not pending:
+                    self._idle_event.set()
+            if self._stopping and not pending and not self._wake_event.is_set():
+                return
+
+    # ------------------------------------------------------------------
+    # Publication (tous threads)
+    # ------------------------------------------------------------------
     def power_on(self) -> None:
         """Allume l'écran."""
-        if self.device and not self.is_on:
-            self.device.show()
+        if not self.is_on:
             self.is_on = True
+            self._wake_event.set()
 
     def power_off(self) -> None:
         """Éteint l'écran."""
-        if self.device and self.is_on:
-            self.device.hide()
+        if self.is_on:
             self.is_on = False
-
-    def _can_update(self) -> bool:
-        """Vérifie si rafraîchissement autorisé."""
-        current_time = time.time()
-        # Réduit à 0.05s pour permettre clignotement fluide
-        if current_time - self.last_update < 0.02:
-            return False
-        self.last_update = current_time
-        return True
+            self._wake_event.set()
 
     def show_menu(self, options: list[str], selected_index: int) -> None:
         """Affiche un menu avec défilement basé sur l'option sélectionnée."""
-        if not self._can_update():
-            return  # Ne rafraîchit pas si trop fréquent
+        self._publish("menu", options, selected_index)
+
+    def show_time(
+        self,
+        time_str: str,
+        alarm_indicators: tuple[bool, bool],
+        alarm_frequencies: tuple[str, str],
+        playing: bool = False,
+        music_source: Optional[str] = None,
+        mpd_unavailable: bool = False,
+    ) -> None:
+        """Affiche l'heure avec les indicateurs d'alarme et fréquences, plus indicateur mode lecture."""
+        playback_mode = None
+        if music_source == "sd" and self.manager is not None:
+            playback_mode = self.manager.settings.get("playback_mode", "sequentiel")
+        self._publish(
+            "time",
+            time_str,
+            tuple(alarm_indicators),
+            tuple(alarm_frequencies),
+            playing,
+            music_source,
+            mpd_unavailable,
+            playback_mode,
+        )
+
+    def show_music_player(
+        self,
+        artist: str,
+        title: str,
+        elapsed: str,
+        total: str,
+        progress: float,
+        is_playing: bool,
+        source: str = "sd",
+    ) -> None:
+        """Affiche le lecteur de musique (voir _draw_music_player)."""
+        self._publish(
+            "music_player", artist, title, elapsed, total, progress, is_playing, source
+        )
+
+    def show_settings(
+        self,
+        time_str: str,
+        blink_field: Optional[str] = None,
+        blink_state: bool = True,
+        label: Optional[str] = None,
+    ) -> None:
+        """Affiche un réglage avec clignotement du champ modifié et label optionnel."""
+        self._publish("settings", time_str, blink_field, blink_state, label)
+
+    def show_date_view(
+        self, day_str: str, date_str: str, options: list[str], selected_index: int
+    ) -> None:
+        """Affiche le jour en haut, la date en dessous, et les options horizontales en bas."""
+        if not self.is_on:
+            return
+        self._publish("date_view", day_str, date_str, options, selected_index)
+
+    def clear(self) -> None:
+        """Efface l'écran."""
+        self._publish("clear")
+
+    # ------------------------------------------------------------------
+    # Dessin (thread de rendu uniquement)
+    # ------------------------------------------------------------------
+    def _draw_menu(self, options: Tuple[str, ...], selected_index: int) -> None:
+        """Dessine un menu défilant autour de l'option sélectionnée."""
         if not self.device:
             self._init_oled()  # Réinitialise l'écran si nécessaire
             if not self.device:
@@ -102,7 +445,7 @@ class Display:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                with canvas(self.device) as draw:
+                with self._frame() as draw:
                     if self.device:
                         draw.rectangle(
                             (0, 0, self.device.width, self.device.height), fill=0
@@ -115,26 +458,23 @@ class Display:
                         selected = i == selected_index
                         if selected:
                             # Met en surbrillance l'option sélectionnée
-                            text_width = draw.textlength(
-                                option, font=self.fonts["menu"]
-                            )
+                            text_width = self._text_width(option, "menu")
                             draw.rectangle(
                                 (
                                     10,
                                     y - 2,
                                     10 + text_width,
-                                    y + self.fonts["menu"].size,
+                                    y + self.atlases["menu"].size,
                                 ),
                                 fill="white",
                             )
-                            draw.text(
-                                (10, y), option, font=self.fonts["menu"], fill="black"
+                            self.atlases["menu"].draw_text(
+                                draw, (10, y), option, fill="black"
                             )
                         else:
-                            draw.text(
-                                (10, y), option, font=self.fonts["menu"], fill="white"
+                            self.atlases["menu"].draw_text(
+                                draw, (10, y), option, fill="white"
                             )
-                self._post_write_sleep()  # Applique un délai après l'écriture
                 break
             except OSError:
                 if attempt < max_attempts - 1:
@@ -143,18 +483,90 @@ class Display:
                 else:
                     self.device = None  # Marque l'écran comme non disponible
 
-    def show_time(
+    def _blit_layer(
+        self, draw: ImageDraw.ImageDraw, name: str, paint: Callable, *inputs
+    ) -> None:
+        """
+        Ajoute (OU) à la trame le calque `name` mis en cache : `paint(draw,
+        *inputs)` n'est rappelé que si ses entrées ont changé, et seule la
+        zone encrée est gardée → coût d'une trame proportionnel aux calques
+        modifiés.
+        """
+        cached = self._layers.get(name)
+        if cached is None or cached[0] != inputs:
+            scratch = Image.new("1", self.device.size)
+            paint(ImageDraw.Draw(scratch), *inputs)
+            box = scratch.getbbox()
+            if box is None:
+                cached = (inputs, (0, 0), None)  # Calque vide
+            else:
+                cached = (inputs, box[:2], scratch.crop(box))
+            self._layers[name] = cached
+        _, origin, bitmap = cached
+        if bitmap is not None:
+            draw.bitmap(origin, bitmap, fill="white")
+
+    def _paint_clock_digits(self, draw: ImageDraw.ImageDraw, time_str: str) -> None:
+        """Heure au centre."""
+        time_width = self._layout(time_str, "time")["right"]
+        x = (128 - time_width) // 2
+        self.atlases["time"].draw_text(draw, (x, 20), time_str, fill="white")
+
+    def _paint_clock_indicators(
+        self,
+        draw: ImageDraw.ImageDraw,
+        alarm_indicators: Tuple[bool, bool],
+        alarm_frequencies: Tuple[str, str],
+        mpd_unavailable: bool,
+    ) -> None:
+        """Colonne de droite : erreur MPD, indicateurs et fréquences d'alarme."""
+        # Icône erreur MPD (croix en haut à droite)
+        if mpd_unavailable:
+            self.atlases["freq"].draw_text(draw, (118, 5), "B", fill="white")
+        if alarm_indicators[0]:
+            draw.rectangle((115, 24, 117, 27), fill="white")
+            self.atlases["freq"].draw_text(
+                draw, (123, 15), alarm_frequencies[0], fill="white"
+            )
+        if alarm_indicators[1]:
+            draw.rectangle((115, 37, 117, 40), fill="white")
+            draw.rectangle((115, 45, 117, 48), fill="white")
+            self.atlases["freq"].draw_text(
+                draw, (123, 33), alarm_frequencies[1], fill="white"
+            )
+
+    def _paint_clock_source(
+        self,
+        draw: ImageDraw.ImageDraw,
+        playing: bool,
+        music_source: Optional[str],
+        playback_mode: Optional[str],
+    ) -> None:
+        """Icônes lecture en cours et source (Carte SD ou Webradio)."""
+        if playing:
+            draw.polygon([(110, 50), (110, 60), (120, 55)], fill="white")
+        if music_source == "sd" and playback_mode is not None:
+            if playback_mode == "aleatoire":
+                draw.rectangle((100, 55, 103, 58), fill="white")  # Icône shuffle
+                draw.rectangle((103, 52, 106, 55), fill="white")
+            else:
+                # Icône lecture séquentielle
+                draw.rectangle((100, 55, 106, 58), fill="white")
+        elif music_source == "webradio":
+            draw.ellipse((100, 52, 103, 55), fill="white")  # Icône Webradio
+            draw.ellipse((98, 50, 105, 57), fill="white")
+
+    def _draw_time(
         self,
         time_str: str,
-        alarm_indicators: tuple[bool, bool],
-        alarm_frequencies: tuple[str, str],
-        playing: bool = False,
-        music_source: Optional[str] = None,
-        mpd_unavailable: bool = False,
+        alarm_indicators: Tuple[bool, bool],
+        alarm_frequencies: Tuple[str, str],
+        playing: bool,
+        music_source: Optional[str],
+        mpd_unavailable: bool,
+        playback_mode: Optional[str],
     ) -> None:
-        """Affiche l'heure avec les indicateurs d'alarme et fréquences, plus indicateur mode lecture."""
-        if not self._can_update():
-            return
+        """Compose l'heure, les indicateurs d'alarme et la source de lecture."""
         if not self.device:
             self._init_oled()
             if not self.device:
@@ -162,53 +574,26 @@ class Display:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                with canvas(self.device) as draw:
-                    # Affiche l'heure au centre
-                    time_width = draw.textbbox(
-                        (0, 0), time_str, font=self.fonts["time"]
-                    )[2]
-                    x = (128 - time_width) // 2
-                    draw.text((x, 20), time_str, font=self.fonts["time"], fill="white")
-                    # AJOUT : Icône erreur MPD (croix en haut à droite)
-                    if mpd_unavailable:
-                        draw.text((118, 5), "B", font=self.fonts["freq"], fill="white")
-                    # Affiche les indicateurs d'alarme
-                    if alarm_indicators[0]:
-                        draw.rectangle((115, 24, 117, 27), fill="white")
-                        draw.text(
-                            (123, 15),
-                            alarm_frequencies[0],
-                            font=self.fonts["freq"],
-                            fill="white",
-                        )
-                    if alarm_indicators[1]:
-                        draw.rectangle((115, 37, 117, 40), fill="white")
-                        draw.rectangle((115, 45, 117, 48), fill="white")
-                        draw.text(
-                            (123, 33),
-                            alarm_frequencies[1],
-                            font=self.fonts["freq"],
-                            fill="white",
-                        )
-                    # Affiche l'icône de lecture si la musique est en cours
-                    if playing:
-                        draw.polygon([(110, 50), (110, 60), (120, 55)], fill="white")
-                    # Affiche l'indicateur de mode lecture (Carte SD ou Webradio)
-                    if music_source == "sd" and self.manager is not None:
-                        mode = self.manager.settings.get("playback_mode", "sequentiel")
-                        if mode == "aleatoire":
-                            draw.rectangle(
-                                (100, 55, 103, 58), fill="white"
-                            )  # Icône shuffle
-                            draw.rectangle((103, 52, 106, 55), fill="white")
-                        else:
-                            draw.rectangle(
-                                (100, 55, 106, 58), fill="white"
-                            )  # Icône lecture séquentielle
-                    elif music_source == "webradio":
-                        draw.ellipse((100, 52, 103, 55), fill="white")  # Icône Webradio
-                        draw.ellipse((98, 50, 105, 57), fill="white")
-                self._post_write_sleep()
+                with self._frame() as draw:
+                    self._blit_layer(
+                        draw, "clock_digits", self._paint_clock_digits, time_str
+                    )
+                    self._blit_layer(
+                        draw,
+                        "clock_indicators",
+                        self._paint_clock_indicators,
+                        alarm_indicators,
+                        alarm_frequencies,
+                        mpd_unavailable,
+                    )
+                    self._blit_layer(
+                        draw,
+                        "clock_source",
+                        self._paint_clock_source,
+                        playing,
+                        music_source,
+                        playback_mode,
+                    )
                 break
             except OSError:
                 if attempt < max_attempts - 1:
@@ -217,7 +602,58 @@ class Display:
                 else:
                     self.device = None
 
-    def show_music_player(
+    def _paint_player_title(
+        self, draw: ImageDraw.ImageDraw, artist: str, title: str
+    ) -> None:
+        """Lignes 1-2 : artiste et titre (tronqués si nécessaire)."""
+        atlas_small = self.atlases["music_infos"]  # Taille 12
+        artist_display = artist if len(artist) <= 21 else artist[:18] + "..."
+        atlas_small.draw_text(draw, (2, 0), artist_display, fill="white")
+        title_display = title if len(title) <= 21 else title[:18] + "..."
+        atlas_small.draw_text(draw, (2, 12), title_display, fill="white")
+
+    def _paint_player_progress(
+        self, draw: ImageDraw.ImageDraw, fill_width: int
+    ) -> None:
+        """Ligne 3 (SD) : cadre et remplissage de la barre de progression."""
+        bar_y = 26
+        bar_width = self.PROGRESS_BAR_WIDTH
+        bar_height = 6
+        draw.rectangle(
+            (2, bar_y, 2 + bar_width, bar_y + bar_height), outline="white", fill=0
+        )
+        if fill_width > 0:
+            draw.rectangle(
+                (3, bar_y + 1, 3 + fill_width, bar_y + bar_height - 1), fill="white"
+            )
+
+    def _paint_player_status(
+        self,
+        draw: ImageDraw.ImageDraw,
+        source: str,
+        elapsed: str,
+        total: str,
+        is_playing: bool,
+    ) -> None:
+        """Temps et icône d'état (SD : play/pause ; webradio : ondes)."""
+        atlas_small = self.atlases["music_infos"]
+        if source == "sd":
+            # Ligne 4 : Temps (gauche) et icône play/pause (droite)
+            atlas_small.draw_text(draw, (2, 35), f"{elapsed} / {total}", fill="white")
+            if is_playing:
+                draw.polygon([(110, 36), (110, 46), (120, 41)], fill="white")
+            else:
+                draw.rectangle((110, 36, 113, 46), fill="white")
+                draw.rectangle((117, 36, 120, 46), fill="white")
+        else:
+            # Ligne 3 : "Streaming..." ; ligne 4 : temps et ondes
+            atlas_small.draw_text(draw, (2, 26), "Streaming...", fill="white")
+            atlas_small.draw_text(draw, (2, 38), elapsed, fill="white")
+            draw.ellipse((108, 38, 112, 42), outline="white")
+            draw.ellipse((105, 35, 115, 45), outline="white")
+            draw.ellipse((102, 32, 118, 48), outline="white")
+
+    def _draw_music_player(
         self,
         artist: str,
         title: str,
@@ -228,7 +664,8 @@ class Display:
         source: str = "sd",
     ) -> None:
         """
-        Affiche un lecteur de musique style Rockbox avec barre de progression.
+        Compose un lecteur de musique style Rockbox avec barre de progression
+        (calques titre, barre, état : seuls ceux qui changent sont redessinés).
 
         Args:
             artist: Nom de l'artiste
@@ -239,8 +676,6 @@ class Display:
             is_playing: True si en lecture, False si en pause
             source: "sd" ou "webradio"
         """
-        if not self._can_update():
-            return
         if not self.device:
             self._init_oled()
             if not self.device:
@@ -249,76 +684,31 @@ class Display:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                with canvas(self.device) as draw:
-                    font_small = self.fonts["music_infos"]  # Taille 12
-
-                    # Ligne 1 : Artiste (tronqué si nécessaire)
-                    artist_display = (
-                        artist if len(artist) <= 21 else artist[:18] + "..."
+                with self._frame() as draw:
+                    self._blit_layer(
+                        draw, "player_title", self._paint_player_title, artist, title
                     )
-                    draw.text((2, 0), artist_display, font=font_small, fill="white")
-
-                    # Ligne 2 : Titre (tronqué si nécessaire)
-                    title_display = title if len(title) <= 21 else title[:18] + "..."
-                    draw.text((2, 12), title_display, font=font_small, fill="white")
-
                     if source == "sd":
-                        # Ligne 3 : Barre de progression
-                        bar_y = 26
-                        bar_width = 124  # Largeur totale - marges
-                        bar_height = 6
-
-                        # Cadre de la barre
-                        draw.rectangle(
-                            (2, bar_y, 2 + bar_width, bar_y + bar_height),
-                            outline="white",
-                            fill=0,
+                        fill_width = (
+                            int((self.PROGRESS_BAR_WIDTH - 2) * progress)
+                            if progress > 0
+                            else 0
                         )
-
-                        # Remplissage de la barre
-                        if progress > 0:
-                            fill_width = int((bar_width - 2) * progress)
-                            if fill_width > 0:
-                                draw.rectangle(
-                                    (
-                                        3,
-                                        bar_y + 1,
-                                        3 + fill_width,
-                                        bar_y + bar_height - 1,
-                                    ),
-                                    fill="white",
-                                )
-
-                        # Ligne 4 : Temps (gauche) et icône play/pause (droite)
-                        time_str = f"{elapsed} / {total}"
-                        draw.text((2, 35), time_str, font=font_small, fill="white")
-
-                        # Icône play/pause en bas à droite
-                        if is_playing:
-                            # Triangle play
-                            draw.polygon(
-                                [(110, 36), (110, 46), (120, 41)], fill="white"
-                            )
-                        else:
-                            # Barres pause
-                            draw.rectangle((110, 36, 113, 46), fill="white")
-                            draw.rectangle((117, 36, 120, 46), fill="white")
-
-                    else:  # webradio
-                        # Ligne 3 : "Streaming..."
-                        draw.text(
-                            (2, 26), "Streaming...", font=font_small, fill="white"
+                        self._blit_layer(
+                            draw,
+                            "player_progress",
+                            self._paint_player_progress,
+                            fill_width,
                         )
-
-                        # Ligne 4 : Temps et icône
-                        draw.text((2, 38), elapsed, font=font_small, fill="white")
-
-                        # Icône webradio (ondes)
-                        draw.ellipse((108, 38, 112, 42), outline="white")
-                        draw.ellipse((105, 35, 115, 45), outline="white")
-                        draw.ellipse((102, 32, 118, 48), outline="white")
-
-                self._post_write_sleep()
+                    self._blit_layer(
+                        draw,
+                        "player_status",
+                        self._paint_player_status,
+                        source,
+                        elapsed,
+                        total,
+                        is_playing,
+                    )
                 break
             except OSError:
                 if attempt < max_attempts - 1:
@@ -327,16 +717,14 @@ class Display:
                 else:
                     self.device = None
 
-    def show_settings(
+    def _draw_settings(
         self,
         time_str: str,
-        blink_field: Optional[str] = None,
-        blink_state: bool = True,
-        label: Optional[str] = None,
+        blink_field: Optional[str],
+        blink_state: bool,
+        label: Optional[str],
     ) -> None:
-        """Affiche un réglage avec clignotement du champ modifié et label optionnel."""
-        if not self._can_update():
-            return
+        """Dessine un réglage (champ clignotant, label optionnel)."""
         if not self.device:
             self._init_oled()
             if not self.device:
@@ -344,40 +732,22 @@ class Display:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                with canvas(self.device) as draw:
-                    font_time = self.fonts["time"]
-                    font_label = self.fonts["menu"]
-                    font_settings = self.fonts["settings"]
+                with self._frame() as draw:
+                    atlas_label = self.atlases["menu"]
                     # Affiche le label si fourni
                     if label:
-                        label_width = draw.textlength(label, font=font_label)
+                        label_width = self._text_width(label, "menu")
                         label_x = (128 - label_width) // 2
-                        draw.text((label_x, 5), label, font=font_label, fill="white")
+                        atlas_label.draw_text(draw, (label_x, 5), label, fill="white")
                     y = 25 if label else 20
-                    # Détection spéciale pour infos musique (prefix "Titre:" → police petite)
-                    is_music_info = "Titre:" in time_str
-                    lines = time_str.split("\n")
-                    if is_music_info or len(lines) > 1:
-                        # Utilise police "music_infos" pour musique/multiline (ex: infos musique)
-                        font = self.fonts["music_infos"]
-                        y = 0  # Reset Y pour affichage en haut (compact)
-                        # Si musique sans \n, split manuel sur " - " pour titre/artiste
-                        if is_music_info and len(lines) == 1 and " - " in time_str:
-                            try:
-                                parts = time_str.split(" - ", 1)
-                                if len(parts) == 2 and parts[1].strip():
-                                    lines = parts
-                            except Exception:
-                                pass  # Garde lines original si erreur
-                        for line in lines:
-                            if line.strip():  # Ignore lignes vides
-                                text_width = draw.textlength(line, font=font)
-                                x = (128 - text_width) // 2
-                                draw.text((x, y), line, font=font, fill="white")
-                                # Hauteur dynamique basée sur la font (env. 10px pour taille 10)
-                                y += (
-                                    font.getbbox("A")[3] - font.getbbox("A")[1] + 2
-                                )  # +2 pour espacement
+                    # Infos musique (prefix "Titre:") ou multiligne → police petite,
+                    # lignes centrées en haut (compact)
+                    if "Titre:" in time_str or "\n" in time_str:
+                        atlas = self.atlases["music_infos"]
+                        for x, line_y, line in self._text_lines(
+                            time_str, "music_infos"
+                        ):
+                            atlas.draw_text(draw, (x, line_y), line, fill="white")
                     else:
                         # Détection simple d'heure (HH:MM) pour police grosse
                         if (
@@ -386,38 +756,35 @@ class Display:
                             and time_str[:2].isdigit()
                             and time_str[3:].isdigit()
                         ):
-                            font = font_time  # Police grosse seulement pour "HH:MM"
+                            font_key = "time"  # Police grosse seulement pour "HH:MM"
                         else:
-                            font = font_settings  # Petite pour les autres textes
+                            font_key = "settings"  # Petite pour les autres textes
+                        atlas = self.atlases[font_key]
 
-                        text_width = draw.textlength(time_str, font=font)
+                        text_width = self._text_width(time_str, font_key)
                         x = (128 - text_width) // 2
                         if blink_field == "hours" and ":" in time_str:
                             hours, minutes = time_str.split(":")
                             if not blink_state:
-                                partial_width = draw.textlength(hours + ":", font=font)
-                                draw.text(
-                                    (x + partial_width, y),
-                                    minutes,
-                                    font=font,
-                                    fill="white",
+                                partial_width = self._text_width(hours + ":", font_key)
+                                atlas.draw_text(
+                                    draw, (x + partial_width, y), minutes, fill="white"
                                 )
                             else:
-                                draw.text((x, y), time_str, font=font, fill="white")
+                                atlas.draw_text(draw, (x, y), time_str, fill="white")
                         elif blink_field == "minutes" and ":" in time_str:
                             hours, minutes = time_str.split(":")
                             if not blink_state:
-                                draw.text((x, y), hours + ":", font=font, fill="white")
+                                atlas.draw_text(draw, (x, y), hours + ":", fill="white")
                             else:
-                                draw.text(
+                                atlas.draw_text(
+                                    draw,
                                     (x, y),
                                     time_str,
-                                    font=font,
                                     fill="white" if blink_state else 0,
                                 )
                         else:
-                            draw.text((x, y), time_str, font=font, fill="white")
-                self._post_write_sleep()
+                            atlas.draw_text(draw, (x, y), time_str, fill="white")
                 break
             except OSError:
                 if attempt < max_attempts - 1:
@@ -426,12 +793,14 @@ class Display:
                 else:
                     self.device = None
 
-    def show_date_view(
-        self, day_str: str, date_str: str, options: list[str], selected_index: int
+    def _draw_date_view(
+        self,
+        day_str: str,
+        date_str: str,
+        options: Tuple[str, ...],
+        selected_index: int,
     ) -> None:
-        """Affiche le jour en haut, la date en dessous, et les options horizontales en bas."""
-        if not self._can_update() or not self.is_on:
-            return
+        """Dessine jour, date et options horizontales."""
         if not self.device:
             self._init_oled()
             if not self.device:
@@ -439,33 +808,32 @@ class Display:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                with canvas(self.device) as draw:
-                    font_date = self.fonts["settings"]
+                with self._frame() as draw:
+                    atlas_date = self.atlases["settings"]
                     # Affiche le jour en haut
-                    day_width = draw.textlength(day_str, font=font_date)
+                    day_width = self._text_width(day_str, "settings")
                     day_x = (128 - day_width) // 2
-                    draw.text((day_x, 5), day_str, font=font_date, fill="white")
+                    atlas_date.draw_text(draw, (day_x, 5), day_str, fill="white")
                     # Affiche la date en dessous
-                    date_width = draw.textlength(date_str, font=font_date)
+                    date_width = self._text_width(date_str, "settings")
                     date_x = (128 - date_width) // 2
-                    draw.text((date_x, 25), date_str, font=font_date, fill="white")
+                    atlas_date.draw_text(draw, (date_x, 25), date_str, fill="white")
                     # Affiche les options horizontales en bas
-                    font_opt = self.fonts["menu"]
+                    atlas_opt = self.atlases["menu"]
                     x_positions = [10, 70]
                     for i, option in enumerate(options):
                         y = 45
                         x = x_positions[i]
                         selected = i == selected_index
                         if selected:
-                            text_width = draw.textlength(option, font=font_opt)
+                            text_width = self._text_width(option, "menu")
                             draw.rectangle(
-                                (x, y - 2, x + text_width, y + font_opt.size),
+                                (x, y - 2, x + text_width, y + atlas_opt.size),
                                 fill="white",
                             )
-                            draw.text((x, y), option, font=font_opt, fill="black")
+                            atlas_opt.draw_text(draw, (x, y), option, fill="black")
                         else:
-                            draw.text((x, y), option, font=font_opt, fill="white")
-                self._post_write_sleep()
+                            atlas_opt.draw_text(draw, (x, y), option, fill="white")
                 break
             except OSError:
                 if attempt < max_attempts - 1:
@@ -474,19 +842,18 @@ class Display:
                 else:
                     self.device = None
 
-    def clear(self) -> None:
+    def _draw_clear(self) -> None:
         """Efface l'écran."""
         if not self.device:
             self._init_oled()
             if not self.device:
                 return
         try:
-            with canvas(self.device) as draw:
+            with self._frame() as draw:
                 if self.device:
                     draw.rectangle(
                         (0, 0, self.device.width, self.device.height), fill=0
                     )
-            self._post_write_sleep()
         except OSError:
             self._init_oled()
 
@@ -0,0 +1,101 @@
+import os
+import logging
+from typing import List
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryDevice:
+    """
+    Écran SH1106 simulé en mémoire (sans I2C ni luma) : interprète les
+    commandes d'adresse page/colonne et écrit les données dans une GDDRAM
+    de 132 colonnes comme le contrôleur. Compte les octets de commande et
+    de données qui auraient transité sur le bus.
+    """
+
+    COLUMNS = 132  # Largeur de la GDDRAM du SH1106 (écran 128 décalé de 2)
+
+    def __init__(
+        self, width: int = 128, height: int = 64, page_address_offset: int = 0x02
+    ):
+        self.width = width
+        self.height = height
+        self.size = (width, height)
+        self.mode = "1"
+        self._page_address_offset = page_address_offset
+        self.ram: List[bytearray] = [
+            bytearray(self.COLUMNS) for _ in range(height // 8)
+        ]
+        self.page = 0
+        self.column = 0
+        self.is_on = True
+        self.command_bytes = 0
+        self.data_bytes = 0
+
+    # API luma utilisée par Display
+    def preprocess(self, image: Image.Image) -> Image.Image:
+        return image
+
+    def command(self, *cmd: int) -> None:
+        self.command_bytes += len(cmd)
+        for byte in cmd:
+            if 0xB0 <= byte <= 0xB7:
+                self.page = byte - 0xB0
+            elif byte <= 0x0F:
+                self.column = (self.column & 0xF0) | byte
+            elif byte <= 0x1F:
+                self.column = (self.column & 0x0F) | ((byte - 0x10) << 4)
+            elif byte == 0xAE:
+                self.is_on = False
+            elif byte == 0xAF:
+                self.is_on = True
+
+    def data(self, data: List[int]) -> None:
+        self.data_bytes += len(data)
+        row = self.ram[self.page]
+        for byte in data:
+            if self.column < self.COLUMNS:
+                row[self.column] = byte
+            self.column += 1
+
+    def show(self) -> None:
+        self.command(0xAF)
+
+    def hide(self) -> None:
+        self.command(0xAE)
+
+    def cleanup(self) -> None:
+        pass
+
+    def image(self) -> Image.Image:
+        """Contenu visible de la GDDRAM sous forme d'image 1 bit."""
+        image = Image.new("1", self.size)
+        pixels = image.load()
+        offset = self._page_address_offset
+        for page, row in enumerate(self.ram):
+            for x in range(self.width):
+                byte = row[x + offset]
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        pixels[x, page * 8 + bit] = 1
+        return image
+
+
+class PngDevice(MemoryDevice):
+    """Écran en mémoire qui écrit chaque trame modifiée en PNG numéroté."""
+
+    def __init__(self, directory: str, **kwargs):
+        super().__init__(**kwargs)
+        self.directory = directory
+        self.frame_index = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def frame_done(self) -> None:
+        """Appelé par Display après chaque trame ayant modifié l'écran."""
+        self.frame_index += 1
+        path = os.path.join(self.directory, f"frame-{self.frame_index:05d}.png")
+        try:
+            self.image().save(path)
+        except OSError as e:
+            logger.warning(f"[DISPLAY] Écriture {path} impossible: {e}")
@@ -0,0 +1,76 @@
+import threading
+import time
+from typing import Optional
+
+
+class FrameScheduler:
+    """
+    Ordonnanceur unique des trames de l'interface. Une trame est demandée
+    sur changement d'état (request) ou à une échéance connue (schedule :
+    clignotement, seconde du lecteur, fin d'un message), jamais par une
+    minuterie fixe. La boucle principale dort jusqu'au prochain réveil
+    (encodeur, MPD), échéance ou tic d'entretien ; écran éteint, aucune
+    trame n'est produite.
+    """
+
+    def __init__(self, config: dict):
+        # Espacement minimal entre deux trames dessinées (thread de rendu)
+        self.min_interval = config.get("frame_interval", 0.02)
+        # Scrutation pendant une interaction (appui maintenu, commande audio)
+        self.interactive_interval = config.get("interactive_interval", 0.05)
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._dirty = False  # Trame demandée, pas encore produite
+        self._deadline: Optional[float] = None  # time.monotonic() de l'échéance
+
+    def wake(self) -> None:
+        """Réveille la boucle (entrée à traiter) sans imposer de trame. Tous threads."""
+        self._wake_event.set()
+
+    def request(self) -> None:
+        """Demande une trame au prochain passage de boucle. Tous threads."""
+        with self._lock:
+            self._dirty = True
+        self._wake_event.set()
+
+    def schedule(self, delay: float) -> None:
+        """
+        Demande une trame dans `delay` secondes (l'échéance la plus proche
+        est gardée). Boucle principale uniquement : pris en compte au
+        prochain wait(), sans réveil.
+        """
+        now = time.monotonic()
+        deadline = now + max(delay, 0.0)
+        with self._lock:
+            if self._deadline is not None and self._deadline <= now:
+                self._dirty = True  # Échéance atteinte : sa trame reste due
+                self._deadline = None
+            if self._deadline is None or deadline < self._deadline:
+                self._deadline = deadline
+
+    def frame_due(self, display_on: bool) -> bool:
+        """
+        True si une trame est due (demande ou échéance atteinte) ; elle est
+        alors consommée. Écran éteint : échéances abandonnées, demande
+        gardée pour le rallumage.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not display_on:
+                self._deadline = None
+                return False
+            reached = self._deadline is not None and now >= self._deadline
+            if reached:
+                self._deadline = None
+            due = self._dirty or reached
+            self._dirty = False
+        return due
+
+    def wait(self, timeout: float) -> None:
+        """Dort jusqu'à un réveil, la prochaine échéance ou `timeout` secondes."""
+        with self._lock:
+            if self._deadline is not None:
+                timeout = min(timeout, self._deadline - time.monotonic())
+        if timeout > 0:
+            self._wake_event.wait(timeout)
+        self._wake_event.clear()
@@ -0,0 +1,128 @@
+import weakref
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Backend optionnel (display.renderer = "numpy")
+    np = None
+
+from PIL import Image
+
+
+class FrameBuffer:
+    """
+    Trame 1 bit persistante au format mémoire du SH1106 : une colonne est
+    un entier 64 bits (bit y = pixel de la ligne y), donc l'octet p d'une
+    colonne est directement son octet de page p. Sous-ensemble vectorisé
+    (NumPy) de l'API ImageDraw utilisée par Display, au pixel près :
+    rectangle et bitmap (glyphes, calques). Aucune image allouée par trame.
+    """
+
+    def __init__(self, width: int = 128, height: int = 64):
+        if np is None:
+            raise RuntimeError("NumPy indisponible")
+        if height > 64 or height % 8:
+            raise ValueError(f"Hauteur non supportée: {height}")
+        self.width = width
+        self.height = height
+        self.columns = np.zeros(width, dtype="<u8")
+        # Vue (pages, colonnes) sur la même mémoire : aucun repack à l'envoi
+        self.page_view = self.columns.view(np.uint8).reshape(width, 8).T[: height // 8]
+        self._height_mask = np.uint64((1 << height) - 1)
+        # Bitmap PIL → colonnes 64 bits (glyphes et calques, convertis une
+        # fois) ; clé id() (Image non hachable), entrée retirée à sa libération
+        self._sprites: Dict[int, Tuple[weakref.ref, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Trame
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        self.columns.fill(0)
+
+    def pages(self) -> List[bytes]:
+        """Octets de chaque page SH1106 (mêmes valeurs que Display._pack_pages)."""
+        return [page.tobytes() for page in self.page_view]
+
+    @staticmethod
+    def _ink(fill) -> bool:
+        if isinstance(fill, str):
+            return fill != "black"
+        return bool(fill)
+
+    def _rows_mask(self, top: int, bottom: int):
+        """Masque des lignes top..bottom incluses (bornées à l'écran)."""
+        top = max(top, 0)
+        bottom = min(bottom, self.height - 1)
+        if bottom < top:
+            return np.uint64(0)
+        return np.uint64(((1 << (bottom + 1)) - 1) ^ ((1 << top) - 1))
+
+    def _apply(self, left: int, right: int, mask, ink: bool) -> None:
+        """Colonnes left..right (exclu) : bits de `mask` allumés ou éteints."""
+        left = max(left, 0)
+        right = min(right, self.width)
+        if right <= left:
+            return
+        if ink:
+            self.columns[left:right] |= mask
+        else:
+            self.columns[left:right] &= ~mask
+
+    # ------------------------------------------------------------------
+    # Primitives (API ImageDraw)
+    # ------------------------------------------------------------------
+    def rectangle(self, xy: Sequence[float], fill=None, outline=None) -> None:
+        """Rectangle bornes incluses, coordonnées tronquées comme PIL."""
+        x0, y0, x1, y1 = (int(v) for v in xy)
+        if x1 < x0 or y1 < y0:
+            raise ValueError("x1 >= x0 et y1 >= y0 attendus")
+        if fill is not None:
+            self._apply(x0, x1 + 1, self._rows_mask(y0, y1), self._ink(fill))
+        if outline is not None:
+            ink = self._ink(outline)
+            edges = self._rows_mask(y0, y0) | self._rows_mask(y1, y1)
+            self._apply(x0, x1 + 1, edges, ink)
+            sides = self._rows_mask(y0, y1)
+            self._apply(x0, x0 + 1, sides, ink)
+            self._apply(x1, x1 + 1, sides, ink)
+
+    def _sprite(self, bitmap: Image.Image, y: int):
+        """Colonnes de `bitmap` décalées à la ligne `y` (mémorisées par ligne)."""
+        key = id(bitmap)
+        entry = self._sprites.get(key)
+        if entry is None or entry[0]() is not bitmap:
+            pixels = np.asarray(bitmap.convert("1"), dtype=np.uint64)
+            rows = np.arange(pixels.shape[0], dtype=np.uint64)[:, None]
+            sprites = self._sprites
+            entry = self._sprites[key] = (
+                weakref.ref(bitmap, lambda _, key=key: sprites.pop(key, None)),
+                (pixels << rows).sum(axis=0, dtype=np.uint64),
+                {},
+            )
+        shifted = entry[2].get(y)
+        if shifted is None:
+            columns = entry[1]
+            if y >= 0:
+                columns = columns << np.uint64(y)
+            else:
+                columns = columns >> np.uint64(-y)
+            shifted = entry[2][y] = columns & self._height_mask
+        return shifted
+
+    def bitmap(self, xy: Tuple[int, int], bitmap: Image.Image, fill="white") -> None:
+        """Pixels allumés de `bitmap` (hauteur ≤ 64) posés en `xy` avec `fill`."""
+        x, y = int(xy[0]), int(xy[1])
+        if bitmap.height > 64 or y >= self.height or y + bitmap.height <= 0:
+            return
+        left = max(0, -x)
+        right = min(bitmap.width, self.width - x)
+        if right <= left:
+            return
+        columns = self._sprite(bitmap, y)
+        if left or right < bitmap.width:
+            columns = columns[left:right]
+        target = self.columns[x + left : x + right]
+        if self._ink(fill):
+            target |= columns
+        else:
+            target &= ~columns
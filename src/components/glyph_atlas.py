@@ -0,0 +1,156 @@
+import base64
+import json
+import os
+import logging
+from typing import Dict, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+# (décalage x, décalage y, avance, bitmap 1 bit ou None si glyphe vide)
+Glyph = Tuple[int, int, float, Optional[Image.Image]]
+
+
+class GlyphAtlas:
+    """
+    Glyphes 1 bit pré-rastérisés pour une police et une taille : le texte
+    est composé par copie de bitmaps (draw.bitmap) au lieu d'un rendu
+    FreeType à chaque trame. Jeu de base (ASCII, Latin-1, icônes du
+    navigateur SD) rastérisé une fois puis persisté en JSON ; un caractère
+    hors jeu est rastérisé à la demande (gardé en mémoire seulement).
+    """
+
+    VERSION = 1
+    CHARSET = (
+        "".join(chr(c) for c in range(0x20, 0x7F))
+        + "".join(chr(c) for c in range(0xA0, 0x100))
+        + "📁🎵"
+    )
+
+    def __init__(self, font: ImageFont.FreeTypeFont, cache_path: Optional[str] = None):
+        self.font = font
+        self.cache_path = cache_path
+        self.glyphs: Dict[str, Glyph] = {}
+        if not self._load():
+            for char in self.CHARSET:
+                self.glyphs[char] = self._rasterize(char)
+            self._save()
+
+    # ------------------------------------------------------------------
+    # Rastérisation / persistance
+    # ------------------------------------------------------------------
+    def _rasterize(self, char: str) -> Glyph:
+        advance = self.font.getlength(char)
+        left, top, right, bottom = self.font.getbbox(char)
+        if right <= left or bottom <= top:
+            return left, top, advance, None  # Espace : avance seule
+        bitmap = Image.new("1", (right - left, bottom - top))
+        ImageDraw.Draw(bitmap).text((-left, -top), char, font=self.font, fill=1)
+        return left, top, advance, bitmap
+
+    def _signature(self) -> dict:
+        """Identifie la police rastérisée (cache invalidé si elle change)."""
+        path = getattr(self.font, "path", None)
+        try:
+            mtime = os.path.getmtime(path) if path else 0
+        except OSError:
+            mtime = 0
+        return {
+            "version": self.VERSION,
+            "font": path,
+            "mtime": mtime,
+            "size": self.font.size,
+        }
+
+    def _load(self) -> bool:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+            if data.get("signature") != self._signature():
+                return False
+            glyphs: Dict[str, Glyph] = {}
+            for char, entry in data["glyphs"].items():
+                left, top, advance, width, height, bits = entry
+                bitmap = None
+                if bits is not None:
+                    bitmap = Image.frombytes(
+                        "1", (width, height), base64.b64decode(bits)
+                    )
+                glyphs[char] = (left, top, advance, bitmap)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"[DISPLAY] Atlas {self.cache_path} illisible: {e}")
+            return False
+        self.glyphs = glyphs
+        return True
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        glyphs = {}
+        for char, (left, top, advance, bitmap) in self.glyphs.items():
+            if bitmap is None:
+                glyphs[char] = [left, top, advance, 0, 0, None]
+            else:
+                bits = base64.b64encode(bitmap.tobytes()).decode("ascii")
+                glyphs[char] = [left, top, advance, bitmap.width, bitmap.height, bits]
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"signature": self._signature(), "glyphs": glyphs}, f)
+            os.replace(tmp_path, self.cache_path)  # Écriture atomique
+        except OSError as e:
+            logger.warning(f"[DISPLAY] Sauvegarde atlas impossible: {e}")
+
+    @property
+    def size(self) -> int:
+        return self.font.size
+
+    # ------------------------------------------------------------------
+    # Mesure / composition
+    # ------------------------------------------------------------------
+    def glyph(self, char: str) -> Glyph:
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.glyphs[char] = self._rasterize(char)
+        return glyph
+
+    def textlength(self, text: str) -> float:
+        """Avance totale du texte (équivalent draw.textlength)."""
+        return sum(self.glyph(char)[2] for char in text)
+
+    def textbbox(self, text: str) -> Tuple[int, int, int, int]:
+        """Boîte englobante de l'encre, texte placé en (0, 0)."""
+        x = 0.0
+        left = top = right = bottom = None
+        for char in text:
+            dx, dy, advance, bitmap = self.glyph(char)
+            if bitmap is not None:
+                x0, y0 = round(x) + dx, dy
+                x1, y1 = x0 + bitmap.width, y0 + bitmap.height
+                left = x0 if left is None else min(left, x0)
+                top = y0 if top is None else min(top, y0)
+                right = x1 if right is None else max(right, x1)
+                bottom = y1 if bottom is None else max(bottom, y1)
+            x += advance
+        if left is None:
+            return 0, 0, round(x), 0
+        return left, top, right, bottom
+
+    def draw_text(
+        self,
+        draw: ImageDraw.ImageDraw,
+        xy: Tuple[float, float],
+        text: str,
+        fill="white",
+    ) -> None:
+        """Compose `text` en (x, y) (ancre haut-gauche, comme draw.text)."""
+        x, y = xy
+        y = round(y)
+        for char in text:
+            dx, dy, advance, bitmap = self.glyph(char)
+            if bitmap is not None:
+                draw.bitmap((round(x) + dx, y + dy), bitmap, fill=fill)
+            x += advance
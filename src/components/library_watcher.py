@@ -0,0 +1,237 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional, Set
+from src.components.music_library import MusicLibrary
+
+logger = logging.getLogger(__name__)
+
+# Constantes inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class LibraryWatcher:
+    """
+    Surveille `music_dir` (inotify via ctypes, repli en polling mtime) :
+    changements regroupés (debounce), index bibliothèque rafraîchi puis
+    `on_changes(dossiers relatifs)` appelé pour les mises à jour MPD ciblées.
+    Tout se passe sur ce thread, jamais au moment où l'utilisateur lance
+    la lecture.
+    """
+
+    def __init__(
+        self,
+        library: MusicLibrary,
+        on_changes: Callable[[List[str]], None],
+        debounce: float = 2.0,
+        poll_interval: float = 60.0,
+    ):
+        self.library = library
+        self.on_changes = on_changes
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+        self._libc = None
+        self._watches: Dict[int, str] = {}  # wd → dossier relatif
+        self._pending: Set[str] = set()  # Dossiers à relire dans l'index
+        self._pending_mpd: Set[str] = set()  # Chemins à mettre à jour dans MPD
+        self._last_event = 0.0
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._loop, name="library-watch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def using_inotify(self) -> bool:
+        return self._fd is not None
+
+    # ------------------------------------------------------------------
+    # inotify
+    # ------------------------------------------------------------------
+    def _init_inotify(self) -> bool:
+        try:
+            self._libc = ctypes.CDLL(
+                ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+            )
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"[LIBRARY] inotify indisponible ({e}) → polling")
+            return False
+        if fd < 0:
+            logger.warning(
+                f"[LIBRARY] inotify_init1: {os.strerror(ctypes.get_errno())} → polling"
+            )
+            return False
+        self._fd = fd
+        if not self._add_tree(""):
+            # Limite max_user_watches atteinte : polling plus fiable
+            os.close(fd)
+            self._fd = None
+            self._watches.clear()
+            return False
+        logger.info(f"[LIBRARY] inotify actif ({len(self._watches)} dossiers)")
+        return True
+
+    def _add_tree(self, rel: str) -> bool:
+        """Ajoute une surveillance sur `rel` et ses sous-dossiers."""
+        for dirpath, _, _ in os.walk(self.library.abs_path(rel)):
+            path = os.fsencode(dirpath)
+            wd = self._libc.inotify_add_watch(self._fd, path, WATCH_MASK)
+            if wd < 0:
+                logger.warning(
+                    f"[LIBRARY] inotify_add_watch {dirpath}: "
+                    f"{os.strerror(ctypes.get_errno())}"
+                )
+                return False
+            self._watches[wd] = self.library.rel_path(dirpath)
+        return True
+
+    def _read_events(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Événements perdus → contrôle complet
+                self._pending.add("")
+                self._pending_mpd.add("")
+                continue
+            rel = self._watches.get(wd)
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if rel is None:
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                # Le parent reçoit aussi DELETE/MOVED_FROM : rien de plus ici
+                continue
+            self._pending.add(rel)
+            child = os.path.join(rel, name) if rel else name
+            if mask & (IN_CREATE | IN_MOVED_TO | IN_CLOSE_WRITE):
+                # Ajout/modif : MPD ne relit que l'entrée concernée
+                self._pending_mpd.add(child)
+                if mask & IN_ISDIR:
+                    self._add_tree(child)
+            else:
+                # Suppression : le dossier parent (l'entrée n'existe plus)
+                self._pending_mpd.add(rel)
+        self._last_event = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Thread
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _minimize(dirs: List[str]) -> List[str]:
+        """Supprime les dossiers couverts par un ancêtre déjà dans la liste."""
+        result: List[str] = []
+        for rel in sorted(set(dirs)):
+            if any(
+                parent == "" or rel == parent or rel.startswith(parent + "/")
+                for parent in result
+            ):
+                continue
+            result.append(rel)
+        return result
+
+    def _notify(self, dirs: List[str]) -> None:
+        """Dossiers déjà à jour dans l'index → mises à jour MPD."""
+        targets = self._minimize(dirs)
+        if not targets:
+            return
+        logger.info(f"[LIBRARY] Changements détectés : {targets}")
+        try:
+            self.on_changes(targets)
+        except Exception as e:
+            logger.error(f"[LIBRARY] Erreur mise à jour MPD: {e}")
+
+    def _flush(self) -> None:
+        """Événements regroupés : index (dossiers ciblés) puis MPD."""
+        dirs, targets = list(self._pending), list(self._pending_mpd)
+        self._pending.clear()
+        self._pending_mpd.clear()
+        for rel in self._minimize(dirs):
+            self.library.refresh(self.library.abs_path(rel))
+        self._notify(targets)
+
+    def _loop(self) -> None:
+        # Rattrapage des changements faits hors fonctionnement
+        self._notify(self.library.refresh())
+        inotify = self._init_inotify()
+        next_poll = time.monotonic() + self.poll_interval
+        while self._running:
+            try:
+                now = time.monotonic()
+                if self._pending:
+                    timeout = max(0.0, self._last_event + self.debounce - now)
+                else:
+                    timeout = 1.0 if inotify else max(0.0, next_poll - now)
+                if inotify:
+                    readable, _, _ = select.select([self._fd], [], [], timeout)
+                    if readable:
+                        self._read_events()
+                        continue  # Debounce relancé
+                else:
+                    self._stop_event.wait(timeout)
+
+                now = time.monotonic()
+                if self._pending and now - self._last_event >= self.debounce:
+                    self._flush()
+                if not inotify and now >= next_poll:
+                    next_poll = now + self.poll_interval
+                    self._notify(self.library.refresh())
+            except Exception as e:
+                logger.error(f"[LIBRARY] Erreur surveillance: {e}", exc_info=True)
+                self._stop_event.wait(self.poll_interval)
@@ -11,7 +11,6 @@ class AlarmActivationSwitchesMenu(BaseMenu):
         super().__init__(manager)
         self.alarm_number = alarm_number
         self.start_time = time.time() if alarm_number else None
-        self.last_render_time = 0
         self.switch_pins = {1: 24, 2: 25}
         self.confirmation_mode = False
         self.annulation_mode = False
@@ -130,10 +129,15 @@ class AlarmActivationSwitchesMenu(BaseMenu):
                 self.manager._render()
                 return
 
-        # Throttle render (500ms min)
-        if current_time - self.last_render_time >= 0.5:
-            self.last_render_time = current_time
-            self._render()
+        # Affichage fixe par mode (rendu aux transitions) : réveil planifié
+        # à la fin du mode en cours
+        if self.annulation_mode:
+            duration = 1
+        elif self.desactivation_mode or self.confirmation_mode:
+            duration = 2
+        else:
+            duration = 5
+        self.display.scheduler.schedule(self.start_time + duration - current_time)
 
     def _render(self) -> None:
         """Affiche heure / confirmation / annulation."""
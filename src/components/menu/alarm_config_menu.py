@@ -12,7 +12,6 @@ class AlarmConfigMenu(BaseMenu):
             "Retour",
         ]
         self.manager.selected_option = 0
-        self.last_render_time = 0
 
     def handle_input(self, events: list[dict], blink_interval: float) -> None:
         self._update_blink(blink_interval)
@@ -45,8 +44,8 @@ class AlarmConfigMenu(BaseMenu):
                     )
                 elif self.manager.selected_option == 3:
                     self.manager._switch_to("AlarmSubMenu")
-        if changed and self._should_render():
-            self._render()  # Seulement si changed et temps écoulé
+        if changed:
+            self._render()
 
     def _render(self) -> None:
         self.display.show_menu(self.options, self.manager.selected_option)
@@ -17,24 +17,6 @@ class BaseMenu(ABC):
         self.blink_state: bool = True
         self.last_blink: float = time.time()
 
-    def _should_render(self) -> bool:
-        """
-        Limite les renders à 100ms minimum entre chaque.
-        Évite le flickering et surcharge I2C.
-        """
-        current_time = time.time()
-
-        # Initialise last_render_time si absent
-        if not hasattr(self, "last_render_time"):
-            self.last_render_time = 0
-
-        # Autorise render si 100ms écoulées
-        if current_time - self.last_render_time >= 0.1:
-            self.last_render_time = current_time
-            return True
-
-        return False
-
     @abstractmethod
     def handle_input(self, events: List[Dict[str, str]], blink_interval: float) -> None:
         """Traite les événements et gère les transitions."""
@@ -48,10 +30,13 @@ class BaseMenu(ABC):
     def _update_blink(
         self, blink_interval: float, fields_to_blink: bool = False
     ) -> bool:
-        """Gère le clignotement si applicable."""
+        """Gère le clignotement si applicable (prochaine bascule planifiée)."""
+        if not fields_to_blink:
+            return False
         current_time = time.time()
-        if fields_to_blink and current_time - self.last_blink >= blink_interval:
+        toggled = current_time - self.last_blink >= blink_interval
+        if toggled:
             self.blink_state = not self.blink_state
             self.last_blink = current_time
-            return True
-        return False
+        self.display.scheduler.schedule(self.last_blink + blink_interval - current_time)
+        return toggled
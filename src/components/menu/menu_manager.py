@@ -91,8 +91,6 @@ class MenuManager:
         self.alarm2_station_index: Optional[int] = None
         self.time_initialized: bool = False
         self.date_initialized: bool = False
-        self.last_update: float = time.time()  # Dernière mise à jour de l'affichage
-        self.update_interval: float = 1.0  # Intervalle de mise à jour
         self.alarm_stopped_recently: bool = (
             False  # Flag pour éviter les actions répétées après un arrêt d'alarme
         )
@@ -130,6 +128,9 @@ class MenuManager:
         self.last_music_info = None  # Dernières infos musicales
         self.last_rendered_state = None  # Ajout dirty flag
         self.screen_just_woken = False  #  NOUVEAU : Flag réveil écran
+        self.status_message: Optional[str] = None  # Message prioritaire (chargement/erreur)
+        self.status_message_until: Optional[float] = None  # None = jusqu'à effacement
+        self.audio_pending = 0  # Commandes run_audio pas encore terminées
         self.load_params()  # Charge les paramètres sauvegardés
         self._load_alarm_states()  # Charge les états des alarmes
         self.mpd_unavailable = self.audio_manager.mpd_unavailable  # Sync flag MPD down
@@ -240,9 +241,7 @@ class MenuManager:
             current_time = time.time()
             if self.current_menu is None:
                 # ===== MODE NORMAL (pas de menu ouvert) =====
-                if current_time - self.last_update >= self.update_interval:
-                    self.last_update = current_time
-                    self._render()
+                # (heure : trame demandée par le coordinateur à chaque minute)
                 # Timeout affichage infos musique
                 if current_time - self.last_activity > self.settings["menu_timeout"]:
                     self.temp_info = None
@@ -287,7 +286,7 @@ class MenuManager:
                             elif event_type == "long_press":
                                 self.current_station_name = None
                                 self.current_station_index = None
-                                self.audio_manager.stop()
+                                self.audio_manager.submit(self.audio_manager.stop)
                                 self.music_source = None
                                 self.current_menu = None
                                 self.alarm_stopped_recently = False
@@ -336,14 +335,21 @@ class MenuManager:
                                 )
                                 + delta
                             ) % len(self.webradio_stations)
+                            # Saute les stations connues HS (sonde santé)
+                            alive = self.audio_manager.prober.next_alive(
+                                next_index, delta
+                            )
+                            if alive is not None:
+                                next_index = alive
                             self.current_station_index = next_index
                             self.current_station_name = self.webradio_stations[
                                 next_index
                             ]["name"]
-                            self.audio_manager.play_webradio_station(next_index)
-                            self.temp_info = self.get_current_music_info()
-                            self.temp_display_start = current_time
-                            self._render()
+                            self.run_audio(
+                                self.audio_manager.play_webradio_station,
+                                next_index,
+                                on_done=self._on_webradio_started,
+                            )
                     else:
                         self.reset_activity()
             else:
@@ -373,8 +379,19 @@ class MenuManager:
             self.time_manager.get_time()
         )  # Ligne 1: Calcul heure en premier (pour dirty flag)
         try:  # Ligne 3: Début try (englobe tout)
+            current_time = time.time()
+            # Message prioritaire expiré : effacé avant le dirty flag
+            if (
+                self.status_message is not None
+                and self.status_message_until is not None
+                and current_time > self.status_message_until
+            ):
+                self.status_message = None
+                self.status_message_until = None
+
             # Calcule hash état actuel
             current_state = (  # Lignes 5-11: Tuple dirty flag (inchangé)
+                self.status_message,
                 self.current_menu.__class__.__name__ if self.current_menu else None,
                 str(self.temp_info) if self.temp_info else None,  # Stringify dict/str
                 self.audio_manager.music_playing,
@@ -387,8 +404,12 @@ class MenuManager:
                 return
             self.last_rendered_state = current_state  # Ligne 16
 
+            # Message prioritaire (chargement audio, erreur lecture)
+            if self.status_message is not None:
+                self.display.show_settings(self.status_message, None, True)
+                return
+
             # Ligne 18: Reset centralisé temp_info AVANT check musique (clé pour fixer la boucle)
-            current_time = time.time()
             if (
                 self.temp_display_start is not None
                 and self.temp_info is not None
@@ -445,6 +466,37 @@ class MenuManager:
         except Exception as e:  # Ligne 69: Except aligne avec try (couvre tout)
             print(f"Erreur lors du rafraîchissement de l'affichage: {e}")
 
+    def show_message(self, text: Optional[str], duration: Optional[float] = None) -> None:
+        """Affiche un message prioritaire (None efface) ; duration=None : permanent."""
+        self.status_message = text
+        self.status_message_until = (
+            time.time() + duration if text is not None and duration else None
+        )
+        if self.status_message_until is not None:
+            # Trame d'effacement planifiée (sinon rien ne change d'ici là)
+            self.display.scheduler.schedule(duration + 0.01)
+        self._render()
+
+    def run_audio(self, fn, *args, on_done=None, loading_text="Chargement...") -> None:
+        """
+        Lance une commande audio sur le worker sans bloquer la boucle :
+        affiche "Chargement..." puis rappelle on_done(résultat).
+        """
+
+        def _finish(result) -> None:
+            # Garde le message tant qu'une autre commande du menu est en file
+            # (les tâches internes du worker, prearm, watchdog..., n'en sont pas)
+            self.audio_pending -= 1
+            if self.status_message == loading_text and self.audio_pending == 0:
+                self.status_message = None
+            if on_done is not None:
+                on_done(result)
+            self._render()
+
+        self.audio_pending += 1
+        self.show_message(loading_text)
+        self.audio_manager.submit(fn, *args, on_done=_finish)
+
     def show_temp_alarm(self, alarm_num: int) -> None:
         """Affiche temporairement le menu d'activation/désactivation de l'alarme."""
         try:
@@ -475,13 +527,46 @@ class MenuManager:
             }
 
     def play_webradio_station(self, index: int):
-        """Joue une station de radio spécifique."""
+        """Joue une station de radio spécifique (non bloquant, via worker audio)."""
         try:
             if index >= len(self.webradio_stations):
                 return
-            self.audio_manager.play_webradio_station(index)
             self.current_station_index = index
             self.current_station_name = self.webradio_stations[index]["name"]
             self.music_source = "webradio"
+            self.run_audio(
+                self.audio_manager.play_webradio_station,
+                index,
+                on_done=self._on_webradio_started,
+            )
         except Exception as e:
             print(f"Erreur lors de la lecture de la station webradio: {e}")
+
+    def on_stream_recovered(self, mode: Optional[str]) -> None:
+        """Fin d'incident flux webradio (watchdog, boucle principale)."""
+        if mode is None:
+            self.music_source = None
+            if self.alarm_manager.is_alarm_active:
+                # Alarme sans aucune source audio : buzzer
+                self.alarm_manager.start_buzzer()
+            else:
+                self.show_message("Erreur lecture", 2.0)
+            return
+        self.music_source = mode
+        self.current_station_index = self.audio_manager.current_station_index
+        self.current_station_name = self.audio_manager.current_station_name
+        if self.alarm_manager.is_alarm_active:
+            self.alarm_manager.active_alarm_mode = mode
+        self.temp_info = self.get_current_music_info()
+        self.temp_display_start = time.time()
+        self._render()
+
+    def _on_webradio_started(self, success: bool) -> None:
+        """Résultat lancement webradio (boucle principale)."""
+        if not success:
+            if not self.audio_manager.music_playing:
+                self.music_source = None
+            self.show_message("Erreur lecture", 2.0)
+            return
+        self.temp_info = self.get_current_music_info()
+        self.temp_display_start = time.time()
@@ -1,6 +1,4 @@
-import subprocess
 import time
-import re
 from .base_menu import BaseMenu
 
 
@@ -9,40 +7,16 @@ class MusicPlayerMenu(BaseMenu):
         super().__init__(manager)
 
     def get_current_info(self):
-        try:
-            # Récupérer status pour position/duration
-            status_output = (
-                subprocess.check_output(["mpc", "status"], stderr=subprocess.PIPE)
-                .decode()
-                .strip()
-            )
-            # Parser temps avec regex (ex: [playing] #1/1   1:30/3:00 (50%))
-            time_match = re.search(r"(\d+:\d+)/(\d+:\d+)", status_output)
-            current = time_match.group(1) if time_match else "00:00"
-            total = time_match.group(2) if time_match else "00:00"
-
-            # Récupérer artist/title
-            current_output = (
-                subprocess.check_output(
-                    ["mpc", "current", "--format", "%artist% - %title%"],
-                    stderr=subprocess.PIPE,
-                )
-                .decode()
-                .strip()
-            )
-            if not current_output or current_output == "-":
-                artist = "Inconnu"
-                title = "Inconnu"
-            else:
-                artist, title = (
-                    current_output.split(" - ", 1)
-                    if " - " in current_output
-                    else ("Inconnu", current_output)
-                )
-
-            return f"Carte SD\nArtiste: {artist}\nTitre: {title}\n{current}/{total}"
-        except subprocess.CalledProcessError:
+        # Lecture du miroir d'état MPD (idle) : aucune requête
+        state = self.manager.audio_manager.state
+        if not state.connected:
             return "Carte SD\nArtiste: Inconnu\nTitre: Inconnu\n00:00/00:00"
+        fmt = self.manager.audio_manager.format_seconds
+        current = fmt(int(state.elapsed()))
+        total = fmt(int(state.duration()))
+        artist = state.song.get("Artist") or "Inconnu"
+        title = state.song.get("Title") or "Inconnu"
+        return f"Carte SD\nArtiste: {artist}\nTitre: {title}\n{current}/{total}"
 
     def handle_input(self, events: list[dict], blink_interval: float) -> None:
         _ = blink_interval  # Inutilisé ici
@@ -1,5 +1,4 @@
 from .base_menu import BaseMenu
-import time
 
 
 class MusicSourceMenu(BaseMenu):
@@ -9,7 +8,6 @@ class MusicSourceMenu(BaseMenu):
         super().__init__(manager)
         self.options = ["Carte SD", "Webradio", "Retour"]
         self.manager.selected_option = 0  # Par défaut SD
-        self.last_render_time = 0  # Ajout pour debounce
 
     def handle_input(self, events: list[dict], blink_interval: float) -> None:
         self._update_blink(blink_interval)
@@ -46,13 +44,7 @@ class MusicSourceMenu(BaseMenu):
                 elif selected == 2:  # Retour
                     self.manager._switch_to("MainMenu")
                 changed = True
-        current_time = time.time()
-        if (
-            changed
-            and self.manager.current_menu == self
-            and current_time - self.last_render_time >= 0.1
-        ):
-            self.last_render_time = current_time
+        if changed and self.manager.current_menu == self:
             self._render()
 
     def _render(self) -> None:
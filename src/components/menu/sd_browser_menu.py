@@ -11,29 +11,17 @@ class SDBrowserMenu(BaseMenu):
         self.current_path = current_path
         self.options = self._list_directory() + ["Retour"]
         self.manager.selected_option = 0
-        self.last_render_time = (
-            0  # Ajout pour limiter les rendus redondants lors des transitions
-        )
 
     def _list_directory(self) -> list[str]:
-        """Liste dossiers et fichiers triés, avec icônes."""
-        try:
-            items = os.listdir(self.current_path)
-        except OSError as e:
-            print(f"Erreur lecture dossier {self.current_path}: {e}")
+        """Liste dossiers et fichiers triés, avec icônes (index bibliothèque)."""
+        library = self.manager.audio_manager.library
+        if not library.is_dir(self.current_path):
+            print(f"Erreur lecture dossier {self.current_path}: absent de l'index")
             return ["Erreur dossier", "Retour"]
 
-        dirs = [
-            f"📁 {item}"
-            for item in items
-            if os.path.isdir(os.path.join(self.current_path, item))
-        ]
-        files = [
-            f"🎵 {item}"
-            for item in items
-            if os.path.isfile(os.path.join(self.current_path, item))
-        ]
-        return sorted(dirs) + sorted(files)  # Dossiers en haut
+        dirs, files = library.list_dir(self.current_path)
+        # Dossiers en haut
+        return [f"📁 {item}" for item in dirs] + [f"🎵 {item}" for item in files]
 
     def handle_input(self, events: list[dict], blink_interval: float) -> None:
         self._update_blink(blink_interval)
@@ -81,44 +69,28 @@ class SDBrowserMenu(BaseMenu):
                         )
 
                     item_path = os.path.join(self.current_path, item_name)
+                    library = self.manager.audio_manager.library
 
-                    if os.path.isdir(item_path):
+                    if library.is_dir(item_path):
                         # Entre dans le dossier
                         self.manager._switch_to("SDBrowserMenu", current_path=item_path)
                         changed = True
-                    elif os.path.isfile(
+                    elif library.is_file(
                         item_path
                     ):  #  Aligné avec if (indent 20 espaces)
-                        # Lecture séquentielle du dossier depuis le début
+                        # Lecture séquentielle du dossier (worker audio, non bloquant)
                         filename = os.path.basename(item_path)
-                        if self.manager.audio_manager.play_file_sequential(
-                            item_path, self.current_path
-                        ):
-                            self.manager.music_source = "sd"
-                            self.manager.music_start_time = time.time()
-                            #  Init dict minimal (trigger coordinator pour full après 1s, évite doublon simple)
-                            self.manager.temp_info = {
-                                "artist": "Chargement...",
-                                "title": filename,
-                                "elapsed": "0:00",
-                                "total": "0:00",
-                                "progress": 0.0,
-                                "is_playing": True,
-                                "source": "sd",
-                            }
-                            self.manager.temp_display_start = time.time()
-                            self.manager.current_menu = None
-                            # Pas de _render() : coordinator gère (évite conflit UI)
-                        else:
-                            self.display.show_settings("Erreur lecture", None, True)
-                            time.sleep(2)
-                            self.manager.current_menu = None
-                            self.manager._render()  # Seul sur erreur
+                        self.manager.current_menu = None
+                        self.manager.run_audio(
+                            self.manager.audio_manager.play_file_sequential,
+                            item_path,
+                            self.current_path,
+                            on_done=lambda ok: self._on_play_done(ok, filename),
+                        )
                         changed = True
                     else:  #  Aligné avec if/elif (indent 20 espaces, pour item invalide)
                         # Item invalide (fichier supprimé entre temps)
-                        self.display.show_settings("Fichier absent", None, True)
-                        time.sleep(1)
+                        self.manager.show_message("Fichier absent", 1.0)
                         changed = True
 
             elif button == "menu" and event_type == "long_press":
@@ -133,15 +105,28 @@ class SDBrowserMenu(BaseMenu):
                         self.manager._switch_to("SDCardMenu")
                 changed = True
 
-        current_time = time.time()
-        if (
-            changed
-            and self.manager.current_menu == self
-            and current_time - self.last_render_time >= 0.1
-        ):
-            self.last_render_time = current_time
+        if changed and self.manager.current_menu == self:
             self._render()
 
+    def _on_play_done(self, success: bool, filename: str) -> None:
+        """Résultat play_file_sequential (boucle principale, via worker)."""
+        if success:
+            self.manager.music_source = "sd"
+            self.manager.music_start_time = time.time()
+            #  Init dict minimal (coordinator complète via le miroir MPD)
+            self.manager.temp_info = {
+                "artist": "Chargement...",
+                "title": filename,
+                "elapsed": "0:00",
+                "total": "0:00",
+                "progress": 0.0,
+                "is_playing": True,
+                "source": "sd",
+            }
+            self.manager.temp_display_start = time.time()
+        else:
+            self.manager.show_message("Erreur lecture", 2.0)
+
     def _render(self) -> None:
         """Affiche le menu du navigateur de fichiers."""
         self.display.show_menu(self.options, self.manager.selected_option)
@@ -6,7 +6,6 @@ class SetAlarmMenu(BaseMenu):
         super().__init__(manager)
         self.alarm_number = alarm_number
         self.mode = mode  # "hour" ou "minute"
-        self.last_render_time = 0
 
     def handle_input(self, events: list[dict], blink_interval: float) -> None:
         if self._update_blink(blink_interval, fields_to_blink=True):
@@ -84,9 +83,6 @@ class SetAlarmMenu(BaseMenu):
                     self.manager.current_menu = None
                     changed = True
 
-        if changed and self._should_render():
-            self._render()
-
         if changed:
             self._render()
 
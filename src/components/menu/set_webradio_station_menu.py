@@ -8,8 +8,11 @@ class SetWebradioStationMenu(BaseMenu):
         super().__init__(manager)
         self.alarm_number = alarm_number
         self.mode = mode
+        # Stations connues HS (sonde santé) marquées
+        prober = self.manager.audio_manager.prober
         self.options = [
-            station["name"] for station in self.manager.webradio_stations
+            station["name"] + (" (HS)" if prober.is_alive(i) is False else "")
+            for i, station in enumerate(self.manager.webradio_stations)
         ] + ["Retour"]
         if not self.manager.webradio_stations:
             self.options = ["Pas de stations webradio", "Retour"]
@@ -27,19 +30,26 @@ class SetWebradioStationMenu(BaseMenu):
         self._render()
 
     def play_station(self, index: int) -> bool:
+        """Lance la station sur le worker audio (non bloquant)."""
         if index >= len(self.manager.webradio_stations):
             return False
-        try:
-            if self.manager.audio_manager.play_webradio_station(index):
-                self.manager.current_station_index = index
-                self.manager.current_station_name = self.manager.webradio_stations[
-                    index
-                ]["name"]
-                self.manager.music_source = "webradio"
-                return True
-            return False
-        except Exception:
-            return False
+        self.manager.play_webradio_station(index)
+        return True
+
+    def _step_selection(self, step: int) -> None:
+        """Déplace la sélection ; en lecture, saute les stations connues HS."""
+        prober = self.manager.audio_manager.prober
+        stations = len(self.manager.webradio_stations)
+        selected = self.manager.selected_option
+        for _ in range(len(self.options)):
+            selected = (selected + step) % len(self.options)
+            if (
+                self.mode == "config"
+                or selected >= stations
+                or prober.is_alive(selected) is not False
+            ):
+                break
+        self.manager.selected_option = selected
 
     def handle_input(self, events: List[Dict[str, str]], blink_interval: float) -> None:
         super().handle_input(events, blink_interval)
@@ -49,14 +59,10 @@ class SetWebradioStationMenu(BaseMenu):
             button = event["button"]
             event_type = event["type"]
             if button == "up" and event_type == "short_press":
-                self.manager.selected_option = (self.manager.selected_option - 1) % len(
-                    self.options
-                )
+                self._step_selection(-1)
                 changed = True
             elif button == "down" and event_type == "short_press":
-                self.manager.selected_option = (self.manager.selected_option + 1) % len(
-                    self.options
-                )
+                self._step_selection(1)
                 changed = True
             elif button == "menu" and event_type == "short_press":
                 selected = self.manager.selected_option
@@ -99,10 +105,7 @@ class SetWebradioStationMenu(BaseMenu):
                             self.manager.alarm_manager.alarm_states[
                                 self.alarm_manager.active_alarm
                             ]["station_index"] = index
-                        self.manager.temp_info = (
-                            self.manager.get_current_music_info()
-                        )  # Précharge
-                        self.manager.temp_display_start = time.time()
+                        # Infos musique chargées à la fin du worker (_on_webradio_started)
                         self.manager.current_menu = None  # Retour à normal
                         self.manager._render()  # Force affichage
         if changed:
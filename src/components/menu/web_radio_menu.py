@@ -1,8 +1,6 @@
 import json
-import subprocess
 import time
 import os
-import re
 from .base_menu import BaseMenu
 
 WEBRADIOS_FILE = "/home/reveil/webradios.json"
@@ -17,7 +15,6 @@ class WebRadioMenu(BaseMenu):
         self.current_station_index = None
         self.last_info_time = 0
         self.current_info = "Chargement..."
-        self.last_render_time = 0  # Ajout pour debounce
 
     def load_stations(self):
         if not os.path.exists(WEBRADIOS_FILE):
@@ -32,38 +29,18 @@ class WebRadioMenu(BaseMenu):
         # Attendre 2s après changement de station pour métadonnées stables
         if time.time() - self.last_info_time < 2.0:
             return self.current_info  # Garde "Chargement..." ou dernier état
-        try:
-            # Récupérer status pour position
-            status_output = (
-                subprocess.check_output(["mpc", "status"], stderr=subprocess.PIPE)
-                .decode()
-                .strip()
-            )
-            # Parser temps avec regex (ex: 1:30/Streaming ou sans total)
-            time_match = re.search(r"(\d+:\d+)", status_output)
-            current = time_match.group(1) if time_match else "00:00"
-
-            # Récupérer titre
-            current_output = (
-                subprocess.check_output(
-                    ["mpc", "current", "--format", "%title%"],
-                    stderr=subprocess.PIPE,
-                )
-                .decode()
-                .strip()
-            )
-            title = (
-                current_output if current_output and current_output != "" else "Inconnu"
-            )
-
-            return f"Webradio\nStation: {self.stations[self.current_station_index]['name']}\nTitre: {title}\n{current}/Streaming"
-        except subprocess.CalledProcessError:
+        # Lecture du miroir d'état MPD (idle) : aucune requête
+        state = self.manager.audio_manager.state
+        if not state.connected:
             return "Webradio\nStation: Inconnu\nTitre: Inconnu\n00:00/Streaming"
+        current = self.manager.audio_manager.format_seconds(int(state.elapsed()))
+        title = state.song.get("Title") or "Inconnu"
+        return f"Webradio\nStation: {self.stations[self.current_station_index]['name']}\nTitre: {title}\n{current}/Streaming"
 
     def play_station(self, index):
         if index >= len(self.stations):
             return
-        self.manager.audio_manager.play_webradio_station(index)
+        self.manager.run_audio(self.manager.audio_manager.play_webradio_station, index)
         self.manager.music_source = "webradio"
         self.current_station_index = index
         self.manager.current_station_name = self.stations[index]["name"]
@@ -125,13 +102,7 @@ class WebRadioMenu(BaseMenu):
             self.current_info = self.get_current_info()
             self.last_info_time = current_time
             changed = True
-        # Remplacer if changed: self._render() par ceci
-        if (
-            changed
-            and self.manager.current_menu == self
-            and current_time - self.last_render_time >= 0.1
-        ):
-            self.last_render_time = current_time
+        if changed and self.manager.current_menu == self:
             self._render()
 
     def _render(self) -> None:
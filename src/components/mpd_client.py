@@ -0,0 +1,290 @@
+import select
+import socket
+import threading
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Codes ACK MPD utiles (voir protocole MPD, "ack.h")
+ACK_ERROR_NO_EXIST = 50
+
+
+class MPDError(Exception):
+    """Erreur générique du client MPD."""
+
+
+class MPDConnectionError(MPDError):
+    """Socket MPD injoignable ou connexion perdue."""
+
+
+class MPDCommandError(MPDError):
+    """Réponse ACK de MPD (commande refusée)."""
+
+    def __init__(self, code: int, index: int, command: str, message: str):
+        super().__init__(f"[{code}@{index}] {{{command}}} {message}")
+        self.code = code
+        self.index = index
+        self.command = command
+        self.message = message
+
+
+class MPDClient:
+    """
+    Client MPD persistant : une seule connexion (socket Unix ou TCP)
+    réutilisée par toutes les commandes, reconnexion auto sur échec.
+    Remplace les appels `mpc` (un fork/exec par commande).
+    """
+
+    def __init__(self, socket_path: str = "/run/mpd/socket", timeout: float = 2.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.mpd_version: Optional[str] = None
+        self._sock: Optional[socket.socket] = None
+        self._rfile = None
+        self._last_ack: Optional[MPDCommandError] = None  # ACK du dernier lot
+        self._lock = threading.RLock()  # Partagé entre boucle principale et callbacks GPIO
+
+    # ------------------------------------------------------------------
+    # Connexion
+    # ------------------------------------------------------------------
+    def connect(self) -> None:
+        """Ouvre la connexion et lit la bannière 'OK MPD x.y.z'."""
+        with self._lock:
+            self.close()
+            try:
+                if self.socket_path.startswith("/"):
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.settimeout(self.timeout)
+                    sock.connect(self.socket_path)
+                else:
+                    # Format "host:port" (port 6600 par défaut)
+                    host, _, port = self.socket_path.partition(":")
+                    sock = socket.create_connection(
+                        (host, int(port or 6600)), timeout=self.timeout
+                    )
+                    sock.settimeout(self.timeout)
+                self._sock = sock
+                self._rfile = sock.makefile("rb")
+                banner = self._read_line()
+                if not banner.startswith("OK MPD "):
+                    raise MPDConnectionError(f"Bannière inattendue: '{banner}'")
+                self.mpd_version = banner[len("OK MPD ") :]
+            except OSError as e:
+                self.close()
+                raise MPDConnectionError(f"Connexion {self.socket_path}: {e}") from e
+            except MPDError:
+                self.close()
+                raise
+
+    def close(self) -> None:
+        """Ferme la connexion (silencieux si déjà fermée)."""
+        with self._lock:
+            for obj in (self._rfile, self._sock):
+                try:
+                    if obj is not None:
+                        obj.close()
+                except OSError:
+                    pass
+            self._rfile = None
+            self._sock = None
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    # ------------------------------------------------------------------
+    # Protocole texte
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _quote(arg) -> str:
+        """Échappe un argument (guillemets + backslash)."""
+        text = str(arg).replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{text}"'
+
+    def _format_command(self, name: str, *args) -> str:
+        parts = [name] + [self._quote(a) for a in args]
+        return " ".join(parts) + "\n"
+
+    def _read_line(self) -> str:
+        if self._rfile is None:
+            raise MPDConnectionError("Non connecté")
+        raw = self._rfile.readline()
+        if not raw:
+            raise MPDConnectionError("Connexion fermée par MPD")
+        return raw.decode("utf-8", errors="replace").rstrip("\n")
+
+    @staticmethod
+    def _parse_ack(line: str) -> MPDCommandError:
+        # Format : ACK [code@index] {commande} message
+        try:
+            head, _, message = line[4:].partition("] ")
+            code_str, _, index_str = head.lstrip("[").partition("@")
+            command, _, message = message.partition("} ")
+            return MPDCommandError(
+                int(code_str), int(index_str), command.lstrip("{"), message
+            )
+        except ValueError:
+            return MPDCommandError(0, 0, "", line)
+
+    def _read_pairs(self) -> List[Tuple[str, str]]:
+        """Lit une réponse jusqu'à OK (ou lève MPDCommandError sur ACK)."""
+        pairs: List[Tuple[str, str]] = []
+        while True:
+            line = self._read_line()
+            if line == "OK":
+                return pairs
+            if line.startswith("ACK "):
+                raise self._parse_ack(line)
+            key, _, value = line.partition(": ")
+            pairs.append((key, value))
+
+    def _send(self, data: str) -> None:
+        if self._sock is None:
+            raise MPDConnectionError("Non connecté")
+        self._sock.sendall(data.encode("utf-8"))
+
+    def _stale(self) -> bool:
+        """
+        Connexion morte avant envoi : entre deux commandes, rien ne doit
+        être lisible ; EOF (MPD a fermé, connection_timeout) ou données
+        orphelines → reconnexion.
+        """
+        try:
+            readable, _, _ = select.select([self._sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _send_request(self, request: str) -> None:
+        """
+        Envoie une requête, avec reconnexion + 1 retry tant que rien n'a
+        pu être écrit (connexion absente, morte ou refusant l'écriture).
+        """
+        for attempt in range(2):
+            try:
+                if self._sock is None or self._stale():
+                    self.connect()
+                self._send(request)
+                return
+            except (OSError, MPDConnectionError) as e:
+                self.close()
+                if attempt == 1:
+                    raise MPDConnectionError(str(e)) from e
+                logger.debug(f"[MPD] Connexion perdue ({e}) → reconnexion")
+
+    def command(self, name: str, *args, retry: bool = False) -> List[Tuple[str, str]]:
+        """
+        Exécute une commande et retourne les paires (clé, valeur).
+        Requête jamais renvoyée une fois écrite (timeout ou EOF pendant la
+        réponse → MPDConnectionError) : une commande peut avoir été
+        exécutée. retry=True (commandes en lecture seule : status, ping...)
+        autorise un second envoi sur connexion neuve.
+        """
+        request = self._format_command(name, *args)
+        with self._lock:
+            for attempt in range(2 if retry else 1):
+                try:
+                    self._send_request(request)
+                    return self._read_pairs()
+                except MPDCommandError:
+                    raise
+                except (OSError, MPDConnectionError) as e:
+                    self.close()
+                    if attempt == 1 or not retry:
+                        raise MPDConnectionError(f"{name}: {e}") from e
+                    logger.debug(f"[MPD] {name}: réponse perdue ({e}) → renvoi")
+        raise MPDConnectionError(name)  # Inatteignable (satisfait le typage)
+
+    def command_list(self, commands: List[tuple]) -> List[Optional[MPDCommandError]]:
+        """
+        Exécute un lot de commandes en une transaction (command_list_ok_begin).
+        Retourne une entrée par commande : None si OK, sinon l'erreur ACK.
+        MPD interrompt la liste au premier ACK : le reste est renvoyé dans
+        une nouvelle transaction (1 aller-retour + 1 par échec). Connexion
+        perdue une fois le lot écrit : MPDConnectionError, rien n'est
+        renvoyé (commandes peut-être déjà exécutées, ex. addid).
+        """
+        results: List[Optional[MPDCommandError]] = []
+        remaining = list(commands)
+        with self._lock:
+            while remaining:
+                request = "command_list_ok_begin\n"
+                request += "".join(self._format_command(*cmd) for cmd in remaining)
+                request += "command_list_end\n"
+                try:
+                    self._send_request(request)
+                    done = self._read_list_ok()
+                except (OSError, MPDConnectionError) as e:
+                    self.close()
+                    raise MPDConnectionError(f"command_list: {e}") from e
+                results.extend([None] * done)
+                if done == len(remaining):
+                    break
+                # Commande en échec à l'index "done" (ACK déjà lu)
+                results.append(self._last_ack)
+                remaining = remaining[done + 1 :]
+        return results
+
+    def _read_list_ok(self) -> int:
+        """Compte les list_OK ; s'arrête sur OK final ou ACK (stocké)."""
+        done = 0
+        self._last_ack = None
+        while True:
+            line = self._read_line()
+            if line == "list_OK":
+                done += 1
+            elif line == "OK":
+                return done
+            elif line.startswith("ACK "):
+                self._last_ack = self._parse_ack(line)
+                return done  # = index de la commande refusée
+            # Autres lignes (réponses de commandes) ignorées pour les lots
+
+    # ------------------------------------------------------------------
+    # Accès bas niveau (commandes longues type "idle")
+    # ------------------------------------------------------------------
+    def send_command(self, name: str, *args) -> None:
+        """Envoie une commande sans lire la réponse (voir read_response)."""
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self.connect()
+                self._send(self._format_command(name, *args))
+            except OSError as e:
+                self.close()
+                raise MPDConnectionError(f"{name}: {e}") from e
+
+    def read_response(self) -> List[Tuple[str, str]]:
+        """Lit la réponse d'une commande envoyée par send_command."""
+        with self._lock:
+            try:
+                return self._read_pairs()
+            except OSError as e:
+                self.close()
+                raise MPDConnectionError(str(e)) from e
+
+    def fileno(self) -> int:
+        """Descripteur du socket (pour select), -1 si déconnecté."""
+        return self._sock.fileno() if self._sock is not None else -1
+
+    # ------------------------------------------------------------------
+    # Raccourcis
+    # ------------------------------------------------------------------
+    def command_dict(self, name: str, *args) -> Dict[str, str]:
+        """Commande dont la réponse est un objet unique (status, currentsong...)."""
+        return dict(self.command(name, *args, retry=True))
+
+    def status(self) -> Dict[str, str]:
+        return self.command_dict("status")
+
+    def currentsong(self) -> Dict[str, str]:
+        return self.command_dict("currentsong")
+
+    def ping(self) -> bool:
+        """True si MPD répond (reconnexion incluse)."""
+        try:
+            self.command("ping", retry=True)
+            return True
+        except MPDError:
+            return False
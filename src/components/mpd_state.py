@@ -0,0 +1,175 @@
+import select
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+from src.components.mpd_client import MPDClient, MPDError
+from src.components.playback_clock import PlaybackClock
+
+logger = logging.getLogger(__name__)
+
+
+class MPDStateMirror:
+    """
+    Miroir en mémoire de l'état MPD (status + currentsong).
+    Thread dédié avec sa propre connexion, abonné à
+    `idle player mixer playlist database` : aucune requête entre deux
+    changements réels ("database" : fin d'une mise à jour de la base).
+    """
+
+    SUBSYSTEMS = ("player", "mixer", "playlist", "database")
+    DRIFT_CHECK_INTERVAL = 30.0  # Recalage de l'horloge en lecture (secondes)
+    DRIFT = "drift"  # Pseudo sous-système : status relu pour contrôle de dérive
+
+    def __init__(self, socket_path: str = "/run/mpd/socket"):
+        self.client = MPDClient(socket_path, timeout=2.0)
+        self.connected = False
+        self.version = 0  # Incrémenté à chaque changement de snapshot
+        self._status: Dict[str, str] = {}
+        self._song: Dict[str, str] = {}
+        self._status_time = 0.0  # time.monotonic() du dernier status lu
+        self._drift_interval = self.DRIFT_CHECK_INTERVAL
+        self._snapshot: Tuple[float, Dict[str, str]] = (0.0, {})
+        # Temps écoulé / progression extrapolés localement (sans requête)
+        self.clock = PlaybackClock()
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._retry_delay = 1.0
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._loop, name="mpd-state", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        self.client.close()
+
+    def set_drift_interval(self, seconds: Optional[float] = None) -> None:
+        """
+        Période du contrôle de dérive en lecture (None : défaut). Raccourcie
+        pendant un flux webradio : un flux figé n'émet aucun événement idle.
+        """
+        self._drift_interval = seconds or self.DRIFT_CHECK_INTERVAL
+
+    def add_listener(self, callback: Callable[[List[str]], None]) -> None:
+        """Callback(changed_subsystems) appelé depuis le thread miroir."""
+        self._listeners.append(callback)
+
+    # ------------------------------------------------------------------
+    # Lecture (thread-safe : dicts remplacés en bloc, jamais modifiés)
+    # ------------------------------------------------------------------
+    @property
+    def status(self) -> Dict[str, str]:
+        return self._status
+
+    @property
+    def snapshot(self) -> Tuple[float, Dict[str, str]]:
+        """(time.monotonic() de lecture, status brut MPD), cohérents."""
+        return self._snapshot
+
+    @property
+    def song(self) -> Dict[str, str]:
+        return self._song
+
+    @property
+    def state(self) -> Optional[str]:
+        """"play", "pause", "stop" ou None si MPD injoignable."""
+        return self._status.get("state")
+
+    def elapsed(self) -> float:
+        """Temps écoulé extrapolé par l'horloge locale (sans requête)."""
+        return self.clock.elapsed()
+
+    def duration(self) -> float:
+        return self.clock.duration()
+
+    # ------------------------------------------------------------------
+    # Thread
+    # ------------------------------------------------------------------
+    def _refresh(self, changed: List[str]) -> None:
+        """Relit status (+ currentsong si player/playlist) et publie."""
+        status = self.client.status()
+        self._status_time = time.monotonic()
+        if not changed or "player" in changed or "playlist" in changed:
+            self._song = self.client.currentsong()
+        drift = self.clock.sync(status, self._song)
+        if changed == [self.DRIFT] and abs(drift) > 1.0:
+            logger.info(f"[MPD] Horloge lecture recalée ({drift:+.1f}s)")
+        self._status = status
+        self._snapshot = (self._status_time, status)
+        self.version += 1
+        for callback in self._listeners:
+            try:
+                callback(changed)
+            except Exception as e:
+                logger.error(f"[MPD] Erreur listener miroir: {e}")
+
+    def _wait_idle(self) -> Optional[List[str]]:
+        """
+        Attend un événement idle. Retourne la liste des sous-systèmes
+        modifiés ([DRIFT] au contrôle de dérive périodique en lecture),
+        ou None si arrêt demandé.
+        """
+        self.client.send_command("idle", *self.SUBSYSTEMS)
+        while self._running:
+            readable, _, _ = select.select([self.client.fileno()], [], [], 1.0)
+            if readable:
+                pairs = self.client.read_response()
+                return [value for key, value in pairs if key == "changed"]
+            if (
+                self.clock.playing
+                and time.monotonic() - self._status_time >= self._drift_interval
+            ):
+                # Sortie d'idle (un événement peut arriver en même temps)
+                self.client.send_command("noidle")
+                pairs = self.client.read_response()
+                changed = [value for key, value in pairs if key == "changed"]
+                return changed or [self.DRIFT]
+        # Arrêt : libère la connexion proprement
+        try:
+            self.client.send_command("noidle")
+            self.client.read_response()
+        except MPDError:
+            pass
+        return None
+
+    def _loop(self) -> None:
+        while self._running:
+            try:
+                self.client.connect()
+                self._refresh([])
+                if not self.connected:
+                    logger.info("[MPD] Miroir état connecté (idle)")
+                self.connected = True
+                self._retry_delay = 1.0
+                while self._running:
+                    changed = self._wait_idle()
+                    if changed is None:
+                        break
+                    self._refresh(changed)
+            except (MPDError, OSError) as e:
+                if self.connected:
+                    logger.warning(f"[MPD] Miroir état déconnecté: {e}")
+                self.connected = False
+                self._status = {}
+                self._snapshot = (time.monotonic(), {})
+                self._song = {}
+                self.clock.reset()
+                self.version += 1
+                self.client.close()
+                # Backoff reconnexion (1s → 10s max)
+                deadline = time.monotonic() + self._retry_delay
+                while self._running and time.monotonic() < deadline:
+                    time.sleep(0.2)
+                self._retry_delay = min(self._retry_delay * 2, 10.0)
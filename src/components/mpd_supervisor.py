@@ -0,0 +1,204 @@
+import subprocess
+import threading
+import time
+import logging
+from typing import Callable, Optional
+from src.components.mpd_client import MPDClient
+
+logger = logging.getLogger(__name__)
+
+
+class MPDSupervisor:
+    """
+    Surveillance + recovery MPD en tâche de fond (jamais sur la boucle principale).
+
+    Machine à états :
+      healthy    → ping socket toutes les `check_interval` s
+      probing    → ping en échec, re-sondes avec backoff exponentiel
+      restarting → redémarrage systemd puis sondes socket (backoff)
+      degraded   → trop d'échecs : sonde + nouvel essai espacés (backoff long)
+    """
+
+    HEALTHY = "healthy"
+    PROBING = "probing"
+    RESTARTING = "restarting"
+    DEGRADED = "degraded"
+
+    def __init__(
+        self,
+        socket_path: str = "/run/mpd/socket",
+        on_state_change: Optional[Callable[[str], None]] = None,
+        check_interval: float = 5.0,
+        probe_attempts: int = 3,
+        max_restarts: int = 3,
+    ):
+        self.client = MPDClient(socket_path, timeout=2.0)
+        self.on_state_change = on_state_change
+        self.check_interval = check_interval
+        self.probe_attempts = probe_attempts
+        self.max_restarts = max_restarts
+        self.state = self.PROBING  # Premier ping immédiat au démarrage
+        self.restart_attempts = 0
+        self._failures = 0
+        self._degraded_delay = 60.0  # Doublé à chaque échec en dégradé (max 15 min)
+        self._healthy = threading.Event()
+        self._wake = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # API (non bloquante sauf wait_healthy)
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._loop, name="mpd-supervisor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        self.client.close()
+
+    @property
+    def healthy(self) -> bool:
+        return self.state == self.HEALTHY
+
+    def request_check(self) -> None:
+        """Demande une sonde immédiate (ex. échec d'une commande)."""
+        if self.state == self.HEALTHY:
+            self._set_state(self.PROBING)
+        self._wake.set()
+
+    def wait_healthy(self, timeout: float) -> bool:
+        """Attend l'état healthy (à n'appeler que hors boucle principale)."""
+        if self.healthy:
+            return True
+        self.request_check()
+        return self._healthy.wait(timeout)
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    def _set_state(self, state: str) -> None:
+        if state == self.state:
+            return
+        logger.warning(f"[MPD] Supervisor {self.state} → {state}")
+        self.state = state
+        if state == self.HEALTHY:
+            self._healthy.set()
+        else:
+            self._healthy.clear()
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(state)
+            except Exception as e:
+                logger.error(f"[MPD] Erreur callback supervisor: {e}")
+
+    def _sleep(self, seconds: float) -> None:
+        """Attente interruptible (request_check / stop)."""
+        self._wake.wait(seconds)
+        self._wake.clear()
+
+    def _probe(self) -> bool:
+        """Sonde de vie : connexion socket + ping."""
+        return self.client.ping()
+
+    def _restart_mpd(self) -> bool:
+        """Redémarre MPD via systemd (socket + service) puis attend le socket."""
+        start_time = time.time()
+        try:
+            logger.warning("[MPD] Restart socket + service...")
+            self.client.close()
+            for cmd in (
+                ["sudo", "systemctl", "stop", "mpd.service", "mpd.socket"],
+                ["sudo", "systemctl", "start", "mpd.socket"],
+                ["sudo", "systemctl", "start", "mpd.service"],
+            ):
+                result = subprocess.run(
+                    cmd, capture_output=True, timeout=15.0, check=False
+                )
+                if result.returncode != 0:
+                    logger.warning(
+                        f"[MPD] '{' '.join(cmd[1:])}' rc={result.returncode}: "
+                        f"{result.stderr.decode().strip()}"
+                    )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.error(f"[MPD] Erreur systemctl: {e}")
+            return False
+        # Sondes socket avec backoff (0.25s → 4s, ~30s max)
+        delay = 0.25
+        while self._running and time.time() - start_time < 30.0:
+            if self._probe():
+                logger.info(
+                    f"[MPD] ✅ MPD répond après {time.time() - start_time:.1f}s"
+                )
+                return True
+            self._sleep(delay)
+            delay = min(delay * 2, 4.0)
+        logger.error(f"[MPD] ❌ Socket muet après {time.time() - start_time:.1f}s")
+        return False
+
+    def _loop(self) -> None:
+        while self._running:
+            try:
+                self._step()
+            except Exception as e:
+                logger.error(f"[MPD] Erreur supervisor: {e}", exc_info=True)
+                self._sleep(self.check_interval)
+
+    def _step(self) -> None:
+        if self.state in (self.HEALTHY, self.PROBING):
+            if self._probe():
+                self._failures = 0
+                self.restart_attempts = 0
+                self._set_state(self.HEALTHY)
+                self._sleep(self.check_interval)
+                return
+            self._failures += 1
+            if self._failures < self.probe_attempts:
+                self._set_state(self.PROBING)
+                self._sleep(0.5 * 2 ** (self._failures - 1))  # 0.5s, 1s, 2s...
+            else:
+                logger.warning(f"[MPD] {self._failures} sondes en échec → restart")
+                self._set_state(self.RESTARTING)
+
+        elif self.state == self.RESTARTING:
+            if self.restart_attempts >= self.max_restarts:
+                logger.error(
+                    f"[MPD] ⚠️ MODE DÉGRADÉ après {self.max_restarts} échecs "
+                    f"(nouvel essai dans {self._degraded_delay:.0f}s)"
+                )
+                self._set_state(self.DEGRADED)
+                return
+            self.restart_attempts += 1
+            logger.warning(
+                f"[MPD] Tentative restart {self.restart_attempts}/{self.max_restarts}"
+            )
+            if self._restart_mpd():
+                self._failures = 0
+                self.restart_attempts = 0
+                self._degraded_delay = 60.0
+                self._set_state(self.HEALTHY)
+            else:
+                self._sleep(min(5.0 * 2 ** (self.restart_attempts - 1), 60.0))
+
+        elif self.state == self.DEGRADED:
+            self._sleep(self._degraded_delay)
+            if not self._running:
+                return
+            if self._probe():
+                self._failures = 0
+                self.restart_attempts = 0
+                self._degraded_delay = 60.0
+                self._set_state(self.HEALTHY)
+            else:
+                # Un nouvel essai de restart, puis retour en dégradé si échec
+                self._degraded_delay = min(self._degraded_delay * 2, 900.0)
+                self.restart_attempts = self.max_restarts - 1
+                self._set_state(self.RESTARTING)
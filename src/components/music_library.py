@@ -0,0 +1,304 @@
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MusicLibrary:
+    """
+    Index persistant (SQLite) de `music_dir` : chemin, type, taille, mtime.
+    Navigation, lecture dossier et tirage aléatoire interrogent l'index
+    au lieu de la carte SD. Mise à jour incrémentale : seuls les dossiers
+    dont le mtime a changé sont relus (un stat par dossier sinon).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            path TEXT PRIMARY KEY,   -- Relatif à music_dir
+            parent TEXT NOT NULL,    -- Dossier parent relatif ("" = racine)
+            name TEXT NOT NULL,
+            is_dir INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_parent ON entries(parent);
+        CREATE TABLE IF NOT EXISTS history (
+            path TEXT PRIMARY KEY,   -- Morceau joué (relatif)
+            played_at REAL NOT NULL
+        );
+    """
+    HISTORY_SIZE = 500  # Morceaux récents exclus du tirage aléatoire
+
+    def __init__(self, music_dir: str, db_path: str):
+        self.music_dir = os.path.normpath(music_dir)
+        self.db_path = db_path
+        self.ready = False  # True après le premier refresh complet
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._db.executescript(self.SCHEMA)
+            has_rows = self._db.execute("SELECT 1 FROM entries LIMIT 1").fetchone()
+        # Index existant : utilisable tout de suite, rafraîchi en fond
+        self.ready = has_rows is not None
+
+    # ------------------------------------------------------------------
+    # Chemins
+    # ------------------------------------------------------------------
+    def rel_path(self, path: str) -> str:
+        """Chemin absolu → relatif à music_dir ("" = racine, format MPD)."""
+        rel = os.path.relpath(os.path.normpath(path), self.music_dir)
+        return "" if rel == "." else rel
+
+    def abs_path(self, rel: str) -> str:
+        return os.path.join(self.music_dir, rel) if rel else self.music_dir
+
+    # ------------------------------------------------------------------
+    # Requêtes (boucle principale / worker)
+    # ------------------------------------------------------------------
+    def entry(self, path: str) -> Optional[Tuple[bool, int, float]]:
+        """(is_dir, size, mtime) d'un chemin absolu, None si absent."""
+        rel = self.rel_path(path)
+        if rel == "":
+            return (True, 0, 0.0)
+        if not self.ready:
+            return self._stat_entry(path)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT is_dir, size, mtime FROM entries WHERE path = ?", (rel,)
+            ).fetchone()
+        return (bool(row[0]), row[1], row[2]) if row else None
+
+    def is_dir(self, path: str) -> bool:
+        entry = self.entry(path)
+        return entry is not None and entry[0]
+
+    def is_file(self, path: str) -> bool:
+        entry = self.entry(path)
+        return entry is not None and not entry[0]
+
+    def list_dir(self, path: str) -> Tuple[List[str], List[str]]:
+        """(dossiers, fichiers) triés d'un dossier absolu."""
+        if not self.ready:
+            return self._scan_names(path)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT name, is_dir FROM entries WHERE parent = ? ORDER BY name",
+                (self.rel_path(path),),
+            ).fetchall()
+        dirs = [name for name, is_dir in rows if is_dir]
+        files = [name for name, is_dir in rows if not is_dir]
+        return dirs, files
+
+    def files_in(self, path: str) -> List[str]:
+        """Chemins absolus triés des fichiers d'un dossier (non récursif)."""
+        _, files = self.list_dir(path)
+        return [os.path.join(os.path.normpath(path), name) for name in files]
+
+    def random_files(
+        self, count: int, prefix: str = "", exclude: Sequence[str] = ()
+    ) -> List[str]:
+        """
+        Tirage aléatoire de fichiers (chemins relatifs MPD) sous `prefix`
+        (relatif, "" = tout), hors `exclude` et hors historique récent
+        (historique ignoré s'il ne laisse pas assez de candidats).
+        [] si index vide.
+        """
+        if not self.ready:
+            return []
+        where, params = self._prefix_filter(prefix)
+        if exclude:
+            where += f" AND path NOT IN ({','.join('?' * len(exclude))})"
+            params += tuple(exclude)
+        query = f"SELECT path FROM entries WHERE is_dir = 0{where}"
+        with self._lock:
+            rows = self._db.execute(
+                query + " AND path NOT IN (SELECT path FROM history)"
+                " ORDER BY RANDOM() LIMIT ?",
+                params + (count,),
+            ).fetchall()
+            if len(rows) < count:
+                # Petite bibliothèque : l'historique seul ne bloque pas la lecture
+                known = {row[0] for row in rows}
+                extra = self._db.execute(
+                    query + " ORDER BY RANDOM() LIMIT ?", params + (count,)
+                ).fetchall()
+                rows += [row for row in extra if row[0] not in known][
+                    : count - len(rows)
+                ]
+        return [row[0] for row in rows]
+
+    def record_played(self, rel: str) -> None:
+        """Ajoute un morceau à l'historique (HISTORY_SIZE plus récents gardés)."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO history (path, played_at) VALUES (?, ?)",
+                (rel, time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM history WHERE path NOT IN "
+                "(SELECT path FROM history ORDER BY played_at DESC LIMIT ?)",
+                (self.HISTORY_SIZE,),
+            )
+
+    def _prefix_filter(self, prefix: str) -> Tuple[str, tuple]:
+        """Clause SQL (+ paramètres) limitant aux entrées sous `prefix`."""
+        if not prefix:
+            return "", ()
+        return " AND path LIKE ? ESCAPE '\\'", (self._escape_like(prefix) + "/%",)
+
+    # ------------------------------------------------------------------
+    # Accès disque (repli avant le premier index + refresh)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _stat_entry(path: str) -> Optional[Tuple[bool, int, float]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        is_dir = os.path.isdir(path)
+        return (is_dir, 0 if is_dir else st.st_size, st.st_mtime)
+
+    @staticmethod
+    def _scan(path: str) -> List[Tuple[str, bool, int, float]]:
+        """(nom, is_dir, taille, mtime) des entrées d'un dossier."""
+        result = []
+        try:
+            with os.scandir(path) as it:
+                for item in it:
+                    try:
+                        is_dir = item.is_dir()
+                        if not is_dir and not item.is_file():
+                            continue
+                        st = item.stat()
+                    except OSError:
+                        continue
+                    result.append(
+                        (item.name, is_dir, 0 if is_dir else st.st_size, st.st_mtime)
+                    )
+        except OSError as e:
+            logger.warning(f"[LIBRARY] Lecture dossier {path}: {e}")
+        return result
+
+    def _scan_names(self, path: str) -> Tuple[List[str], List[str]]:
+        entries = self._scan(path)
+        dirs = sorted(name for name, is_dir, _, _ in entries if is_dir)
+        files = sorted(name for name, is_dir, _, _ in entries if not is_dir)
+        return dirs, files
+
+    # ------------------------------------------------------------------
+    # Mise à jour incrémentale
+    # ------------------------------------------------------------------
+    def refresh(self, path: Optional[str] = None) -> List[str]:
+        """
+        Synchronise l'index avec le disque sous `path` (défaut : racine).
+        Retourne les dossiers relus (relatifs). Thread de fond uniquement.
+        """
+        start = time.monotonic()
+        root = self.rel_path(path) if path else ""
+        stack = [root]
+        rescanned: List[str] = []
+        while stack:
+            rel = stack.pop()
+            abs_path = self.abs_path(rel)
+            try:
+                dir_mtime = os.stat(abs_path).st_mtime
+            except OSError:
+                self._remove_tree(rel)
+                continue
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT mtime FROM entries WHERE path = ?", (rel,)
+                ).fetchone()
+            known = row is not None and row[0] == dir_mtime
+            # Dossier ciblé explicitement : relu même à mtime identique
+            # (fichier modifié sur place, résolution mtime grossière en FAT)
+            if not known or (rel == root and path is not None):
+                self._rescan_dir(rel, dir_mtime)
+                rescanned.append(rel)
+            with self._lock:
+                subdirs = self._db.execute(
+                    "SELECT path FROM entries WHERE parent = ? AND is_dir = 1",
+                    (rel,),
+                ).fetchall()
+            stack.extend(sub for (sub,) in subdirs)
+        if path is None:
+            self.ready = True
+        if rescanned:
+            logger.info(
+                f"[LIBRARY] Index mis à jour : {len(rescanned)} dossier(s) relu(s) "
+                f"en {time.monotonic() - start:.2f}s"
+            )
+        return rescanned
+
+    def _rescan_dir(self, rel: str, dir_mtime: float) -> None:
+        """Remplace les entrées directes d'un dossier par le contenu disque."""
+        entries = self._scan(self.abs_path(rel))
+        names = {name for name, _, _, _ in entries}
+        with self._lock:
+            old = self._db.execute(
+                "SELECT path, name, is_dir FROM entries WHERE parent = ?", (rel,)
+            ).fetchall()
+        # Entrées disparues (ou dossier devenu fichier) → suppression récursive
+        for old_path, name, was_dir in old:
+            still = next((e for e in entries if e[0] == name), None)
+            if name not in names or (still is not None and still[1] != bool(was_dir)):
+                self._remove_tree(old_path)
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO entries (path, parent, name, is_dir, size, mtime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        os.path.join(rel, name) if rel else name,
+                        rel,
+                        name,
+                        int(is_dir),
+                        size,
+                        # Sous-dossiers : mtime 0 → relus à leur tour
+                        0.0 if is_dir else mtime,
+                    )
+                    for name, is_dir, size, mtime in entries
+                    if not (is_dir and self._known_dir(rel, name))
+                ],
+            )
+            # Mtime du dossier lui-même (racine : clé "", parent hors arbre)
+            self._db.execute(
+                "INSERT INTO entries (path, parent, name, is_dir, size, mtime) "
+                "VALUES (?, ?, ?, 1, 0, ?) ON CONFLICT(path) DO UPDATE SET mtime = ?",
+                (
+                    rel,
+                    os.path.dirname(rel) if rel else "\0",
+                    os.path.basename(rel),
+                    dir_mtime,
+                    dir_mtime,
+                ),
+            )
+
+    def _known_dir(self, parent: str, name: str) -> bool:
+        """Sous-dossier déjà indexé (son mtime propre est conservé)."""
+        path = os.path.join(parent, name) if parent else name
+        row = self._db.execute(
+            "SELECT 1 FROM entries WHERE path = ? AND is_dir = 1", (path,)
+        ).fetchone()
+        return row is not None
+
+    def _remove_tree(self, rel: str) -> None:
+        if rel == "":
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM entries WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (rel, self._escape_like(rel) + "/%"),
+            )
+
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,110 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class PlaybackClock:
+    """
+    Horloge de lecture locale : durée, position de référence et état
+    play/pause recalés sur MPD uniquement aux changements d'état (idle)
+    ou au contrôle de dérive ; entre deux, temps écoulé et progression
+    extrapolés sur time.monotonic() (aucune requête MPD).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._position = 0.0  # Temps écoulé (s) à l'instant _anchor
+        self._anchor = time.monotonic()
+        self._duration = 0.0
+        self._playing = False
+        self._song_id: Optional[str] = None
+
+    def sync(self, status: Dict[str, str], song: Optional[Dict[str, str]] = None) -> float:
+        """
+        Recale l'horloge sur un status MPD.
+
+        Returns:
+            Dérive (s) entre l'extrapolation et MPD (0 si changement de morceau)
+        """
+        now = time.monotonic()
+        try:
+            position = float(status.get("elapsed", 0) or 0)
+        except ValueError:
+            position = 0.0
+        duration_text = status.get("duration") or (song or {}).get("duration") or 0
+        try:
+            duration = float(duration_text)
+        except ValueError:
+            duration = 0.0
+        with self._lock:
+            same_song = status.get("songid") == self._song_id
+            drift = position - self._elapsed_at(now) if same_song else 0.0
+            self._position = position
+            self._anchor = now
+            self._duration = duration
+            self._playing = status.get("state") == "play"
+            self._song_id = status.get("songid")
+        return drift
+
+    def reset(self) -> None:
+        """MPD injoignable : horloge à zéro, arrêtée."""
+        with self._lock:
+            self._position = 0.0
+            self._anchor = time.monotonic()
+            self._duration = 0.0
+            self._playing = False
+            self._song_id = None
+
+    def _elapsed_at(self, now: float) -> float:
+        elapsed = self._position
+        if self._playing:
+            elapsed += now - self._anchor
+        if self._duration > 0:
+            elapsed = min(elapsed, self._duration)
+        return elapsed
+
+    @property
+    def playing(self) -> bool:
+        return self._playing
+
+    def elapsed(self) -> float:
+        with self._lock:
+            return self._elapsed_at(time.monotonic())
+
+    def duration(self) -> float:
+        return self._duration
+
+    def progress(self) -> float:
+        """Progression 0.0-1.0 (0 sans durée connue, ex. webradio)."""
+        with self._lock:
+            if self._duration <= 0:
+                return 0.0
+            return min(self._elapsed_at(time.monotonic()) / self._duration, 1.0)
+
+    def display_key(self, steps: int = 128) -> Tuple[int, int]:
+        """
+        (seconde affichée, pas de barre) : change exactement quand
+        l'affichage du lecteur change → rendu sans minuterie fixe.
+        """
+        with self._lock:
+            elapsed = self._elapsed_at(time.monotonic())
+            step = int(elapsed / self._duration * steps) if self._duration > 0 else 0
+        return int(elapsed), step
+
+    def next_change(self, steps: int = 128) -> Optional[float]:
+        """
+        Délai (s) avant le prochain changement de display_key (seconde ou
+        pas de barre) : échéance de la prochaine trame du lecteur.
+        None si la lecture est arrêtée (affichage figé).
+        """
+        with self._lock:
+            if not self._playing:
+                return None
+            elapsed = self._elapsed_at(time.monotonic())
+            delay = int(elapsed) + 1 - elapsed
+            if self._duration > 0:
+                if elapsed >= self._duration:
+                    return None
+                step = int(elapsed / self._duration * steps)
+                delay = min(delay, (step + 1) * self._duration / steps - elapsed)
+        return max(delay, 0.01)  # Plancher : arrondis flottants en limite de pas
@@ -0,0 +1,227 @@
+import threading
+import logging
+from typing import List, Optional
+from src.components.mpd_client import (
+    ACK_ERROR_NO_EXIST,
+    MPDClient,
+    MPDCommandError,
+    MPDError,
+)
+from src.components.mpd_state import MPDStateMirror
+from src.components.music_library import MusicLibrary
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFeeder:
+    """
+    File MPD fenêtrée : seuls les `window` prochains morceaux sont en file,
+    complétée à mesure de la lecture (événements idle du miroir) ; les
+    morceaux joués au-delà de `keep_played` sont retirés (précédent possible).
+    Coût de démarrage et mémoire MPD en O(fenêtre) au lieu de O(bibliothèque).
+
+    Modes :
+      - "shuffle" : tirage dans l'index, sans répétition des morceaux
+        récents (historique de l'index) ni de la fenêtre
+      - "sequential" : liste ordonnée de fichiers (dossier à partir d'un
+        morceau), arrêtée en fin de liste ;
+        un fichier absent de la base MPD (pas encore indexé) est sauté puis
+        réinséré à sa place à la fin de la mise à jour (idle "database")
+    """
+
+    def __init__(
+        self,
+        mpd: MPDClient,
+        state: MPDStateMirror,
+        library: MusicLibrary,
+        window: int = 20,
+        keep_played: int = 5,
+    ):
+        self.mpd = mpd
+        self.state = state
+        self.library = library
+        self.window = window
+        self.keep_played = keep_played
+        self.mode: Optional[str] = None  # None = inactif
+        self._files: List[str] = []
+        self._cursor = 0
+        self._missing: List[str] = []  # Séquentiel : non indexés, à réinsérer
+        self._last_song_id: Optional[str] = None
+        self._lock = threading.RLock()  # Worker audio ↔ thread miroir
+        state.add_listener(self._on_state_change)
+
+    # ------------------------------------------------------------------
+    # Démarrage / arrêt (thread worker audio)
+    # ------------------------------------------------------------------
+    def start_shuffle(self) -> int:
+        """Lecture aléatoire de la bibliothèque ; retourne les morceaux ajoutés."""
+        with self._lock:
+            self._reset("shuffle")
+            return self.fill()
+
+    def start_sequential(
+        self, files: List[str], cursor: int = 0, fill: bool = True
+    ) -> int:
+        """
+        Lecture ordonnée de `files` (relatifs) à partir de `cursor`.
+        fill=False : l'appelant a déjà mis en file les morceaux avant `cursor`.
+        """
+        with self._lock:
+            self._reset("sequential")
+            self._files = files
+            self._cursor = cursor
+            return self.fill() if fill else 0
+
+    def defer_missing(self, files: List[str]) -> None:
+        """Fichiers refusés par MPD (ACK 50) : réinsérés après la mise à jour."""
+        with self._lock:
+            self._missing.extend(f for f in files if f not in self._missing)
+
+    def stop(self) -> None:
+        """Désactive l'alimentation (avant clear / nouvelle lecture)."""
+        with self._lock:
+            self._reset(None)
+
+    def _reset(self, mode: Optional[str]) -> None:
+        if mode is not None:
+            # repeat MPD rejouerait la fenêtre seule
+            self.mpd.command("repeat", 0)
+        self.mode = mode
+        self._files = []
+        self._cursor = 0
+        self._missing = []
+        self._last_song_id = None
+
+    # ------------------------------------------------------------------
+    # Alimentation
+    # ------------------------------------------------------------------
+    def _next_batch(self, count: int, queued: List[str]) -> List[str]:
+        if self.mode == "shuffle":
+            return self.library.random_files(count, exclude=queued)
+        batch = self._files[self._cursor : self._cursor + count]
+        self._cursor += len(batch)
+        return batch
+
+    def fill(self) -> int:
+        """
+        Complète la fenêtre après le morceau courant et retire les morceaux
+        joués en trop (un lot MPD). Retourne le nombre de morceaux ajoutés.
+        """
+        with self._lock:
+            if self.mode is None:
+                return 0
+            status = self.mpd.status()
+            length = int(status.get("playlistlength", 0))
+            current = int(status["song"]) if "song" in status else -1
+            remaining = length - current - 1
+            commands: list = []
+            if current > self.keep_played:
+                commands.append(("delete", f"0:{current - self.keep_played}"))
+            batch: List[str] = []
+            if remaining < self.window:
+                queued = [] if self.mode != "shuffle" else self._queued_files()
+                batch = self._next_batch(self.window - remaining, queued)
+                commands.extend(("add", rel) for rel in batch)
+            if not commands:
+                return 0
+            errors = self.mpd.command_list(commands)
+            for command, error in zip(commands, errors):
+                if error is None:
+                    continue
+                logger.warning(f"[QUEUE] {command[0]} {command[1]}: {error}")
+                if (
+                    self.mode == "sequential"
+                    and command[0] == "add"
+                    and error.code == ACK_ERROR_NO_EXIST
+                ):
+                    self._missing.append(command[1])
+            added = sum(
+                error is None
+                for command, error in zip(commands, errors)
+                if command[0] == "add"
+            )
+            if added:
+                logger.info(f"[QUEUE] +{added} morceau(x) ({self.mode})")
+            return added
+
+    def _queued_files(self) -> List[str]:
+        """Fichiers SD déjà en file (exclus du tirage)."""
+        return [
+            value
+            for key, value in self.mpd.command("playlistinfo", retry=True)
+            if key == "file" and "://" not in value
+        ]
+
+    def _insert_missing(self, current: int) -> None:
+        """
+        Réinsère les fichiers non indexés devenus disponibles, à leur rang
+        dans la liste (addid POS) ; ceux déjà dépassés par la lecture sont
+        abandonnés, ceux toujours absents attendent la mise à jour suivante.
+        """
+        if self.mode != "sequential" or not self._missing:
+            return
+        order = {rel: index for index, rel in enumerate(self._files)}
+        queue = [
+            value
+            for key, value in self.mpd.command("playlistinfo", retry=True)
+            if key == "file"
+        ]
+        still_missing: List[str] = []
+        for rel in self._missing:
+            index = order.get(rel)
+            if index is None:
+                continue
+            # Avant le premier morceau en file qui le suit dans la liste
+            pos = next(
+                (p for p, file in enumerate(queue) if order.get(file, -1) > index),
+                len(queue),
+            )
+            if pos <= current:
+                continue  # Sa place est déjà passée
+            try:
+                self.mpd.command("addid", rel, pos)
+            except MPDCommandError as e:
+                if e.code == ACK_ERROR_NO_EXIST:
+                    still_missing.append(rel)
+                else:
+                    logger.warning(f"[QUEUE] addid {rel}: {e}")
+                continue
+            queue.insert(pos, rel)
+            logger.info(f"[QUEUE] '{rel}' réinséré après mise à jour de la base")
+        self._missing = still_missing
+
+    # ------------------------------------------------------------------
+    # Événements (thread miroir)
+    # ------------------------------------------------------------------
+    def _on_state_change(self, changed: List[str]) -> None:
+        if self.mode is None:
+            return
+        # changed vide : (re)connexion du miroir → tout a pu changer
+        if changed and not {"player", "playlist", "database"} & set(changed):
+            return
+        with self._lock:
+            if self.mode is None:
+                return
+            status = self.state.status
+            if "database" in changed:
+                try:
+                    self._insert_missing(int(status.get("song", -1)))
+                except MPDError as e:
+                    logger.warning(f"[QUEUE] Réinsertion impossible: {e}")
+            song_id = status.get("songid")
+            if song_id is not None and song_id != self._last_song_id:
+                self._last_song_id = song_id
+                path = self.state.song.get("file", "")
+                if path and "://" not in path:
+                    self.library.record_played(path)
+            length = int(status.get("playlistlength", 0))
+            current = int(status["song"]) if "song" in status else -1
+            # Refill par lots : à mi-fenêtre ou après nettoyage nécessaire
+            if (
+                length - current - 1 <= self.window // 2
+                or current > 2 * self.keep_played
+            ):
+                try:
+                    self.fill()
+                except MPDError as e:
+                    logger.warning(f"[QUEUE] Alimentation impossible: {e}")
@@ -1,5 +1,6 @@
 import RPi.GPIO as GPIO
 import time
+from typing import Callable, Optional
 
 
 class RotaryEncoder:
@@ -13,6 +14,8 @@ class RotaryEncoder:
         self.long_press_duration = config["long_press_duration"]
         self.repeat_delay = config["repeat_delay"]
         self.events = []
+        # Appelé (thread GPIO) à chaque événement ou appui : réveil de la boucle
+        self.on_event: Optional[Callable[[], None]] = None
         self.last_switch_status = None
         self.last_switch_time = 0
         self.switch_press_time = 0
@@ -57,11 +60,13 @@ class RotaryEncoder:
         if new_status == self.last_status:
             return
         transition = (self.last_status << 2) | new_status
+        self.last_status = new_status
         if transition == 0b1110:
             self.events.append({"button": "down", "type": "short_press"})
+            self._notify()
         elif transition == 0b1101:
             self.events.append({"button": "up", "type": "short_press"})
-        self.last_status = new_status
+            self._notify()
 
     def _switch_callback(self, _channel):
         """Gère les changements sur SW."""
@@ -83,6 +88,12 @@ class RotaryEncoder:
                 self.events.append({"button": "menu", "type": "short_press"})
             self.switch_pressed = False
             self.long_detected = False  # Reset
+        self._notify()
+
+    def _notify(self) -> None:
+        """Signale une entrée (appui maintenu : l'appui long est scruté)."""
+        if self.on_event is not None:
+            self.on_event()
 
     def get_events(self) -> list[dict]:
         """Retourne les événements détectés (up, down, menu)."""
@@ -38,18 +38,24 @@ class RTC:
 
     def read_time(self) -> tuple[int, int]:
         """Lit l'heure (heures, minutes)."""
+        hours, minutes, _ = self.read_time_seconds()
+        return hours, minutes
+
+    def read_time_seconds(self) -> tuple[int, int, int]:
+        """Lit l'heure avec les secondes (heures, minutes, secondes), en un bloc."""
         try:
             data = self.i2c.read_block(self.address, self.TIME_REG, 3)
             if not data:  # Vérifie liste vide
                 raise OSError("Lecture I2C vide")
             hours = self._bcd_to_decimal(data[2] & 0x3F)  # Masque pour mode 24h
             minutes = self._bcd_to_decimal(data[1] & 0x7F)
-            if 0 <= hours < 24 and 0 <= minutes < 60:
-                return hours, minutes
-            return 0, 0
+            seconds = self._bcd_to_decimal(data[0] & 0x7F)
+            if 0 <= hours < 24 and 0 <= minutes < 60 and 0 <= seconds < 60:
+                return hours, minutes, seconds
+            return 0, 0, 0
         except Exception as e:
             print(f"Erreur lecture heure RTC : {e}")
-            return 0, 0
+            return 0, 0, 0
 
     def set_time(self, hours: int, minutes: int) -> None:
         """Règle l'heure."""
@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class StartupLatency:
+    """
+    Historique des latences trigger → son par mode d'alarme musical (sd/webradio ;
+    buzzer immédiat, sans avance).
+    Estimation glissante (EWMA) persistée en JSON : sert d'avance au
+    déclenchement pour que le son tombe sur la minute configurée.
+    """
+
+    MODES = ("sd", "webradio")
+    HISTORY_SIZE = 10  # Derniers échantillons conservés (diagnostic)
+
+    def __init__(self, path: str, alpha: float = 0.3, max_lead: float = 30.0):
+        self.path = path
+        self.alpha = alpha
+        self.max_lead = max_lead
+        self._estimates: Dict[str, float] = {}
+        self._history: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()  # record() depuis le worker audio
+        self._load()
+
+    def estimate(self, mode: str) -> float:
+        """Avance à appliquer (secondes, bornée à max_lead ; 0 sans historique)."""
+        with self._lock:
+            return min(self._estimates.get(mode, 0.0), self.max_lead)
+
+    def record(self, mode: str, latency: float) -> None:
+        """Ajoute un échantillon et sauvegarde."""
+        if mode not in self.MODES or latency < 0:
+            return
+        with self._lock:
+            previous = self._estimates.get(mode)
+            if previous is None:
+                self._estimates[mode] = latency
+            else:
+                self._estimates[mode] = (
+                    self.alpha * latency + (1 - self.alpha) * previous
+                )
+            history = self._history.setdefault(mode, [])
+            history.append(round(latency, 3))
+            del history[: -self.HISTORY_SIZE]
+            estimate = self._estimates[mode]
+        logger.info(
+            f"[ALARM] Latence {mode}: {latency:.2f}s → estimation {estimate:.2f}s"
+        )
+        self._save()
+
+    def _load(self) -> None:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                self._estimates = {
+                    mode: float(value)
+                    for mode, value in data.get("estimates", {}).items()
+                    if mode in self.MODES
+                }
+                self._history = {
+                    mode: list(values)
+                    for mode, values in data.get("history", {}).items()
+                    if mode in self.MODES
+                }
+        except (OSError, ValueError) as e:
+            logger.warning(f"[ALARM] Historique latences illisible: {e}")
+
+    def _save(self) -> None:
+        with self._lock:
+            data = {"estimates": dict(self._estimates), "history": dict(self._history)}
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)  # Écriture atomique (coupure courant)
+        except OSError as e:
+            logger.warning(f"[ALARM] Sauvegarde latences impossible: {e}")
@@ -0,0 +1,205 @@
+import collections
+import http.client
+import os
+import threading
+import time
+import logging
+from typing import Deque, Optional, Union
+from src.components.webradio_prober import StreamError, open_stream
+
+logger = logging.getLogger(__name__)
+
+
+class StreamPreroll:
+    """
+    Enregistre un flux webradio dans un tampon circulaire borné en RAM
+    (thread de fond) pendant les minutes qui précèdent une alarme.
+    `snapshot()` écrit les dernières secondes dans `preroll_dir` (tmpfs) :
+    MPD les joue en local (démarrage instantané, indépendant du DNS/TLS)
+    avant d'enchaîner sur le flux en direct.
+    """
+
+    CHUNK_SIZE = 4096
+    DEFAULT_BITRATE = 128  # kbit/s si le serveur n'annonce pas icy-br
+    MIN_SECONDS = 3.0  # Durée minimale enregistrée pour qu'un snapshot serve
+    # Formats relisibles depuis un point quelconque (resynchro sur trame)
+    EXTENSIONS = {
+        "audio/mpeg": ".mp3",
+        "audio/mp3": ".mp3",
+        "audio/aac": ".aac",
+        "audio/aacp": ".aac",
+        "audio/x-aac": ".aac",
+    }
+
+    def __init__(
+        self,
+        preroll_dir: str = "/dev/shm",
+        buffer_seconds: float = 30.0,
+        timeout: float = 5.0,
+    ):
+        self.preroll_dir = preroll_dir
+        self.buffer_seconds = buffer_seconds
+        self.timeout = timeout
+        self.url: Union[str, None] = None
+        self._chunks: Deque[bytes] = collections.deque()
+        self._size = 0
+        self._max_bytes = 0
+        self._bytes_per_second = 0
+        self._extension: Union[str, None] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    @property
+    def recording(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, url: str) -> None:
+        """Enregistre `url` (tampon vidé ; sans effet si déjà en cours)."""
+        if self.recording and self.url == url:
+            return
+        self.stop()
+        with self._lock:
+            self._chunks.clear()
+            self._size = 0
+            self._extension = None
+        self.url = url
+        # Événement propre à chaque thread : un ancien thread encore bloqué
+        # en lecture réseau s'arrête sans gêner le nouveau
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(url, self._stop_event),
+            name="webradio-preroll",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"[PREROLL] Enregistrement {url}")
+
+    def stop(self, wait: bool = False) -> None:
+        """
+        Arrête l'enregistrement (le tampon reste disponible pour snapshot).
+        Sans `wait`, n'attend pas la fin de la lecture réseau en cours
+        (appel depuis la boucle principale).
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        if wait:
+            self._thread.join(timeout=self.timeout + 1.0)
+        self._thread = None
+        logger.info("[PREROLL] Enregistrement arrêté")
+
+    # ------------------------------------------------------------------
+    # Snapshot (thread worker audio)
+    # ------------------------------------------------------------------
+    def buffered_seconds(self) -> float:
+        with self._lock:
+            if not self._bytes_per_second:
+                return 0.0
+            return self._size / self._bytes_per_second
+
+    def snapshot(self, url: str) -> Union[str, None]:
+        """
+        Écrit le tampon de `url` dans preroll_dir (écriture atomique).
+
+        Returns:
+            Chemin absolu du fichier, None si rien d'exploitable
+        """
+        if url != self.url:
+            return None
+        with self._lock:
+            if (
+                self._extension is None
+                or not self._bytes_per_second
+                or self._size < self.MIN_SECONDS * self._bytes_per_second
+            ):
+                return None
+            data = b"".join(self._chunks)
+            extension = self._extension
+        path = os.path.join(self.preroll_dir, f"reveil-preroll{extension}")
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"[PREROLL] Écriture {path} impossible: {e}")
+            return None
+        logger.info(
+            f"[PREROLL] Snapshot {len(data) // 1024} Ko "
+            f"({len(data) / self._bytes_per_second:.0f}s) → {path}"
+        )
+        return path
+
+    # ------------------------------------------------------------------
+    # Thread
+    # ------------------------------------------------------------------
+    def _append(self, chunk: bytes, stop_event: threading.Event) -> None:
+        with self._lock:
+            if stop_event.is_set():
+                return  # Thread remplacé : ne pas polluer le nouveau tampon
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+            # Tampon circulaire : les plus vieux blocs tombent
+            while (
+                len(self._chunks) > 1
+                and self._size - len(self._chunks[0]) >= self._max_bytes
+            ):
+                self._size -= len(self._chunks.popleft())
+
+    def _record(self, url: str, stop_event: threading.Event) -> bool:
+        """
+        Une connexion : lit le flux jusqu'à stop() ou coupure.
+        Retourne False si le format ne se prête pas au pré-roll.
+        """
+        conn, response, _ = open_stream(url, self.timeout)
+        try:
+            content_type = (response.getheader("Content-Type") or "").split(";")[0]
+            extension = self.EXTENSIONS.get(content_type.strip().lower())
+            if extension is None:
+                # Ogg/FLAC : illisible hors début de flux → pas de pré-roll
+                logger.warning(
+                    f"[PREROLL] Format non supporté ({content_type or '?'}) → abandon"
+                )
+                return False
+            try:
+                bitrate = int(response.getheader("icy-br", "").split(",")[0])
+            except ValueError:
+                bitrate = self.DEFAULT_BITRATE
+            with self._lock:
+                if stop_event.is_set():
+                    return True
+                if self._extension != extension:
+                    self._chunks.clear()
+                    self._size = 0
+                self._extension = extension
+                self._bytes_per_second = bitrate * 1000 // 8
+                self._max_bytes = int(self.buffer_seconds * self._bytes_per_second)
+            while not stop_event.is_set():
+                chunk = response.read1(self.CHUNK_SIZE)
+                if not chunk:
+                    raise StreamError("flux terminé")
+                self._append(chunk, stop_event)
+            return True
+        finally:
+            conn.close()
+
+    def _loop(self, url: str, stop_event: threading.Event) -> None:
+        delay = 1.0
+        while not stop_event.is_set():
+            started = time.monotonic()
+            try:
+                if not self._record(url, stop_event):
+                    return
+            except (StreamError, OSError, http.client.HTTPException) as e:
+                logger.warning(f"[PREROLL] {url}: {e}")
+            if time.monotonic() - started > 60.0:
+                delay = 1.0  # Coupure après une longue lecture : reconnexion rapide
+            # Reconnexion avec backoff (1 s → 30 s)
+            if stop_event.wait(delay):
+                return
+            delay = min(delay * 2, 30.0)
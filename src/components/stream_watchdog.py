@@ -0,0 +1,231 @@
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional, Tuple
+from src.components.mpd_client import MPDError
+
+logger = logging.getLogger(__name__)
+
+
+class StreamWatchdog:
+    """
+    Surveille la lecture webradio (thread de fond) : en "play", elapsed
+    qui n'avance plus ou débit nul pendant `stall_seconds` → incident.
+    Sans requête MPD en temps normal : les relevés bruts du miroir d'état
+    (événements idle, recalage toutes les `stall_seconds / 2` pendant le
+    flux, faute d'événement sur un flux figé) sont comparés entre eux ;
+    MPD n'est interrogé qu'une fois un blocage soupçonné (elapsed en
+    retard sur le temps écoulé, débit nul), jusqu'à confirmation ou reprise.
+    Reprise sur le worker audio, bornée dans le temps :
+      1. reconnexion de la même station
+      2. station suivante saine (sonde)
+      3. SD aléatoire
+    Incident et temps de rétablissement journalisés ; `on_recovered(mode)`
+    ("webradio"/"sd"/None) rappelé dans la boucle principale.
+    """
+
+    def __init__(
+        self,
+        audio_manager,
+        stall_seconds: float = 8.0,
+        reconnect_timeout: float = 5.0,
+        check_interval: float = 2.0,
+    ):
+        self.audio_manager = audio_manager
+        self.stall_seconds = stall_seconds
+        self.reconnect_timeout = reconnect_timeout
+        self.check_interval = check_interval
+        self.on_recovered: Optional[Callable[[Optional[str]], None]] = None
+        self.recovering = False
+        self._last_elapsed: Optional[float] = None
+        self._last_progress = 0.0  # time.monotonic() du dernier son constaté
+        self._snapshot: Optional[Tuple[float, float]] = None  # (lu à, elapsed)
+        self._suspect = False  # Blocage soupçonné : MPD interrogé à chaque contrôle
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._loop, name="stream-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Détection (thread watchdog)
+    # ------------------------------------------------------------------
+    def _reset(self) -> None:
+        self._last_elapsed = None
+        self._last_progress = time.monotonic()
+        self._snapshot = None
+        self._suspect = False
+
+    @staticmethod
+    def _elapsed(status: Dict[str, str]) -> float:
+        try:
+            return float(status.get("elapsed", 0) or 0)
+        except ValueError:
+            return 0.0
+
+    def _stall_suspected(self, read_at: float, status: Dict[str, str]) -> bool:
+        """
+        Compare le relevé du miroir au précédent : débit nul ou elapsed en
+        retard de plus d'1 s sur le temps écoulé entre les deux → soupçon ;
+        dernier son situé au moment où elapsed s'est arrêté.
+        """
+        elapsed = self._elapsed(status)
+        previous, self._snapshot = self._snapshot, (read_at, elapsed)
+        if previous is None or previous[0] == read_at:
+            self._snapshot = previous or self._snapshot
+            return status.get("bitrate") == "0"
+        advanced = elapsed - previous[1]
+        if status.get("bitrate") == "0" or read_at - previous[0] - advanced > 1.0:
+            self._last_elapsed = elapsed
+            self._last_progress = previous[0] + max(advanced, 0.0)
+            return True
+        return False
+
+    def check(self) -> bool:
+        """Un contrôle ; True si un incident vient d'être pris en charge."""
+        am = self.audio_manager
+        if (
+            self.recovering
+            or am.loading  # Lecture en cours de lancement : pas encore jugée
+            or not am.music_playing
+            or am.play_mode != "webradio"
+        ):
+            am.state.set_drift_interval()  # Recalage normal hors flux
+            self._reset()
+            return False
+        am.state.set_drift_interval(self.stall_seconds / 2)
+        read_at, status = am.state.snapshot
+        if not self._suspect:
+            # Relevé du miroir : aucune requête MPD
+            if status.get("state") != "play":
+                self._reset()  # Pause/stop volontaire, ou MPD injoignable
+                return False
+            if not self._stall_suspected(read_at, status):
+                return False
+            self._suspect = True
+            logger.info("[WATCHDOG] Blocage soupçonné → contrôle direct MPD")
+        try:
+            status = am.mpd.status()
+        except MPDError:
+            self._reset()  # MPD down : le superviseur s'en charge
+            return False
+        if status.get("state") != "play":
+            self._reset()  # Pause/stop volontaire
+            return False
+        path = am.state.song.get("file", "")
+        if path and "://" not in path:
+            # Flux terminé, MPD a enchaîné sur la SD en file (hedge)
+            logger.warning("[WATCHDOG] Flux terminé → SD en file")
+            self.recovering = True  # État basculé sur le worker audio
+            am.submit(self._stream_ended, on_done=self._on_recover_done)
+            return False
+
+        now = time.monotonic()
+        elapsed = self._elapsed(status)
+        bitrate = status.get("bitrate")
+        flowing = (
+            self._last_elapsed is not None
+            and elapsed > self._last_elapsed
+            and bitrate != "0"
+        )
+        if flowing:
+            self._reset()  # Fausse alerte : retour à la surveillance du miroir
+            return False
+        self._last_elapsed = elapsed
+        stalled_for = now - self._last_progress
+        if stalled_for < self.stall_seconds:
+            return False
+
+        index = am.current_station_index
+        name = am.current_station_name or "?"
+        logger.warning(
+            f"[WATCHDOG] Flux {name} bloqué depuis {stalled_for:.0f}s "
+            f"(elapsed {elapsed:.1f}s, débit {bitrate or '?'}) → reprise"
+        )
+        self.recovering = True
+        am.submit(
+            self._recover,
+            index,
+            self._last_progress,
+            on_done=self._on_recover_done,
+        )
+        return True
+
+    def _loop(self) -> None:
+        self._reset()
+        while not self._stop_event.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"[WATCHDOG] Erreur: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Reprise (worker audio)
+    # ------------------------------------------------------------------
+    def _recover(self, index: Optional[int], stalled_since: float):
+        """Retourne le mode rétabli, None si échec, False si reprise annulée."""
+        am = self.audio_manager
+        if not am.music_playing or am.play_mode != "webradio":
+            logger.info("[WATCHDOG] Reprise annulée (lecture arrêtée ou changée)")
+            return False
+        am.prober.probe_now()  # Table de santé rafraîchie en fond
+        mode: Optional[str] = None
+        if index is not None and am.reconnect_webradio(index, self.reconnect_timeout):
+            mode, how = "webradio", "reconnexion"
+        else:
+            count = len(am.webradio_stations)
+            candidate = (
+                am.prober.next_alive((index + 1) % count)
+                if index is not None and count > 1
+                else None
+            )
+            if (
+                candidate is not None
+                and candidate != index
+                and am.reconnect_webradio(candidate, self.reconnect_timeout)
+            ):
+                mode, how = "webradio", f"station {am.current_station_name}"
+            elif am.play_random_music():
+                mode, how = "sd", "repli SD"
+        if mode is None:
+            logger.error(
+                f"[WATCHDOG] Reprise impossible après "
+                f"{time.monotonic() - stalled_since:.1f}s"
+            )
+        else:
+            logger.warning(
+                f"[WATCHDOG] Rétabli ({how}) en "
+                f"{time.monotonic() - stalled_since:.1f}s depuis le blocage"
+            )
+        return mode
+
+    def _stream_ended(self):
+        """SD en file jouée après le flux : état passé en lecture locale."""
+        am = self.audio_manager
+        if not am.music_playing or am.play_mode != "webradio":
+            return False
+        am.play_mode = "local"
+        am.current_station_name = None
+        am.current_station_index = None
+        return "sd"
+
+    def _on_recover_done(self, mode) -> None:
+        """Boucle principale : fin d'incident, état UI synchronisé."""
+        self.recovering = False
+        self._reset()
+        if mode is not False and self.on_recovered is not None:
+            self.on_recovered(mode)
@@ -8,10 +8,15 @@ class Time:
 
     def get_time(self) -> str:
         """Retourne l'heure au format HH:MM."""
-        hours, minutes = self.rtc.read_time()
+        hours, minutes, _ = self.get_time_seconds()
+        return f"{hours:02d}:{minutes:02d}"
+
+    def get_time_seconds(self) -> tuple[int, int, int]:
+        """Retourne (heures, minutes, secondes) avec DST."""
+        hours, minutes, seconds = self.rtc.read_time_seconds()
         if self.dst_enabled:
             hours = (hours + 1) % 24
-        return f"{hours:02d}:{minutes:02d}"
+        return hours, minutes, seconds
 
     def set_time(self, hours: int, minutes: int) -> None:
         """Règle l'heure."""
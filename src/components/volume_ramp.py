@@ -0,0 +1,99 @@
+import math
+import threading
+import time
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class VolumeRamp:
+    """
+    Rampe de volume continue pour le réveil (thread dédié, hors boucle
+    principale). Courbe "linear" ou "log" (montée rapide au début puis
+    douce, proche de la perception) ; mises à jour regroupées par pas
+    minimal `min_step` (%) et espacées d'au moins `min_interval` secondes :
+    débit de commandes MPD borné.
+    """
+
+    CURVES = ("linear", "log")
+
+    def __init__(
+        self,
+        apply: Callable[[int], None],
+        curve: str = "linear",
+        duration: float = 60.0,
+        min_step: int = 2,
+        min_interval: float = 0.25,
+    ):
+        self.apply = apply  # Envoie un volume MPD (0-100), connexion persistante
+        self.curve = curve if curve in self.CURVES else "linear"
+        self.duration = duration
+        self.min_step = max(1, min_step)
+        self.min_interval = min_interval
+        self._lock = threading.Lock()  # apply() jamais appelé après cancel()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def level_at(self, progress: float, start: int, end: int) -> int:
+        """Volume (0-100) à `progress` (0.0-1.0) de la rampe."""
+        progress = min(max(progress, 0.0), 1.0)
+        if self.curve == "log":
+            progress = math.log10(1 + 9 * progress)  # 0 → 0, 1 → 1
+        return round(start + (end - start) * progress)
+
+    def start(self, start_level: float, end_level: float = 1.0) -> None:
+        """Lance une rampe start_level → end_level (0.0-1.0), remplace la précédente."""
+        self.cancel()
+        start, end = int(start_level * 100), int(end_level * 100)
+        # Événement propre à chaque rampe (un ancien thread s'arrête seul)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(start, end, self._stop_event),
+            name="volume-ramp",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            f"[RAMP] {start}% → {end}% en {self.duration:.0f}s ({self.curve})"
+        )
+
+    def cancel(self) -> None:
+        """Stoppe la rampe ; retour après le dernier volume éventuellement envoyé."""
+        with self._lock:
+            self._stop_event.set()
+        self._thread = None
+
+    def _send(self, level: int, stop_event: threading.Event) -> bool:
+        with self._lock:
+            if stop_event.is_set():
+                return False
+            try:
+                self.apply(level)
+            except Exception as e:
+                logger.warning(f"[RAMP] Volume {level}%: {e}")
+        return True
+
+    def _run(self, start: int, end: int, stop_event: threading.Event) -> None:
+        started = time.monotonic()
+        sent = start
+        if not self._send(start, stop_event):
+            return
+        while sent != end:
+            if stop_event.wait(self.min_interval):
+                return
+            elapsed = time.monotonic() - started
+            progress = elapsed / self.duration if self.duration > 0 else 1.0
+            level = self.level_at(progress, start, end)
+            # Regroupe les petits écarts (sauf le palier final)
+            if level != end and abs(level - sent) < self.min_step:
+                continue
+            if not self._send(level, stop_event):
+                return
+            sent = level
+        logger.info(f"[RAMP] Terminée à {end}%")
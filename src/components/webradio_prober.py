@@ -0,0 +1,244 @@
+import http.client
+import threading
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class StreamError(Exception):
+    """Échec d'ouverture d'un flux (connect_time : temps de connexion cumulé)."""
+
+    def __init__(self, message: str, connect_time: float = 0.0):
+        super().__init__(message)
+        self.connect_time = connect_time
+
+
+def open_stream(
+    url: str, timeout: float, max_redirects: int = 3
+) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse, float]:
+    """
+    GET sur un flux HTTP/HTTPS en suivant les redirections.
+
+    Returns:
+        (connexion, réponse 200 prête à lire, temps de connexion en s)
+    Raises:
+        StreamError: réseau, statut HTTP, trop de redirections
+    """
+    connect_time = 0.0
+    for _ in range(max_redirects + 1):
+        parts = urlsplit(url)
+        conn_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        conn = conn_class(parts.hostname, parts.port, timeout=timeout)
+        try:
+            t0 = time.monotonic()
+            conn.connect()
+            connect_time += time.monotonic() - t0
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            conn.request("GET", path, headers={"User-Agent": "Reveil-Pi"})
+            response = conn.getresponse()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise StreamError(str(e) or type(e).__name__, connect_time)
+        if response.status in (301, 302, 303, 307, 308):
+            location = response.getheader("Location")
+            conn.close()
+            if not location:
+                raise StreamError("redirection sans Location", connect_time)
+            url = urljoin(url, location)
+            continue
+        if response.status != 200:
+            conn.close()
+            raise StreamError(f"HTTP {response.status}", connect_time)
+        return conn, response, connect_time
+    raise StreamError("trop de redirections", connect_time)
+
+
+class WebradioProber:
+    """
+    Sonde périodiquement chaque station webradio (thread de fond) :
+    temps de connexion + temps jusqu'aux premiers octets audio, pour
+    chaque URL miroir ("url" + "urls" optionnelles de webradios.json).
+
+    Table de santé par index de station :
+      {"alive": bool, "url": meilleure URL, "connect": s, "first_bytes": s,
+       "checked_at": time.time(), "error": str | None}
+    """
+
+    FIRST_BYTES = 4096  # Octets attendus pour valider le flux
+    MAX_REDIRECTS = 3
+
+    def __init__(self, interval: float = 600.0, timeout: float = 3.0):
+        self.interval = interval
+        self.timeout = timeout
+        self.stations: List[dict] = []
+        self.health: Dict[int, dict] = {}  # Remplacé en bloc (lecture sans verrou)
+        self._wake = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._loop, name="webradio-probe", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.timeout + 1.0)
+
+    def set_stations(self, stations: List[dict]) -> None:
+        """Nouvelle liste de stations : table vidée, sonde immédiate."""
+        self.stations = stations
+        self.health = {}
+        self._wake.set()
+
+    def probe_now(self) -> None:
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Lecture de la table (boucle principale / worker)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def station_urls(station: dict) -> List[str]:
+        """URL principale puis miroirs, sans doublon."""
+        urls = [station["url"]] if station.get("url") else []
+        for url in station.get("urls", []):
+            if url not in urls:
+                urls.append(url)
+        return urls
+
+    def is_alive(self, index: int) -> Optional[bool]:
+        """True/False selon la dernière sonde, None si jamais sondée."""
+        entry = self.health.get(index)
+        return None if entry is None else entry["alive"]
+
+    def best_url(self, index: int) -> str:
+        """URL la plus rapide sondée vivante, sinon l'URL principale."""
+        entry = self.health.get(index)
+        if entry is not None and entry["alive"]:
+            return entry["url"]
+        return self.station_urls(self.stations[index])[0]
+
+    def next_alive(self, index: int, step: int = 1) -> Optional[int]:
+        """
+        Première station non morte à partir de `index` (inclus) dans le
+        sens `step`. Les stations jamais sondées sont tentées. None si
+        toutes sont connues mortes.
+        """
+        count = len(self.stations)
+        for offset in range(count):
+            candidate = (index + offset * step) % count
+            if self.is_alive(candidate) is not False:
+                return candidate
+        return None
+
+    # ------------------------------------------------------------------
+    # Sonde
+    # ------------------------------------------------------------------
+    def probe_url(self, url: str) -> dict:
+        """
+        Ouvre le flux et lit FIRST_BYTES octets.
+        Retourne {"ok", "connect", "first_bytes", "error"} (temps en s).
+        """
+        start = time.monotonic()
+        try:
+            conn, response, connect_time = open_stream(
+                url, self.timeout, self.MAX_REDIRECTS
+            )
+        except StreamError as e:
+            return self._failure(e.connect_time, str(e))
+        try:
+            received = 0
+            while received < self.FIRST_BYTES:
+                chunk = response.read1(self.FIRST_BYTES - received)
+                if not chunk:
+                    break
+                received += len(chunk)
+            if received == 0:
+                return self._failure(connect_time, "flux vide")
+            return {
+                "ok": True,
+                "connect": connect_time,
+                "first_bytes": time.monotonic() - start,
+                "error": None,
+            }
+        except (OSError, http.client.HTTPException) as e:
+            return self._failure(connect_time, str(e) or type(e).__name__)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _failure(connect_time: float, error: str) -> dict:
+        return {
+            "ok": False,
+            "connect": connect_time,
+            "first_bytes": None,
+            "error": error,
+        }
+
+    def probe_station(self, index: int) -> dict:
+        """Sonde toutes les URL d'une station ; retient la plus rapide."""
+        station = self.stations[index]
+        best: Optional[dict] = None
+        best_url = self.station_urls(station)[0]
+        last_error = None
+        for url in self.station_urls(station):
+            result = self.probe_url(url)
+            if not result["ok"]:
+                last_error = result["error"]
+                continue
+            if best is None or result["first_bytes"] < best["first_bytes"]:
+                best, best_url = result, url
+        entry = {
+            "alive": best is not None,
+            "url": best_url,
+            "connect": best["connect"] if best else None,
+            "first_bytes": best["first_bytes"] if best else None,
+            "checked_at": time.time(),
+            "error": None if best else last_error,
+        }
+        health = dict(self.health)
+        health[index] = entry
+        self.health = health
+        return entry
+
+    def probe_all(self) -> None:
+        for index, station in enumerate(list(self.stations)):
+            if not self._running and self._thread is not None:
+                return
+            previous = self.is_alive(index)
+            entry = self.probe_station(index)
+            if entry["alive"]:
+                logger.info(
+                    f"[WEBRADIO] {station['name']}: OK connexion "
+                    f"{entry['connect'] * 1000:.0f}ms, premiers octets "
+                    f"{entry['first_bytes'] * 1000:.0f}ms"
+                )
+            elif previous is not False:
+                logger.warning(f"[WEBRADIO] {station['name']}: HS ({entry['error']})")
+
+    def _loop(self) -> None:
+        while self._running:
+            self._wake.clear()
+            try:
+                self.probe_all()
+            except Exception as e:
+                logger.error(f"[WEBRADIO] Erreur sonde: {e}", exc_info=True)
+            self._wake.wait(self.interval)
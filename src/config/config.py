@@ -22,7 +22,13 @@ CONFIG = {
             "music_infos": 12,  # Nouvelle : Taille réduite pour infos musique (multiline)
         },
         "i2c_delay": 0.05,  # Delay post-I2C write en secondes (ajuste pour stabilité)
+        "device": "sh1106",  # Écran : "sh1106" (I2C), "memory" ou "png" (sans écran, tests/banc)
+        "png_dir": "/tmp/reveil-display",  # Trames PNG si device = "png"
+        "renderer": "pil",  # Rendu des trames : "pil" ou "numpy" (trame persistante, NumPy requis)
+        "glyph_cache_dir": "/home/reveil/glyph_cache",  # Atlas de glyphes pré-rastérisés (JSON par taille)
         "blink_interval": 0.5,  # Intervalle de clignotement pour les réglages (en secondes)
+        "frame_interval": 0.02,  # Espacement minimal entre deux trames dessinées (secondes)
+        "interactive_interval": 0.05,  # Scrutation boucle bouton maintenu / commande audio (secondes)
         "temp_info_timeout": 15.0,  # Timeout affichage infos musique (secondes)
     },
     # Catégorie : Buzzer
@@ -45,10 +51,27 @@ CONFIG = {
     # Catégorie : Audio
     "audio": {
         "music_dir": "/home/reveil/Musique",  # Dossier contenant les fichiers musicaux
+        "mpd_socket": "/run/mpd/socket",  # Socket MPD (connexion persistante, ou "host:port")
+        "library_db": "/home/reveil/music_library.db",  # Index bibliothèque (SQLite)
+        "stall_seconds": 8,  # Flux webradio sans progression → reprise (secondes)
+        "stall_reconnect_timeout": 5,  # Délai max par tentative de reprise (secondes)
+        "queue_window": 20,  # Morceaux à venir gardés dans la file MPD (aléatoire/dossiers)
+        "probe_interval": 600,  # Sonde santé des webradios (secondes entre deux passes)
+        "probe_timeout": 3.0,  # Timeout connexion/premiers octets d'une sonde (secondes)
     },
-    # Catégorie : Paramètres généraux
-    "general": {
-        "main_loop_delay": 0.05,  # Délai de la boucle principale du programme (en secondes)
+    # Catégorie : Alarmes
+    "alarm": {
+        "prearm_seconds": 60,  # Pré-armement audio avant l'alarme (file + buffer en pause)
+        "latency_file": "/home/reveil/alarm_latency.json",  # Historique latences trigger → son
+        "max_lead_seconds": 30,  # Avance max au déclenchement (latence estimée bornée)
+        "hedge_deadline": 3.0,  # Délai max son webradio avant bascule SD pré-chargée (secondes)
+        "audible_deadline": 15.0,  # Son confirmé requis après déclenchement, sinon buzzer (secondes)
+        "preroll_seconds": 300,  # Enregistrement du flux avant une alarme webradio (0 = désactivé)
+        "preroll_buffer_seconds": 30,  # Taille du tampon circulaire (dernières secondes gardées)
+        "preroll_dir": "/dev/shm",  # Dossier tmpfs du fichier pré-roll joué par MPD
+        "ramp_start_volume": 0.6,  # Volume au démarrage de l'alarme (0.0-1.0)
+        "ramp_duration": 60,  # Durée de la montée jusqu'à 100% (secondes)
+        "ramp_curve": "linear",  # Courbe de montée : "linear" ou "log"
     },
     # Catégorie : Veille et timeouts (defaults, overridés par JSON si présent)
     "settings": {
@@ -1,4 +1,3 @@
-import subprocess
 import time
 from typing import Union, Dict, Any
 from src.components.time import Time
@@ -39,11 +38,12 @@ class Coordinator:
         self.config = config
         self.audio_manager = audio_manager
         self.last_temp_timeout_check = 0  # Dernier check timeout infos musique
-        self.loop_delay = config["general"][
-            "main_loop_delay"
-        ]  # Délai principal de la boucle
+        # Cadence unique : la boucle dort jusqu'à une entrée, un changement
+        # MPD, une échéance de trame ou le tic d'entretien (1s)
+        self.scheduler = display.scheduler
+        self.rotary.on_event = self.scheduler.wake
+        self.audio_manager.state.add_listener(lambda _changed: self.scheduler.wake())
         self.last_mpd_warning = 0  # Dernier warning MPD
-        self.last_flag_sync = 0
         self.mpd_fallback_active = False  # Flag fallback buzzer unique
         # Optimisation cache
         self.cached_time = "00:00"
@@ -115,21 +115,29 @@ class Coordinator:
         """Boucle principale pour la gestion des événements et des mises à jour."""
         try:
             last_temp_info = None
-            last_info_check = 0
+            last_display_key = None
+            last_mpd_version = -1
             last_saver_check = 0
-            last_render_time = 0
-            render_throttle = 0.2  # Max 5 FPS pour l'écran
-            render_needed = False
+            scheduler = self.scheduler
 
             while True:
                 current_time = time.time()
 
                 # ====== CHECK TEMPS + ALARMES (toujours actif) ======
                 if current_time - self.last_time_read >= 1.0:
-                    self.cached_time = self.time_manager.get_time()
+                    hours, minutes, seconds = self.time_manager.get_time_seconds()
+                    time_str = f"{hours:02d}:{minutes:02d}"
+                    if time_str != self.cached_time:
+                        scheduler.request()  # Horloge : une trame par minute
+                    self.cached_time = time_str
                     self.last_time_read = current_time
-                    # Check alarmes sur nouvelle minute
-                    self.alarm_manager.check_alarms(self.cached_time)
+                    # Check alarmes (secondes : déclenchement anticipé)
+                    self.alarm_manager.check_alarms(self.cached_time, seconds)
+
+                # ====== RÉSULTATS AUDIO (worker, toujours actif) ======
+                # Callbacks des commandes audio terminées, exécutés ici
+                if self.audio_manager.worker.poll():
+                    scheduler.request()
 
                 # ====== CHECK DURÉE MAX ALARME (toujours actif) ======
                 if (
@@ -157,14 +165,17 @@ class Coordinator:
                 ):
                     logger.debug("[COORDINATOR] Alarme active → Allumage écran forcé")
                     self.display.power_on()
-                    render_needed = True
+                    scheduler.request()
 
-                # ====== SYNC FLAG MPD (toujours actif) ======
-                if current_time - self.last_flag_sync >= 5.0:
+                # ====== SYNC FLAG MPD (publié par le superviseur) ======
+                if (
+                    self.menu_manager.mpd_unavailable
+                    != self.audio_manager.mpd_unavailable
+                ):
                     self.menu_manager.mpd_unavailable = (
                         self.audio_manager.mpd_unavailable
                     )
-                    self.last_flag_sync = current_time
+                    scheduler.request()
 
                 # ====== INPUT UTILISATEUR (toujours actif) ======
                 events = self.rotary.get_events()
@@ -174,15 +185,27 @@ class Coordinator:
                 )
 
                 if events:
-                    render_needed = True
+                    scheduler.request()
 
                 # ====== MUSIQUE (toujours actif) ======
-                if (
-                    self.audio_manager.music_playing
-                    and current_time - last_info_check >= 1.0
+                # Changement MPD (miroir idle) → maj immédiate ; sinon
+                # maj quand la seconde ou le pas de barre affiché change
+                # (horloge locale, aucune requête MPD)
+                mpd_version = self.audio_manager.state.version
+                display_key = self.audio_manager.state.clock.display_key()
+                # Lecteur affiché : la progression seule justifie un rendu
+                player_visible = (
+                    self.menu_manager.current_menu is None
+                    and self.menu_manager.temp_info is not None
+                    and self.display.is_on
+                )
+                if self.audio_manager.music_playing and (
+                    mpd_version != last_mpd_version
+                    or display_key != last_display_key
                 ):
+                    last_mpd_version = mpd_version
+                    last_display_key = display_key
                     new_temp_info = self._update_music_info()
-                    last_info_check = current_time
                     needs_update = False
 
                     if new_temp_info is not None:
@@ -215,7 +238,7 @@ class Coordinator:
                             else:
                                 last_temp_info = new_temp_info
                             del new_temp_info
-                            render_needed = True
+                            scheduler.request()
                             self.alarm_manager.player_shown = True
                         else:
                             # Maj silencieuse progression
@@ -229,6 +252,8 @@ class Coordinator:
                                         self.menu_manager.temp_info[k] = new_temp_info[
                                             k
                                         ]
+                                if player_visible:
+                                    scheduler.request()
                             del new_temp_info
                     else:
                         # Hors alarme
@@ -244,7 +269,7 @@ class Coordinator:
                             else:
                                 last_temp_info = new_temp_info
                             del new_temp_info
-                            render_needed = True
+                            scheduler.request()
                         else:
                             # Maj silencieuse
                             if (
@@ -257,8 +282,16 @@ class Coordinator:
                                         self.menu_manager.temp_info[k] = new_temp_info[
                                             k
                                         ]
+                                if player_visible:
+                                    scheduler.request()
                             del new_temp_info
 
+                # Prochaine seconde / pas de barre du lecteur : échéance de trame
+                if player_visible and self.audio_manager.music_playing:
+                    delay = self.audio_manager.state.clock.next_change()
+                    if delay is not None:
+                        scheduler.schedule(delay)
+
                 # ====== TIMEOUT INFOS MUSIQUE (toujours actif) ======
                 temp_timeout = self.menu_manager.settings.get("temp_info_timeout", 15)
                 if current_time - self.last_temp_timeout_check >= 1.0:
@@ -272,7 +305,7 @@ class Coordinator:
                     ):
                         self.menu_manager.temp_info = None
                         self.menu_manager.temp_display_start = None
-                        render_needed = True
+                        scheduler.request()
 
                 # ====== VEILLE ÉCRAN (toujours actif) ======
                 if (
@@ -282,18 +315,18 @@ class Coordinator:
                     last_saver_check = current_time
                     saver_changed = self._handle_screen_saver(current_time)
                     if saver_changed:
-                        render_needed = True
+                        scheduler.request()
 
-                # ====== RENDER (toujours actif) ======
-                if (render_needed or self.menu_manager.current_menu is not None) and (
-                    current_time - last_render_time >= render_throttle
-                ):
+                # ====== TRAME (demandée ou échue ; aucune écran éteint) ======
+                if scheduler.frame_due(self.display.is_on):
                     self.menu_manager._render()
-                    render_needed = False
-                    last_render_time = current_time
 
-                # ====== PAUSE BOUCLE (toujours actif) ======
-                time.sleep(self.loop_delay)
+                # ====== ATTENTE (entrée, MPD, échéance ou tic 1s) ======
+                timeout = self.last_time_read + 1.0 - time.time()
+                if self.rotary.switch_pressed or self.audio_manager.worker.busy:
+                    # Appui long à détecter, résultat audio attendu
+                    timeout = min(timeout, scheduler.interactive_interval)
+                scheduler.wait(timeout)
 
         except Exception as e:
             logger.error(f"[ERROR {time.time():.3f}] Erreur coordinateur : {e}")
@@ -303,12 +336,12 @@ class Coordinator:
     def _update_music_info(self) -> Union[Dict[str, Any], str, None]:
         """
         Met à jour les informations musicales avec structure détaillée.
+        Lecture du miroir d'état MPD (pas d'I/O).
         Returns:
             dict avec infos détaillées, ou None si erreur
         """
-        # Wrap subprocess pour timeout (exemple si get_detailed utilise check_output)
         try:
             return self.audio_manager.get_detailed_track_info()
-        except subprocess.TimeoutExpired:
-            print("[ERROR] MPD timeout in music info")
+        except Exception as e:
+            logger.error(f"[ERROR] Infos musique: {e}")
             return None
@@ -0,0 +1,159 @@
+"""
+Banc de mesure du rendu écran, sans OLED (écran simulé en mémoire).
+
+Rejoue des écrans typiques (heure, menus, navigateur SD de 500 entrées,
+lecteur, date) et affiche pour chacun : trames/s, temps CPU par trame et
+octets qui seraient passés sur l'I2C (données + commandes).
+
+Usage : python3 tests_materiel/bench_display.py [--renderer pil|numpy]
+        [--frames 200] [--font police.ttf] [--png DOSSIER]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.config.config import CONFIG  # noqa: E402
+from src.components.display import Display  # noqa: E402
+
+MAIN_MENU = ["Réglage alarme", "Lire musique", "Réglages", "Synchro heure", "Retour"]
+SD_ENTRIES = [f"📁 Dossier {i:03d}" for i in range(100)] + [
+    f"🎵 Piste {i:03d} - Titre assez long.mp3" for i in range(400)
+]
+
+
+def clock(i):
+    minute = i % 1440
+    return (
+        "show_time",
+        (
+            f"{minute // 60:02d}:{minute % 60:02d}",
+            (True, i % 50 < 25),
+            ("T", "WE"),
+        ),
+        {"playing": True, "music_source": "sd"},
+    )
+
+
+def main_menu(i):
+    return "show_menu", (MAIN_MENU, i % len(MAIN_MENU)), {}
+
+
+def sd_browser(i):
+    return "show_menu", (SD_ENTRIES, i % len(SD_ENTRIES)), {}
+
+
+def settings(i):
+    return (
+        "show_settings",
+        ("07:30",),
+        {
+            "blink_field": "hours",
+            "blink_state": i % 2 == 0,
+            "label": "Alarme 1",
+        },
+    )
+
+
+def music_player(i):
+    elapsed = i % 300
+    return (
+        "show_music_player",
+        (
+            "Artiste",
+            "Titre du morceau en cours",
+            f"{elapsed // 60:02d}:{elapsed % 60:02d}",
+            "05:00",
+            elapsed / 300,
+            True,
+        ),
+        {},
+    )
+
+
+def date_view(i):
+    return (
+        "show_date_view",
+        (
+            "Samedi",
+            f"{i % 28 + 1:02d}/10/2026",
+            ["Régler", "Retour"],
+            i % 2,
+        ),
+        {},
+    )
+
+
+SCENARIOS = [
+    ("heure", clock),
+    ("menu principal", main_menu),
+    ("navigateur SD (500)", sd_browser),
+    ("réglage clignotant", settings),
+    ("lecteur", music_player),
+    ("date", date_view),
+]
+
+
+def run(display, frames):
+    device = display.device
+    print(
+        f"{'écran':<22}{'trames/s':>10}{'CPU ms/trame':>14}"
+        f"{'octets/trame':>14}{'dont cmd':>10}"
+    )
+    for name, scenario in SCENARIOS:
+        data_before, cmd_before = device.data_bytes, device.command_bytes
+        wall, cpu = time.perf_counter(), time.process_time()
+        for i in range(frames):
+            method, args, kwargs = scenario(i)
+            getattr(display, method)(*args, **kwargs)
+            display.flush()  # Une trame dessinée par état publié
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        data = device.data_bytes - data_before
+        cmd = device.command_bytes - cmd_before
+        print(
+            f"{name:<22}{frames / wall:>10.0f}{cpu / frames * 1000:>14.2f}"
+            f"{(data + cmd) / frames:>14.0f}{cmd / frames:>10.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--renderer", choices=["pil", "numpy"], default="pil")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--font", default=CONFIG["display"]["font_path"])
+    parser.add_argument("--png", help="Dossier : une image PNG par trame")
+    args = parser.parse_args()
+
+    config = CONFIG["display"].copy()
+    config.update(
+        display_address=CONFIG["i2c"]["display_address"],
+        device="png" if args.png else "memory",
+        png_dir=args.png,
+        renderer=args.renderer,
+        font_path=args.font,
+        i2c_delay=0,  # Pas de bus : délai post-écriture inutile
+        glyph_cache_dir=tempfile.mkdtemp(prefix="reveil-glyphs-"),
+    )
+    started = time.perf_counter()
+    display = Display(None, config)
+    display.atlases  # Construction des atlas de glyphes comptée dans l'init
+    display.manager = SimpleNamespace(settings={"playback_mode": "aleatoire"})
+    display.scheduler.min_interval = 0  # Débit brut (sans espacement entre trames)
+    print(
+        f"Rendu {display.renderer}, écran {config['device']}, "
+        f"{args.frames} trames par écran "
+        f"(init {time.perf_counter() - started:.2f}s)"
+    )
+    try:
+        run(display, args.frames)
+    finally:
+        display.stop()
+
+
+if __name__ == "__main__":
+    main()
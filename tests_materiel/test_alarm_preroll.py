@@ -0,0 +1,166 @@
+"""
+Test manuel du pré-roll webradio d'une alarme contre un faux flux HTTP local.
+
+Usage : python3 tests_materiel/test_alarm_preroll.py
+Le flux est enregistré avant l'alarme ; au déclenchement, le tampon est
+copié dans la file puis l'enregistrement doit s'arrêter (pas de seconde
+connexion au flux pendant toute l'alarme).
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.components.alarms import Alarms  # noqa: E402
+from src.components.stream_preroll import StreamPreroll  # noqa: E402
+
+
+class FakeStreamHandler(BaseHTTPRequestHandler):
+    """/stream : octets aléatoires en continu (flux MP3 sans fin)."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.end_headers()
+        try:
+            while True:
+                self.wfile.write(os.urandom(1024))
+                time.sleep(0.01)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Enregistrement arrêté
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeRTC:
+    def read_alarm(self, alarm_num):
+        return 0, 0, False
+
+    def set_alarm(self, alarm_num, hour, minute, enabled):
+        pass
+
+    def read_dow(self):
+        return 2
+
+
+class FakeProber:
+    def next_alive(self, index):
+        return index
+
+
+class FakeRamp:
+    def start(self, start_volume, end_volume):
+        pass
+
+    def cancel(self):
+        pass
+
+
+class FakeAudioManager:
+    """
+    Audio sans MPD : commandes worker exécutées sur place, démarrage
+    webradio réduit au snapshot du pré-roll (comme la file hedgée).
+    """
+
+    def __init__(self, url: str, preroll_dir: str):
+        self.url = url
+        self.preroll = StreamPreroll(preroll_dir, buffer_seconds=10.0)
+        self.prober = FakeProber()
+        self.ramp = FakeRamp()
+        self.prearmed_mode = None
+        self.music_playing = False
+        self.current_station_name = "Test"
+        self.snapshot_path = None
+
+    def submit(self, fn, *args, on_done=None):
+        result = fn(*args)
+        if on_done is not None:
+            on_done(result)
+
+    def station_url(self, index):
+        return self.url
+
+    def start_preroll(self, index):
+        self.preroll.start(self.station_url(index))
+
+    def stop_preroll(self):
+        self.preroll.stop()
+
+    def resolve_alarm_station(self, index):
+        return index
+
+    def ensure_mpd_available(self, timeout):
+        return True
+
+    def set_volume(self, volume):
+        pass
+
+    def start_webradio_hedged(self, index):
+        self.snapshot_path = self.preroll.snapshot(self.station_url(index))
+        return True
+
+    def wait_audible(self, timeout):
+        return time.monotonic()
+
+    def stop(self):
+        pass
+
+
+def test_alarm_preroll():
+    errors = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    work_dir = tempfile.mkdtemp()
+    am = FakeAudioManager(
+        f"http://127.0.0.1:{server.server_address[1]}/stream", work_dir
+    )
+    alarms = Alarms(
+        FakeRTC(),
+        None,
+        am,
+        {
+            "prearm_seconds": 0,
+            "hedge_deadline": 4.0,
+            "audible_deadline": 10.0,
+            "preroll_seconds": 300,
+            "ramp_start_volume": 0.6,
+            "latency_file": os.path.join(work_dir, "latency.json"),
+            "max_lead_seconds": 30.0,
+        },
+    )
+    alarms.set_alarm(1, 7, 0, True)
+    alarms.alarm_states[1]["mode"] = "webradio"
+    alarms.alarm_states[1]["station_index"] = 0
+
+    print("DÉBUT: Pré-roll avant l'alarme")
+    alarms.check_alarms("06:58", 0)
+    time.sleep(2.0)
+    if not am.preroll.recording:
+        errors.append("enregistrement non lancé avant l'alarme")
+
+    print("DÉBUT: Déclenchement")
+    alarms.check_alarms("07:00", 0)
+    if not alarms.is_alarm_active:
+        errors.append("alarme non déclenchée")
+    if am.snapshot_path is None:
+        errors.append("aucun snapshot pré-roll au démarrage")
+    if am.preroll.recording:
+        errors.append("enregistrement toujours actif après le déclenchement")
+    if alarms.preroll_alarm is not None or alarms.preroll_key is not None:
+        errors.append("pré-roll encore associé à l'alarme déclenchée")
+
+    server.shutdown()
+    if errors:
+        for error in errors:
+            print(f"ERREUR: {error}")
+        sys.exit(1)
+    print("FIN: Pré-roll alarme OK")
+
+
+if __name__ == "__main__":
+    test_alarm_preroll()
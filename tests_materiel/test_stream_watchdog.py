@@ -0,0 +1,141 @@
+"""
+Test manuel du watchdog webradio contre un faux serveur MPD local.
+
+Usage : python3 tests_materiel/test_stream_watchdog.py
+Le faux MPD n'émet jamais d'événement idle (flux figé silencieux) : le
+blocage doit être repris dans le délai configuré, via le recalage du
+miroir d'état et non un status MPD à chaque contrôle.
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.components.mpd_client import MPDClient  # noqa: E402
+from src.components.mpd_state import MPDStateMirror  # noqa: E402
+from src.components.stream_watchdog import StreamWatchdog  # noqa: E402
+
+STALL_SECONDS = 8.0
+CHECK_INTERVAL = 0.5
+
+
+class FakeMPD:
+    """
+    Serveur MPD minimal (socket Unix) : flux en lecture dont elapsed suit
+    l'horloge jusqu'à `freeze()`, puis reste figé ; idle sans événement.
+    """
+
+    def __init__(self, path: str):
+        self.start = time.monotonic()
+        self.frozen_at = None  # Elapsed figé (None : flux qui avance)
+        self.status_calls = 0  # status reçus hors connexion du miroir
+        self.server = socket.socket(socket.AF_UNIX)
+        self.server.bind(path)
+        self.server.listen(5)
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def freeze(self) -> None:
+        self.frozen_at = time.monotonic() - self.start
+
+    def _elapsed(self) -> float:
+        if self.frozen_at is not None:
+            return self.frozen_at
+        return time.monotonic() - self.start
+
+    def _accept(self) -> None:
+        while True:
+            conn, _ = self.server.accept()
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        conn.sendall(b"OK MPD 0.23.5\n")
+        idle_seen = False  # Connexion du miroir (abonnée à idle)
+        for raw in conn.makefile("rb"):
+            line = raw.decode().strip()
+            if line.startswith("idle"):
+                idle_seen = True
+                continue  # Aucun événement : le flux figé reste muet
+            if line == "status":
+                if not idle_seen:
+                    self.status_calls += 1
+                reply = (
+                    f"state: play\nsongid: 1\nelapsed: {self._elapsed():.3f}\n"
+                    "bitrate: 128\nOK\n"
+                )
+            elif line == "currentsong":
+                reply = "file: http://radio.example/stream\nId: 1\nOK\n"
+            else:
+                reply = "OK\n"  # noidle, ping...
+            conn.sendall(reply.encode())
+
+
+class FakeAudioManager:
+    """Attributs lus par le watchdog ; la reprise est seulement enregistrée."""
+
+    def __init__(self, socket_path: str):
+        self.state = MPDStateMirror(socket_path)
+        self.mpd = MPDClient(socket_path, timeout=2.0)
+        self.loading = False
+        self.music_playing = True
+        self.play_mode = "webradio"
+        self.current_station_index = 0
+        self.current_station_name = "Test"
+        self.recovered_at = None
+
+    def submit(self, fn, *args, on_done=None):
+        self.recovered_at = time.monotonic()
+
+
+def test_watchdog():
+    errors = []
+    socket_path = os.path.join(tempfile.mkdtemp(), "mpd.socket")
+    mpd = FakeMPD(socket_path)
+    am = FakeAudioManager(socket_path)
+    am.state.start()
+    while not am.state.connected:
+        time.sleep(0.05)
+    mpd.status_calls = 0  # Status initial du miroir (avant son premier idle)
+    watchdog = StreamWatchdog(
+        am, stall_seconds=STALL_SECONDS, check_interval=CHECK_INTERVAL
+    )
+    watchdog.start()
+
+    print("DÉBUT: Flux qui avance")
+    time.sleep(STALL_SECONDS)
+    if am.recovered_at is not None:
+        errors.append("reprise lancée sur un flux qui avance")
+    if mpd.status_calls:
+        errors.append(f"{mpd.status_calls} status MPD sur un flux qui avance")
+
+    print("DÉBUT: Flux figé (aucun événement idle)")
+    mpd.freeze()
+    frozen = time.monotonic()
+    deadline = frozen + STALL_SECONDS + 3 * CHECK_INTERVAL + 1.0
+    while am.recovered_at is None and time.monotonic() < deadline:
+        time.sleep(0.1)
+    watchdog.stop()
+    am.state.stop()
+
+    if am.recovered_at is None:
+        errors.append("blocage non détecté")
+    else:
+        delay = am.recovered_at - frozen
+        print(f"  Reprise lancée {delay:.1f}s après le blocage")
+        if delay > STALL_SECONDS + 2 * CHECK_INTERVAL + 1.0:
+            errors.append(f"reprise trop tardive ({delay:.1f}s)")
+        if delay < STALL_SECONDS - 1.0:
+            errors.append(f"reprise prématurée ({delay:.1f}s)")
+
+    if errors:
+        for error in errors:
+            print(f"ERREUR: {error}")
+        sys.exit(1)
+    print("FIN: Watchdog webradio OK")
+
+
+if __name__ == "__main__":
+    test_watchdog()
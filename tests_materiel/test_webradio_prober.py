@@ -0,0 +1,125 @@
+"""
+Test manuel de la sonde webradio contre un faux serveur HTTP local.
+
+Usage : python3 tests_materiel/test_webradio_prober.py [fichier.mp3]
+Sans fichier, des octets aléatoires simulent le flux audio.
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.components.webradio_prober import WebradioProber  # noqa: E402
+
+STREAM_DATA = b""
+
+
+class FakeStreamHandler(BaseHTTPRequestHandler):
+    """
+    /stream : diffuse le fichier par blocs (comme un serveur Icecast)
+    /slow   : même flux après 0,5 s d'attente (miroir lent)
+    /redirect : 302 vers /stream
+    /empty  : 200 sans contenu
+    """
+
+    def do_GET(self):
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/stream")
+            self.end_headers()
+            return
+        if self.path not in ("/stream", "/slow", "/empty"):
+            self.send_error(404)
+            return
+        if self.path == "/slow":
+            time.sleep(0.5)
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.end_headers()
+        if self.path == "/empty":
+            return
+        try:
+            for offset in range(0, len(STREAM_DATA), 1024):
+                self.wfile.write(STREAM_DATA[offset : offset + 1024])
+                time.sleep(0.01)  # Débit limité
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # La sonde ferme après les premiers octets
+
+    def log_message(self, format, *args):
+        pass
+
+
+def free_port() -> int:
+    """Port local libre (aucun serveur derrière → station HS)."""
+    import socket
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_prober():
+    global STREAM_DATA
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            STREAM_DATA = f.read()
+    else:
+        STREAM_DATA = os.urandom(64 * 1024)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    dead = f"http://127.0.0.1:{free_port()}/stream"
+
+    stations = [
+        {"name": "Directe", "url": f"{base}/stream"},
+        {"name": "Miroirs", "url": f"{base}/slow", "urls": [f"{base}/redirect"]},
+        {"name": "Morte", "url": dead},
+        {"name": "Vide", "url": f"{base}/empty"},
+        {"name": "404", "url": f"{base}/absent"},
+    ]
+
+    print("DÉBUT: Sonde des stations")
+    prober = WebradioProber(interval=600.0, timeout=2.0)
+    prober.set_stations(stations)
+    for index, station in enumerate(stations):
+        entry = prober.probe_station(index)
+        if entry["alive"]:
+            print(
+                f"  {station['name']:8} OK  connexion {entry['connect'] * 1000:.0f}ms, "
+                f"premiers octets {entry['first_bytes'] * 1000:.0f}ms → {entry['url']}"
+            )
+        else:
+            print(f"  {station['name']:8} HS  ({entry['error']})")
+
+    errors = []
+    if prober.is_alive(0) is not True:
+        errors.append("station directe devrait être vivante")
+    if prober.best_url(1) != f"{base}/redirect":
+        errors.append("miroir le plus rapide non retenu")
+    if any(prober.is_alive(i) is not False for i in (2, 3, 4)):
+        errors.append("stations morte/vide/404 devraient être HS")
+    if prober.next_alive(2) != 0:
+        errors.append("next_alive devrait sauter les stations HS")
+
+    print("DÉBUT: Thread de fond (probe_now)")
+    prober.set_stations(stations[2:3])
+    prober.start()
+    time.sleep(0.5)
+    prober.stop()
+    if prober.next_alive(0) is not None:
+        errors.append("station unique HS → next_alive devrait être None")
+
+    server.shutdown()
+    if errors:
+        for error in errors:
+            print(f"ERREUR: {error}")
+        sys.exit(1)
+    print("FIN: Sonde webradio OK")
+
+
+if __name__ == "__main__":
+    test_prober()